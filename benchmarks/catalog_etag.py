@@ -0,0 +1,148 @@
+"""
+Requests per second for a conditional catalog GET answered 304 versus a full 200,
+and the per-hit cost of encoding a cached catalog as a response body.
+
+Mounts the LAF and backtest routers on a bare app with the cached lookups patched to
+return the same synthetic catalog objects on every call (the warm-cache case), then
+drives each route in-process over httpx's ASGI transport: once without a validator
+(full 200 with body) and once with the ETag from the first response (bare 304).
+
+The encode comparison times what a cache hit costs the handler: rebuilding the
+response model and letting FastAPI validate and JSON-encode it against
+``response_model``, versus looking up the pre-encoded body.
+
+Run with ``uv run python -m benchmarks.catalog_etag``.
+"""
+
+import asyncio
+import time
+from contextlib import ExitStack
+from unittest.mock import AsyncMock, patch
+
+import httpx
+from bson import ObjectId
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from server.helpers.http_cache import CATALOG_CACHE_CONTROL, payload_versions
+from server.routes.backtest import router as backtest_router
+from server.routes.laf import router as laf_router
+
+REQUESTS = 1000
+ROUNDS = 5
+COURSE_ID = str(ObjectId())
+
+LAF_TYPES = ["Attire", "Bottles", "Electronics", "ID Cards", "Keys", "Other"]
+LAF_LOCATIONS = [f"Building {index}" for index in range(60)]
+COURSE_CODES = [f"{chr(65 + a)}{chr(65 + b)}SC" for a in range(26) for b in range(8)]
+COURSES = [
+    {"id": str(ObjectId()), "name": f"CSCI {1000 + index} Course {index}"}
+    for index in range(80)
+]
+BACKTESTS = [
+    {"type": kind, "tests": [f"{kind} {year} {term}" for year in range(2005, 2025)]}
+    for kind in ("Exam 1", "Exam 2", "Final", "Quiz")
+    for term in ("Spring", "Fall")
+]
+
+ROUTES = [
+    ("/laf/types/", "server.routes.laf.retrieve_laf_types", LAF_TYPES),
+    ("/laf/locations/", "server.routes.laf.retrieve_laf_locations", LAF_LOCATIONS),
+    ("/coursecodes/", "server.routes.backtest.retrieve_coursecodes", COURSE_CODES),
+    ("/courses/CSCI", "server.routes.backtest.retrieve_courses", COURSES),
+    (f"/backtest/{COURSE_ID}", "server.routes.backtest.retrieve_backtest", BACKTESTS),
+]
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(laf_router, prefix="/laf")
+    app.include_router(backtest_router)
+    return app
+
+
+async def requests_per_second(
+    client: httpx.AsyncClient, path: str, headers: dict[str, str], expected: int
+) -> float:
+    """Best of ``ROUNDS`` runs of ``REQUESTS`` sequential GETs."""
+    best = 0.0
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(REQUESTS):
+            response = await client.get(path, headers=headers)
+            assert response.status_code == expected, response.status_code
+        best = max(best, REQUESTS / (time.perf_counter() - start))
+    return best
+
+
+def route_for(path: str) -> APIRoute:
+    for router, prefix in ((laf_router, "/laf"), (backtest_router, "")):
+        for route in router.routes:
+            if isinstance(route, APIRoute) and route.path_regex.match(
+                path.removeprefix(prefix)
+            ):
+                return route
+    raise LookupError(path)
+
+
+async def encode_microseconds(path: str, value: list) -> tuple[float, float]:
+    """Per-hit handler cost of the model path and the pre-encoded path, in µs."""
+    route = route_for(path)
+    field = route.response_field
+    model_type = route.response_model
+
+    async def model_path() -> bytes:
+        model = model_type(data=value, message="retrieved")
+        content = await serialize_response(field=field, response_content=model)
+        return JSONResponse(content).body
+
+    async def bytes_path() -> bytes:
+        payload = payload_versions.get(
+            path, value, lambda data: model_type(data=data, message="retrieved")
+        )
+        headers = {"ETag": payload.etag, "Cache-Control": CATALOG_CACHE_CONTROL}
+        return Response(
+            payload.body, media_type="application/json", headers=headers
+        ).body
+
+    timings = []
+    for encode in (model_path, bytes_path):
+        best = float("inf")
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            for _ in range(REQUESTS):
+                await encode()
+            best = min(best, time.perf_counter() - start)
+        timings.append(best / REQUESTS * 1e6)
+    return timings[0], timings[1]
+
+
+async def run() -> None:
+    payload_versions.clear()
+    transport = httpx.ASGITransport(app=build_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        for path, _, value in ROUTES:
+            first = await client.get(path)
+            etag = first.headers["etag"]
+            full = await requests_per_second(client, path, {}, 200)
+            revalidated = await requests_per_second(
+                client, path, {"If-None-Match": etag}, 304
+            )
+            model_us, bytes_us = await encode_microseconds(path, value)
+            print(
+                f"{path:38} body {len(first.content):>6} B  "
+                f"200 {full:6.0f} req/s  304 {revalidated:6.0f} req/s  "
+                f"encode model {model_us:6.1f} µs  cached bytes {bytes_us:5.1f} µs"
+            )
+
+
+def main() -> None:
+    with ExitStack() as stack:
+        for _, target, value in ROUTES:
+            stack.enter_context(patch(target, new=AsyncMock(return_value=value)))
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Compare explain plans of the regex and token-array description prefilters.
+
+Seeds a synthetic LAF collection (100k items by default) in a scratch database on
+``MONGO_DETAILS``, then prints keys and documents examined by each prefilter for a
+handful of description searches shaped like ``retrieve_laf_items``: the original
+case-insensitive regex, the whole-token ``$in``, the ``$in`` widened by the in-memory
+index to words containing the query, and the ``_id`` lookup that index resolves the
+widened tokens to.
+
+Run with ``uv run python -m benchmarks.description_prefilter_explain``.
+"""
+
+import argparse
+import asyncio
+import random
+import re
+from datetime import date, timedelta
+
+from pymongo import AsyncMongoClient
+
+from benchmarks.description_ranking import WORDS
+from server.config import settings
+from server.helpers.description_index import DescriptionIndex
+from server.helpers.description_search import (
+    DESCRIPTION_SEARCH_CANDIDATE_LIMIT,
+    _prefilter_regex_alternates,
+    build_description_prefilter,
+    normalize_search_text,
+    search_fields,
+)
+
+BENCHMARK_DATABASE = "apo_benchmark"
+BENCHMARK_COLLECTION = "laf_items_prefilter"
+QUERIES = ["airpods", "black wool hat", "hydroflask", "student id"]
+
+
+def regex_prefilter(description_query: str) -> dict:
+    """The ``$regex`` alternation the token prefilter replaced."""
+    alternates = _prefilter_regex_alternates(normalize_search_text(description_query))
+    pattern = "|".join(re.escape(token) for token in alternates)
+    return {"description": {"$regex": pattern, "$options": "i"}}
+
+
+def synthetic_items(count: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    start = date(2018, 1, 1)
+    items = []
+    for item_id in range(1, count + 1):
+        description = " ".join(rng.choices(WORDS, k=rng.randint(3, 12))).capitalize()
+        items.append(
+            {
+                "_id": item_id,
+                "description": description,
+                **search_fields(description),
+                "archived": rng.random() < 0.9,
+                "date": (start + timedelta(days=rng.randint(0, 2900))).isoformat(),
+            }
+        )
+    return items
+
+
+async def seed(collection, count: int) -> list[dict]:
+    await collection.drop()
+    items = synthetic_items(count)
+    for offset in range(0, len(items), 10_000):
+        await collection.insert_many(items[offset : offset + 10_000], ordered=False)
+    await collection.create_index([("archived", 1), ("date", -1)])
+    await collection.create_index(
+        [("archived", 1), ("description_tokens", 1), ("date", -1)]
+    )
+    return items
+
+
+async def execution_stats(collection, prefilter: dict) -> dict:
+    cursor = (
+        collection.find({"archived": False, **prefilter})
+        .sort("date", -1)
+        .limit(DESCRIPTION_SEARCH_CANDIDATE_LIMIT)
+    )
+    return (await cursor.explain())["executionStats"]
+
+
+async def main(count: int, keep: bool) -> None:
+    client = AsyncMongoClient(settings.MONGO_DETAILS)
+    try:
+        collection = client[BENCHMARK_DATABASE][BENCHMARK_COLLECTION]
+        index = DescriptionIndex()
+        index.load(await seed(collection, count))
+        print(f"{count} synthetic items, {DESCRIPTION_SEARCH_CANDIDATE_LIMIT} limit")
+        for query in QUERIES:
+            tokens = index.matching_tokens(query)
+            for label, prefilter in (
+                ("regex", regex_prefilter(query)),
+                ("tokens", build_description_prefilter(query)),
+                ("widened", build_description_prefilter(query, tokens)),
+                (
+                    "ids",
+                    build_description_prefilter(
+                        query, tokens, index.candidates(tokens, False)
+                    ),
+                ),
+            ):
+                stats = await execution_stats(collection, prefilter)
+                print(
+                    f"{query!r:18} {label:7} "
+                    f"docs examined {stats['totalDocsExamined']:>7}  "
+                    f"keys examined {stats['totalKeysExamined']:>7}  "
+                    f"returned {stats['nReturned']:>4}  "
+                    f"{stats['executionTimeMillis']:>5} ms"
+                )
+        if not keep:
+            await collection.drop()
+    finally:
+        await client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument(
+        "--keep", action="store_true", help="leave the seeded collection in place"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.count, args.keep))
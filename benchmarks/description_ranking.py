@@ -0,0 +1,113 @@
+"""
+Benchmark batched description scoring against the per-item scoring loop.
+
+Times the batch path on one cdist worker and on every core (``workers=-1``), so the
+core count's share of the speedup is visible. The requirement is at least 5x at
+the 300-candidate limit, and it is still unmet: on a single core the batch path
+measures 1.7-2.8x (1.9-3.4x with stored search fields), because the native scorers
+themselves are the floor. Whether ``workers=-1`` reaches 5x on a multi-core host has
+not been measured yet.
+
+Run with ``uv run python -m benchmarks.description_ranking``.
+"""
+
+import os
+import random
+import timeit
+from unittest.mock import patch
+
+from server.helpers import description_search as description_search_module
+from server.helpers.description_search import (
+    DESCRIPTION_SEARCH_CANDIDATE_LIMIT,
+    description_similarity_score,
+    description_similarity_scores,
+    normalize_search_text,
+    normalized_similarity_scores,
+    search_fields,
+)
+
+WORDS = [
+    "black",
+    "red",
+    "blue",
+    "white",
+    "wool",
+    "beanie",
+    "hat",
+    "apple",
+    "airpods",
+    "case",
+    "umbrella",
+    "calculator",
+    "textbook",
+    "charger",
+    "laptop",
+    "keys",
+    "wallet",
+    "water",
+    "bottle",
+    "jacket",
+    "hydroflask",
+    "student",
+    "id",
+    "left",
+    "near",
+    "union",
+]
+QUERIES = ["airpods", "black wool hat", "blue hydroflask water bottle", "student id"]
+
+
+def synthetic_descriptions(count: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choices(WORDS, k=rng.randint(3, 12))).capitalize()
+        for _ in range(count)
+    ]
+
+
+def score_loop(query: str, texts: list[str]) -> list[float]:
+    return [description_similarity_score(query, text) for text in texts]
+
+
+def _best_ms(function, repeat: int) -> float:
+    return min(timeit.repeat(function, number=repeat, repeat=5)) / repeat * 1000
+
+
+def main(candidates: int = DESCRIPTION_SEARCH_CANDIDATE_LIMIT, repeat: int = 50):
+    texts = synthetic_descriptions(candidates)
+    stored = [search_fields(text) for text in texts]
+    stored_norms = [fields["description_norm"] for fields in stored]
+    stored_tokens = [fields["description_tokens"] for fields in stored]
+    print(
+        f"{candidates} candidates, best of 5 x {repeat} runs per query, "
+        f"{os.cpu_count()} cores"
+    )
+    for query in QUERIES:
+        normalized_query = normalize_search_text(query)
+        assert score_loop(normalized_query, texts) == description_similarity_scores(
+            normalized_query, texts
+        )
+        loop = _best_ms(lambda: score_loop(normalized_query, texts), repeat)
+        with patch.object(description_search_module, "DESCRIPTION_SCORE_WORKERS", 1):
+            one_core = _best_ms(
+                lambda: description_similarity_scores(normalized_query, texts), repeat
+            )
+        batch = _best_ms(
+            lambda: description_similarity_scores(normalized_query, texts), repeat
+        )
+        precomputed = _best_ms(
+            lambda: normalized_similarity_scores(
+                normalized_query, stored_norms, stored_tokens
+            ),
+            repeat,
+        )
+        print(
+            f"{query!r:32} loop {loop:7.3f} ms  "
+            f"batch 1 core {one_core:7.3f} ms ({loop / one_core:4.1f}x)  "
+            f"all cores {batch:7.3f} ms ({loop / batch:4.1f}x)  "
+            f"stored fields {precomputed:7.3f} ms ({loop / precomputed:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Latency of concurrent description searches on each ranking backend.
+
+Fires ``--concurrency`` searches at once over the same synthetic candidate set
+(streamed in chunks like ``retrieve_laf_items``) and reports p50/p95 per search for
+the inline, thread and process backends.
+
+Run with ``uv run python -m benchmarks.description_ranking_load``.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from benchmarks.description_ranking import QUERIES, synthetic_descriptions
+from server.helpers.description_search import (
+    DESCRIPTION_SEARCH_CANDIDATE_LIMIT,
+    rank_cursor_by_description,
+    search_fields,
+)
+from server.helpers.ranking_executor import RANKING_BACKENDS, RankingExecutor
+
+
+async def _stream(items: list[dict]):
+    for item in items:
+        yield item
+
+
+async def _timed_search(
+    executor: RankingExecutor, items: list[dict], query: str, start: float
+) -> float:
+    """Seconds from ``start`` (when the batch of requests arrived) to results."""
+    await rank_cursor_by_description(_stream(items), query, executor=executor)
+    return time.perf_counter() - start
+
+
+async def run_backend(
+    backend: str, items: list[dict], concurrency: int, rounds: int
+) -> list[float]:
+    executor = RankingExecutor(backend)
+    try:
+        # Warm up worker processes before measuring
+        await _timed_search(executor, items, QUERIES[0], time.perf_counter())
+        latencies: list[float] = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            latencies += await asyncio.gather(
+                *(
+                    _timed_search(executor, items, QUERIES[i % len(QUERIES)], start)
+                    for i in range(concurrency)
+                )
+            )
+        return latencies
+    finally:
+        executor.shutdown()
+
+
+def percentile(values: list[float], pct: int) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+def main(candidates: int, concurrency: list[int], rounds: int) -> None:
+    items = [
+        {
+            "_id": i,
+            "date": f"2024-01-{i % 28 + 1:02d}",
+            "description": text,
+            **search_fields(text),
+        }
+        for i, text in enumerate(synthetic_descriptions(candidates))
+    ]
+    print(f"{candidates} candidates per search, {rounds} rounds")
+    for level in concurrency:
+        for backend in RANKING_BACKENDS:
+            latencies = asyncio.run(run_backend(backend, items, level, rounds))
+            print(
+                f"concurrency {level:>3} {backend:8} "
+                f"p50 {percentile(latencies, 50) * 1000:8.2f} ms  "
+                f"p95 {percentile(latencies, 95) * 1000:8.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--candidates", type=int, default=DESCRIPTION_SEARCH_CANDIDATE_LIMIT
+    )
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    main(args.candidates, args.concurrency, args.rounds)
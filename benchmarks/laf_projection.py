@@ -0,0 +1,125 @@
+"""
+BSON bytes and decode time per request with and without the LAF cursor projections.
+
+Encodes synthetic LAF item and lost report documents shaped like production rows,
+then measures the reply size and ``bson.decode_all`` time for a page of 30 rows (a
+plain listing) and 300 rows (a description search's candidate set), once with full
+documents and once with only the fields the projection keeps.
+
+Run with ``uv run python -m benchmarks.laf_projection``.
+"""
+
+import random
+import timeit
+from datetime import datetime, timedelta
+
+import bson
+from bson import ObjectId
+
+from benchmarks.description_ranking import synthetic_descriptions
+from server.database.laf import (
+    DESCRIPTION_SEARCH_PROJECTION,
+    LAF_ITEM_PROJECTION,
+    LOST_REPORT_PROJECTION,
+)
+from server.helpers.description_search import search_fields
+
+ROW_COUNTS = (30, 300)
+LOCATIONS = ["Union", "DCC", "Sage", "Folsom Library", "EMPAC", "Armory"]
+
+
+def _dates(rng: random.Random) -> tuple[str, datetime]:
+    created = datetime(2024, 1, 1) + timedelta(minutes=rng.randint(0, 500_000))
+    return created.strftime("%Y-%m-%d"), created
+
+
+def synthetic_laf_items(count: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    items = []
+    for item_id, description in enumerate(synthetic_descriptions(count, seed), 1):
+        date, created = _dates(rng)
+        items.append(
+            {
+                "_id": item_id,
+                "location": rng.choice(LOCATIONS),
+                "date": date,
+                "description": description,
+                **search_fields(description),
+                "found": False,
+                "archived": False,
+                "created": created,
+                "updated": created,
+                "name": None,
+                "email": None,
+                "returned": None,
+                "type_id": ObjectId(),
+            }
+        )
+    return items
+
+
+def synthetic_lost_reports(count: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    reports = []
+    for description in synthetic_descriptions(count, seed):
+        date, created = _dates(rng)
+        reports.append(
+            {
+                "_id": ObjectId(),
+                "name": "Alfred Glump",
+                "email": "glump@rpi.edu",
+                "location": rng.sample(LOCATIONS, k=rng.randint(1, 3)),
+                "date": date,
+                "description": description,
+                **search_fields(description),
+                "found": False,
+                "archived": False,
+                "created": created,
+                "updated": created,
+                "viewed": True,
+                "type_id": ObjectId(),
+            }
+        )
+    return reports
+
+
+def project(document: dict, projection: dict) -> dict:
+    return {key: value for key, value in document.items() if key in projection}
+
+
+def measure(documents: list[dict], repeat: int = 200) -> tuple[int, float]:
+    """Reply bytes and best per-request ``decode_all`` time in milliseconds."""
+    payload = b"".join(bson.encode(document) for document in documents)
+    seconds = min(
+        timeit.repeat(lambda: bson.decode_all(payload), number=repeat, repeat=5)
+    )
+    return len(payload), seconds / repeat * 1000
+
+
+def main() -> None:
+    cases = [
+        ("laf items", synthetic_laf_items, LAF_ITEM_PROJECTION),
+        ("lost reports", synthetic_lost_reports, LOST_REPORT_PROJECTION),
+    ]
+    for label, build, projection in cases:
+        for rows in ROW_COUNTS:
+            documents = build(rows)
+            if rows > 30:
+                # Candidate sets come from description searches, which also read
+                # the stored search fields for ranking.
+                projection = {**projection, **DESCRIPTION_SEARCH_PROJECTION}
+            full_bytes, full_ms = measure(documents)
+            projected_bytes, projected_ms = measure(
+                [project(document, projection) for document in documents]
+            )
+            print(
+                f"{label:12} {rows:>3} rows  "
+                f"full {full_bytes:>7} B {full_ms:6.3f} ms  "
+                f"projected {projected_bytes:>7} B {projected_ms:6.3f} ms  "
+                f"({1 - projected_bytes / full_bytes:4.0%} fewer bytes, "
+                f"decode speedup {full_ms / projected_ms:3.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
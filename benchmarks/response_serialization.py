@@ -0,0 +1,118 @@
+"""
+Response serialization time per LAF list route, validated versus trusted.
+
+Formats synthetic rows shaped like production documents with the LAF formatters,
+then times what each route spends turning them into a response body: the previous
+path (build the response model, let FastAPI validate and encode it against
+``response_model``, render a stdlib ``JSONResponse``) against ``trusted_response``.
+Also times ``jsonable_encoder`` against ``model_dump(mode="json")`` for the request
+bodies the routers hand to the database layer.
+
+Run with ``uv run python -m benchmarks.response_serialization``.
+"""
+
+import asyncio
+import timeit
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from benchmarks.laf_projection import synthetic_laf_items, synthetic_lost_reports
+from server.database.laf import format_laf_item, format_lost_report
+from server.helpers.json_response import trusted_response
+from server.models.laf import LAFItemRequest, LostReportRequest
+from server.routes.laf import router
+
+NUMBER = 500
+LAF_TYPE = {"_id": ObjectId(), "type": "Electronics", "letter": "E"}
+
+
+def route_for(path: str) -> APIRoute:
+    return next(
+        route
+        for route in router.routes
+        if isinstance(route, APIRoute) and route.path == path
+    )
+
+
+def laf_rows(count: int) -> list[dict]:
+    return [format_laf_item(item, LAF_TYPE) for item in synthetic_laf_items(count)]
+
+
+def lost_report_rows(count: int) -> list[dict]:
+    return [
+        format_lost_report(report, LAF_TYPE) for report in synthetic_lost_reports(count)
+    ]
+
+
+def best_microseconds(function) -> float:
+    return min(timeit.repeat(function, number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+def validated_body(route: APIRoute, data) -> bytes:
+    model = route.response_model(data=data, message="Retrieved")
+    content = asyncio.run(
+        serialize_response(field=route.response_field, response_content=model)
+    )
+    return JSONResponse(content).body
+
+
+def main() -> None:
+    cases = [
+        ("/items/", "30 LAF items", laf_rows(30)),
+        (
+            "/items/expired/",
+            "30+30 expired",
+            {"expired": laf_rows(30), "potential": laf_rows(30)},
+        ),
+        ("/reports/", "60 lost reports", lost_report_rows(60)),
+        ("/reports/new", "30 new reports", lost_report_rows(30)),
+    ]
+    for path, label, data in cases:
+        route = route_for(path)
+        assert validated_body(route, data) == trusted_response(data, "Retrieved").body
+        # asyncio.run's own overhead is timed separately and subtracted
+        loop_us = best_microseconds(lambda: asyncio.run(asyncio.sleep(0)))
+        validated_us = best_microseconds(lambda: validated_body(route, data)) - loop_us
+        trusted_us = best_microseconds(lambda: trusted_response(data, "Retrieved").body)
+        print(
+            f"{path:16} {label:16} validated {validated_us:7.1f} µs  "
+            f"trusted {trusted_us:6.1f} µs  ({validated_us / trusted_us:4.1f}x)"
+        )
+
+    requests = [
+        (
+            "LAFItemRequest",
+            LAFItemRequest(
+                type="Electronics",
+                location="Union",
+                description="Black Anker power bank with a USB C cable",
+                date="2024-09-01",
+            ),
+        ),
+        (
+            "LostReportRequest",
+            LostReportRequest(
+                type="Electronics",
+                name="Alfred Glump",
+                email="glump@rpi.edu",
+                description="Black Anker power bank with a USB C cable",
+                date="2024-09-01",
+                location="Union,DCC",
+            ),
+        ),
+    ]
+    for label, body in requests:
+        assert jsonable_encoder(body) == body.model_dump(mode="json")
+        encoder_us = best_microseconds(lambda: jsonable_encoder(body))
+        dump_us = best_microseconds(lambda: body.model_dump(mode="json"))
+        print(
+            f"{label:33} jsonable_encoder {encoder_us:5.1f} µs  "
+            f"model_dump {dump_us:4.1f} µs  ({encoder_us / dump_us:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
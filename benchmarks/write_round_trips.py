@@ -0,0 +1,168 @@
+"""
+Latency of each mutating LAF and loaner tech helper with one Mongo round trip versus
+the two it used to take.
+
+Every collection call sleeps ``ROUND_TRIP_MS``, standing in for the network hop to
+Mongo. The "before" collection replays the old access pattern around the same helper
+code: inserts are followed by a ``find_one`` on the new id to format the response,
+and updates and deletes are preceded by a ``find_one`` existence check. Type lookups,
+invalidation and the description indexes are patched out, as they cost no round trip.
+
+Run with ``uv run python -m benchmarks.write_round_trips``.
+"""
+
+import asyncio
+import time
+from contextlib import ExitStack
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from bson import ObjectId
+
+from server.database import laf as laf_module
+from server.database import loanertech as loanertech_module
+from server.helpers.type_registry import LAFTypeRegistry
+
+ROUND_TRIP_MS = 1.0
+CALLS = 200
+TYPE_ID = ObjectId()
+NOW = datetime(2024, 9, 2)
+
+
+class LatencyCollection:
+    """Answers like a collection holding every id; each call costs one round trip."""
+
+    def __init__(self) -> None:
+        self.round_trips = 0
+
+    async def _round_trip(self) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(ROUND_TRIP_MS / 1000)
+
+    async def insert_one(self, document: dict):
+        await self._round_trip()
+        return MagicMock(inserted_id=document.setdefault("_id", ObjectId()))
+
+    async def find_one(self, filter: dict, projection=None) -> dict:
+        await self._round_trip()
+        return {"_id": filter["_id"]}
+
+    async def update_one(self, filter: dict, update: dict):
+        await self._round_trip()
+        return MagicMock(modified_count=1)
+
+    async def delete_one(self, filter: dict):
+        await self._round_trip()
+        return MagicMock(deleted_count=1)
+
+    async def find_one_and_update(self, filter: dict, update: dict, projection=None):
+        await self._round_trip()
+        return {"_id": filter["_id"]}
+
+    async def find_one_and_delete(self, filter: dict, projection=None):
+        await self._round_trip()
+        return {"_id": filter["_id"]}
+
+
+class ReadBackCollection(LatencyCollection):
+    """The access pattern before single-round-trip writes."""
+
+    async def insert_one(self, document: dict):
+        result = await super().insert_one(document)
+        await self.find_one({"_id": result.inserted_id})
+        return result
+
+    async def find_one_and_update(self, filter: dict, update: dict, projection=None):
+        await self.find_one(filter)
+        await self.update_one(filter, update)
+        return {"_id": filter["_id"]}
+
+    async def find_one_and_delete(self, filter: dict, projection=None):
+        await self.find_one(filter)
+        await self.delete_one(filter)
+        return {"_id": filter["_id"]}
+
+
+def laf_item() -> dict:
+    return {
+        "type": "Umbrellas",
+        "location": "Union",
+        "description": "Black umbrella",
+        "date": "2024-09-01",
+    }
+
+
+WRITES = {
+    "add_laf": lambda request: laf_module.add_laf(request, laf_item()),
+    "add_lost_report": lambda request: laf_module.add_lost_report(
+        request,
+        {**laf_item(), "name": "A", "email": "a@rpi.edu", "location": ["Union"]},
+        True,
+    ),
+    "add_loanertech": lambda request: loanertech_module.add_loanertech(
+        request, {"description": "Dell charger"}
+    ),
+    "add_laf_location": lambda request: laf_module.add_laf_location(request, "Union"),
+    "update_laf": lambda request: laf_module.update_laf(
+        request, 7, {"description": "Red umbrella"}, NOW
+    ),
+    "update_lost_report": lambda request: laf_module.update_lost_report(
+        request, str(ObjectId()), {"description": "Red umbrella"}, NOW
+    ),
+    "update_loanertech": lambda request: loanertech_module.update_loanertech(
+        request, 7, {"in_office": False}
+    ),
+    "delete_loanertech": lambda request: loanertech_module.delete_loanertech(
+        request, 7
+    ),
+}
+
+
+async def mean_latency_ms(write, collection: LatencyCollection) -> float:
+    request = MagicMock()
+    request.app.state.mongo_database.get_collection = MagicMock(return_value=collection)
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        await write(request)
+    return (time.perf_counter() - start) * 1000 / CALLS
+
+
+async def main() -> None:
+    registry = LAFTypeRegistry()
+    registry.load([{"_id": TYPE_ID, "type": "Umbrellas", "letter": "U"}])
+    allocator = MagicMock()
+    allocator.next = AsyncMock(return_value=7)
+
+    with ExitStack() as stack:
+        stack.enter_context(patch.object(laf_module, "laf_type_registry", registry))
+        stack.enter_context(patch.object(laf_module, "sequence_allocator", allocator))
+        stack.enter_context(
+            patch.object(loanertech_module, "sequence_allocator", allocator)
+        )
+        stack.enter_context(
+            patch.object(laf_module.invalidation_bus, "publish", new=AsyncMock())
+        )
+        stack.enter_context(
+            patch.object(laf_module, "invalidate_laf_locations", new=AsyncMock())
+        )
+        stack.enter_context(patch.object(laf_module, "laf_items_description_index"))
+        stack.enter_context(patch.object(laf_module, "lost_reports_description_index"))
+
+        print(f"{ROUND_TRIP_MS:.1f} ms per round trip, mean of {CALLS} calls")
+        print(f"{'endpoint':<20}{'before':>16}{'after':>16}")
+        for name, write in WRITES.items():
+            before_collection, after_collection = (
+                ReadBackCollection(),
+                LatencyCollection(),
+            )
+            before = await mean_latency_ms(write, before_collection)
+            after = await mean_latency_ms(write, after_collection)
+            print(
+                f"{name:<20}"
+                f"{before:>7.2f} ms ({before_collection.round_trips // CALLS} rt)"
+                f"{after:>7.2f} ms ({after_collection.round_trips // CALLS} rt)"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,4 +1,5 @@
 import sys
+from asyncio import create_task
 from contextlib import asynccontextmanager
 
 import sentry_sdk
@@ -7,9 +8,16 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from server.config import settings
 from server.database.backtest import backtest_db_setup
-from server.database.laf import laf_db_setup
+from server.database.laf import laf_db_setup, sync_description_indexes
 from server.database.mongo import mongo_setup, mongo_shutdown
-from server.database.valkey import valkey_setup, valkey_shutdown
+from server.database.valkey import (
+    valkey_pubsub_setup,
+    valkey_pubsub_shutdown,
+    valkey_setup,
+    valkey_shutdown,
+)
+from server.helpers.cache import log_cache_stats
+from server.helpers.ranking_executor import ranking_executor
 from server.routes.auth import router as AuthRouter
 from server.routes.backtest import router as BacktestRouter
 from server.routes.laf import router as LAFRouter
@@ -50,10 +58,17 @@ async def lifespan(app: FastAPI):
     await laf_db_setup(app)
     await backtest_db_setup(app)
     await valkey_setup(app)
+    await valkey_pubsub_setup(app)
+    cache_stats_task = create_task(log_cache_stats())
+    description_index_task = create_task(sync_description_indexes(app))
     yield  # Application runs here
     # This runs during the shutdown phase
+    cache_stats_task.cancel()
+    description_index_task.cancel()
+    await valkey_pubsub_shutdown(app)
     await valkey_shutdown(app)
     await mongo_shutdown(app)
+    ranking_executor.shutdown()
 
 
 app = FastAPI(lifespan=lifespan, root_path=settings.ROOT_PATH)
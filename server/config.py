@@ -33,6 +33,12 @@ class Settings(BaseSettings):
     SENTRY_PROFILE_RATE: float = float(os.getenv("SENTRY_PROFILE_RATE", 1.0))
     VALKEY_ADDRESS: str = os.getenv("VALKEY_ADDRESS", "127.0.0.1")
     VALKEY_PASSWORD: str = os.getenv("VALKEY_PASSWORD", "")
+    # Description ranking backend: "thread", "process" or "inline"
+    DESCRIPTION_RANKING_BACKEND: str = "thread"
+    DESCRIPTION_RANKING_WORKERS: int | None = None
+    # Sequence ids each worker reserves per round trip; unused ids are skipped when
+    # the worker restarts
+    SEQUENCE_BLOCK_SIZE: int = 10
 
     # Define routes to exclude from tracing and profiling
     EXCLUDED_ROUTES: set = {"/", "/openapi.json", "/docs"}
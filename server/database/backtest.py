@@ -1,8 +1,7 @@
-from aiocache import cached
 from bson import ObjectId
 from fastapi import FastAPI, HTTPException, Request
 
-from server.helpers.cache import cache_key_exclude_request
+from server.helpers.cache import tiered_cached
 from server.helpers.sanitize import is_valid_object_id
 from server.models.backtest import Backtests, Course
 
@@ -28,7 +27,7 @@ async def course_helper(course) -> Course:
 
 
 # Retrieve all course codes present in the database
-@cached(ttl=86400, key_builder=cache_key_exclude_request)
+@tiered_cached(ttl=86400)
 async def retrieve_coursecodes(request: Request) -> list[str]:
     backtest_course_code_collection = request.app.state.mongo_database.get_collection(
         "backtest_course_code_collection"
@@ -37,7 +36,7 @@ async def retrieve_coursecodes(request: Request) -> list[str]:
     return sorted(course_codes)
 
 
-@cached(ttl=86400, key_builder=cache_key_exclude_request)
+@tiered_cached(ttl=86400)
 async def retrieve_courses(request: Request, course_code: str) -> list[Course]:
     backtest_courses_collection = request.app.state.mongo_database.get_collection(
         "backtest_courses_collection"
@@ -48,7 +47,7 @@ async def retrieve_courses(request: Request, course_code: str) -> list[Course]:
     return sorted(courses, key=lambda x: x["name"])
 
 
-@cached(ttl=86400, key_builder=cache_key_exclude_request)
+@tiered_cached(ttl=86400)
 async def retrieve_backtest(request: Request, backtest_id: str) -> list[Backtests]:
     if not is_valid_object_id(backtest_id):
         raise HTTPException(status_code=404, detail="Backtest not found")
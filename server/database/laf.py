@@ -1,33 +1,123 @@
 import logging
 import re
-from asyncio import gather
-from datetime import datetime
-from html import unescape
+from asyncio import gather, sleep
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta
 from typing import Union
 
-from aiocache import cached
 from bson import ObjectId
 from fastapi import FastAPI, HTTPException, Request, status
-from pymongo.errors import DuplicateKeyError
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
-from server.helpers.cache import cache_key_exclude_request
+from server.helpers.cache import QueryResultCache, tiered_cached
 from server.helpers.db import (
     async_dict_itr,
-    datetime_time_delta,
-    get_next_sequence_value,
+    insert_sequenced,
+    reserve_sequence_block,
+    sequence_allocator,
+    update_by_id,
 )
+from server.helpers.description_index import DescriptionIndex
 from server.helpers.description_search import (
     DESCRIPTION_SEARCH_CANDIDATE_LIMIT,
-    DESCRIPTION_SEARCH_RESULT_LIMIT,
     build_description_prefilter,
     normalize_search_text,
-    rank_by_description_async,
+    rank_cursor_by_description,
+    search_fields,
 )
+from server.helpers.expiry import (
+    EXPIRY_POLICY_TYPES,
+    LAF_EXPIRY_POLICY,
+    ExpiryPolicy,
+    expiry_cutoff,
+    expiry_day,
+    expiry_fields,
+    expiry_policy_field,
+)
+from server.helpers.export import EXPORT_BATCH_SIZE
+from server.helpers.invalidation import invalidation_bus
+from server.helpers.pagination import (
+    DEFAULT_PAGE_LIMIT,
+    PAGE_SORT,
+    Page,
+    after_cursor,
+    split_page,
+)
+from server.helpers.ranking_executor import ranking_executor
 from server.helpers.sanitize import is_valid_object_id, reject_mongo_operators
+from server.helpers.type_registry import LAFTypeRegistry
 from server.models.laf import ArchivedLAFItem, ExpiredItem, LAFItem, LostReportItem
 
 logger = logging.getLogger(__name__)
 
+# Process-local description indexes, loaded in laf_db_setup and kept current by the
+# write paths below. Until loaded, searches fall back to the token prefilter.
+laf_items_description_index = DescriptionIndex()
+lost_reports_description_index = DescriptionIndex()
+
+# Process-local LAF types, loaded in laf_db_setup and reloaded by type writes.
+laf_type_registry = LAFTypeRegistry()
+
+# Catalog caches are invalidated over the bus on every write, so they can live long.
+# A worker's own copy is rechecked against the shared generation more often, which
+# bounds how stale it gets if an invalidation message never reaches it.
+CATALOG_CACHE_TTL = 7 * 86400
+CATALOG_L1_CACHE_TTL = 300
+
+# Writes keep every worker's description indexes current over the bus; periodic syncs
+# catch up on invalidations that never arrived and on writes made outside the app.
+DESCRIPTION_INDEX_PROJECTION = {"description": 1, "archived": 1}
+DESCRIPTION_INDEX_SYNC_INTERVAL = 60
+DESCRIPTION_INDEX_MAX_AGE = 3600
+
+
+@invalidation_bus.on("laf_types")
+async def _reload_laf_types(app: FastAPI) -> None:
+    await laf_type_registry.reload(app.state.mongo_database.get_collection("laf_types"))
+
+
+@invalidation_bus.on("laf_locations")
+async def _evict_laf_locations(app: FastAPI) -> None:
+    await retrieve_laf_locations.clear_local()
+
+
+@invalidation_bus.on("laf_items")
+async def _evict_laf_item_results(app: FastAPI) -> None:
+    laf_query_cache.bump("laf_items")
+
+
+@invalidation_bus.on("lost_reports")
+async def _evict_lost_report_results(app: FastAPI) -> None:
+    laf_query_cache.bump("lost_reports")
+
+
+@invalidation_bus.on_remote("laf_items")
+async def _sync_laf_items_description_index(
+    app: FastAPI, keys: tuple[str, ...]
+) -> None:
+    await sync_description_index(
+        app.state.mongo_database.get_collection("laf_items"),
+        laf_items_description_index,
+        [int(key) for key in keys],
+    )
+
+
+@invalidation_bus.on_remote("lost_reports")
+async def _sync_lost_reports_description_index(
+    app: FastAPI, keys: tuple[str, ...]
+) -> None:
+    await sync_description_index(
+        app.state.mongo_database.get_collection("lost_reports"),
+        lost_reports_description_index,
+        [ObjectId(key) for key in keys],
+    )
+
+
+# Short-lived results of /laf/items/ and /laf/reports/ searches. Write paths publish
+# an invalidation that bumps the collection's generation in every worker.
+LAF_QUERY_CACHE_TTL = 30
+laf_query_cache = QueryResultCache(ttl=LAF_QUERY_CACHE_TTL, max_entries=512)
+
 
 async def laf_db_setup(app: FastAPI) -> None:
     database = app.state.mongo_database
@@ -42,10 +132,17 @@ async def laf_db_setup(app: FastAPI) -> None:
     await laf_items_collection.create_index("type_id")
     await laf_items_collection.create_index("archived")
     await laf_items_collection.create_index([("archived", 1), ("type_id", 1)])
-    await laf_items_collection.create_index([("archived", 1), ("date", -1)])
     await laf_items_collection.create_index(
-        [("archived", 1), ("type_id", 1), ("date", -1)]
+        [("archived", 1), ("date", -1), ("_id", -1)]
     )
+    await laf_items_collection.create_index(
+        [("archived", 1), ("type_id", 1), ("date", -1), ("_id", -1)]
+    )
+    await laf_items_collection.create_index(
+        [("archived", 1), ("description_tokens", 1), ("date", -1)]
+    )
+    await laf_items_collection.create_index([("archived", 1), ("expires_at", 1)])
+    await laf_items_collection.create_index("updated")
 
     # Lost Reports indexes
     await lost_reports_collection.create_index("date")
@@ -56,10 +153,16 @@ async def laf_db_setup(app: FastAPI) -> None:
     await lost_reports_collection.create_index(
         [("viewed", 1), ("archived", 1), ("date", -1)]
     )
-    await lost_reports_collection.create_index([("archived", 1), ("date", -1)])
     await lost_reports_collection.create_index(
-        [("archived", 1), ("type_id", 1), ("date", -1)]
+        [("archived", 1), ("date", -1), ("_id", -1)]
     )
+    await lost_reports_collection.create_index(
+        [("archived", 1), ("type_id", 1), ("date", -1), ("_id", -1)]
+    )
+    await lost_reports_collection.create_index(
+        [("archived", 1), ("description_tokens", 1), ("date", -1)]
+    )
+    await lost_reports_collection.create_index("updated")
 
     # LAF Types indexes - unique constraint for data integrity
     try:
@@ -80,50 +183,218 @@ async def laf_db_setup(app: FastAPI) -> None:
             "Run migration to remove duplicates."
         )
 
+    await laf_type_registry.reload(laf_types_collection)
+    logger.info("Loaded %d LAF types", len(laf_type_registry))
 
-# Cache for 1 hour
-@cached(ttl=3600, key_builder=cache_key_exclude_request)
-async def get_type_id(request: Request, type_in: str) -> ObjectId:
-    laf_types_collection = request.app.state.mongo_database.get_collection("laf_types")
-    laf_type = await laf_types_collection.find_one({"type": type_in})
-    if laf_type:
-        return laf_type["_id"]
+    await load_description_index(laf_items_collection, laf_items_description_index)
+    await load_description_index(
+        lost_reports_collection, lost_reports_description_index
+    )
 
-    # Backward-compatible fallback for historical data where "&" may have been
-    # stored as "&amp;" (or vice versa) due to sanitization.
-    normalized_input = unescape(type_in).casefold()
-    laf_types = await laf_types_collection.find({}).to_list(length=None)
-    for candidate in laf_types:
-        candidate_type = candidate.get("type")
-        if (
-            isinstance(candidate_type, str)
-            and unescape(candidate_type).casefold() == normalized_input
-        ):
-            return candidate["_id"]
 
-    raise HTTPException(
-        status_code=status.HTTP_400_BAD_REQUEST, detail="LAF Type not found"
+async def load_description_index(collection, index: DescriptionIndex) -> None:
+    documents = await collection.find(
+        {}, projection=DESCRIPTION_INDEX_PROJECTION
+    ).to_list(length=None)
+    index.load(documents)
+    logger.info(
+        "Loaded %d descriptions into the %s search index", len(index), collection.name
     )
 
 
-# Cache for 1 day
-@cached(ttl=86400, key_builder=cache_key_exclude_request)
+async def sync_description_index(
+    collection, index: DescriptionIndex, ids: list
+) -> None:
+    """Refetch the descriptions another worker wrote for ``ids`` into ``index``."""
+    if not ids:
+        return
+    documents = await collection.find(
+        {"_id": {"$in": ids}}, projection=DESCRIPTION_INDEX_PROJECTION
+    ).to_list(length=None)
+    index.add_documents(documents)
+    for doc_id in set(ids) - {document["_id"] for document in documents}:
+        index.remove(doc_id)
+
+
+async def sync_updated_descriptions(
+    collection, index: DescriptionIndex, since: datetime
+) -> None:
+    documents = await collection.find(
+        {"updated": {"$gte": since}}, projection=DESCRIPTION_INDEX_PROJECTION
+    ).to_list(length=None)
+    index.add_documents(documents)
+
+
+async def sync_description_indexes(
+    app: FastAPI,
+    interval: float = DESCRIPTION_INDEX_SYNC_INTERVAL,
+    max_age: float = DESCRIPTION_INDEX_MAX_AGE,
+) -> None:
+    """
+    Reconcile the description indexes with Mongo every ``interval`` seconds.
+
+    Each pass re-reads the documents ``updated`` since the previous one, which covers
+    invalidations this worker never received. Once the indexes are ``max_age``
+    seconds old they are reloaded instead, for writes that bypass the app.
+    """
+    database = app.state.mongo_database
+    indexes = [
+        (database.get_collection("laf_items"), laf_items_description_index),
+        (database.get_collection("lost_reports"), lost_reports_description_index),
+    ]
+    synced_at = loaded_at = datetime.now()
+    while True:
+        await sleep(interval)
+        started_at = datetime.now()
+        reload = started_at - loaded_at >= timedelta(seconds=max_age)
+        # Overlap the previous pass by an interval for clock skew between workers
+        since = synced_at - timedelta(seconds=interval)
+        try:
+            for collection, index in indexes:
+                if reload:
+                    await load_description_index(collection, index)
+                else:
+                    await sync_updated_descriptions(collection, index, since)
+        except Exception:
+            logger.exception("Failed to sync the description search indexes")
+            continue
+        if reload:
+            loaded_at = started_at
+        synced_at = started_at
+
+
+def query_filter_key(query_data: dict) -> tuple:
+    """Hashable, order-insensitive form of a LAF item or lost report filter dict."""
+    normalized = []
+    for k, v in sorted(query_data.items()):
+        if k == "description":
+            v = normalize_search_text(v or "") or None
+        elif isinstance(v, list):
+            v = tuple(sorted(v))
+        if v is not None:
+            normalized.append((k, v))
+    return tuple(normalized)
+
+
+def description_prefilter(
+    index: DescriptionIndex, description_query: str, archived: bool
+) -> dict | None:
+    # The in-memory index widens the query to words containing it, and turns the
+    # match into an _id lookup unless that would be larger than the token $in
+    matching_tokens = index.matching_tokens(description_query)
+    candidate_ids = (
+        None if matching_tokens is None else index.candidates(matching_tokens, archived)
+    )
+    return build_description_prefilter(
+        description_query, matching_tokens, candidate_ids
+    )
+
+
+async def reload_laf_types_after_miss(request: Request, *keys) -> bool:
+    """
+    Reload the type registry for a lookup miss, unless every key missed recently.
+
+    Types added by another worker only show up here after a reload, so a miss is
+    worth one more look; negative caching keeps repeated bad lookups off Mongo, and
+    concurrent misses share one reload.
+    """
+    if all(laf_type_registry.recently_missed(key) for key in keys):
+        return False
+    await laf_type_registry.reload_after_miss(
+        request.app.state.mongo_database.get_collection("laf_types")
+    )
+    return True
+
+
+async def reload_expired_laf_types(request: Request) -> None:
+    if laf_type_registry.expired():
+        await laf_type_registry.reload_after_miss(
+            request.app.state.mongo_database.get_collection("laf_types")
+        )
+
+
+async def get_type_id(request: Request, type_in: str) -> ObjectId:
+    # Exact stored name first, then the unescape/casefold form for historical data
+    # where "&" may have been stored as "&amp;" (or vice versa) due to sanitization.
+    await reload_expired_laf_types(request)
+    type_id = laf_type_registry.id_for(type_in)
+    if type_id is None and await reload_laf_types_after_miss(request, type_in):
+        type_id = laf_type_registry.id_for(type_in)
+    if type_id is None:
+        laf_type_registry.record_miss(type_in)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="LAF Type not found"
+        )
+    return type_id
+
+
 async def get_type_from_id(request: Request, id: ObjectId) -> dict:
-    laf_types_collection = request.app.state.mongo_database.get_collection("laf_types")
-    laf_type = await laf_types_collection.find_one({"_id": id})
-    if not laf_type:
+    return (await get_types_by_ids(request, (id,)))[id]
+
+
+async def get_types_by_ids(
+    request: Request, type_ids: tuple[ObjectId, ...]
+) -> dict[ObjectId, dict]:
+    """Resolve several type ids from the registry, reloading it at most once a miss."""
+    await reload_expired_laf_types(request)
+    missing = [
+        type_id for type_id in type_ids if laf_type_registry.get(type_id) is None
+    ]
+    if missing and await reload_laf_types_after_miss(request, *missing):
+        missing = [
+            type_id for type_id in missing if laf_type_registry.get(type_id) is None
+        ]
+    if missing:
+        for type_id in missing:
+            laf_type_registry.record_miss(type_id)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="LAF Type not found"
         )
-    if isinstance(laf_type.get("type"), str):
-        laf_type["type"] = unescape(laf_type["type"])
-    return laf_type
+    return {type_id: laf_type_registry.get(type_id) for type_id in type_ids}
+
+
+# Fields each helper below reads, so cursors skip decoding the rest of the document
+LAF_ITEM_PROJECTION = {
+    "_id": 1,
+    "type_id": 1,
+    "location": 1,
+    "date": 1,
+    "description": 1,
+}
+ARCHIVED_LAF_ITEM_PROJECTION = {
+    **LAF_ITEM_PROJECTION,
+    "found": 1,
+    "archived": 1,
+    "name": 1,
+    "email": 1,
+    "returned": 1,
+}
+LOST_REPORT_PROJECTION = {
+    "_id": 1,
+    "name": 1,
+    "email": 1,
+    "type_id": 1,
+    "location": 1,
+    "date": 1,
+    "description": 1,
+    "found": 1,
+    "archived": 1,
+}
+# Stored search fields read by rank_cursor_by_description
+DESCRIPTION_SEARCH_PROJECTION = {"description_norm": 1, "description_tokens": 1}
+
+
+async def resolve_laf_types(request: Request, docs: list[dict]) -> dict[ObjectId, dict]:
+    """Types for every distinct ``type_id`` in ``docs``, in a single lookup."""
+    type_ids = tuple(sorted({doc["type_id"] for doc in docs}, key=str))
+    if not type_ids:
+        return {}
+    return await get_types_by_ids(request, type_ids)
 
 
 # Helper functions to convert MongoDB documents to Python dictionaries
-async def laf_helper(request: Request, laf: dict) -> LAFItem:
+def format_laf_item(laf: dict, laf_type: dict) -> LAFItem:
     date = laf["date"]
-    laf_type = await get_type_from_id(request, laf["type_id"])
 
     return {
         "id": laf["_id"],
@@ -135,10 +406,17 @@ async def laf_helper(request: Request, laf: dict) -> LAFItem:
     }
 
 
-async def laf_archived_helper(request: Request, laf: dict) -> ArchivedLAFItem:
-    returned_date = laf["returned"]
+def format_returned_date(returned: datetime | str | None) -> str | None:
+    # found_laf_item stores a datetime, add_laf stores None until the item is found
+    if returned is None:
+        return None
+    if isinstance(returned, datetime):
+        return returned.strftime("%m/%d/%Y")
+    return f"{returned[5:7]}/{returned[8:]}/{returned[:4]}"
+
+
+def format_archived_laf_item(laf: dict, laf_type: dict) -> ArchivedLAFItem:
     date = laf["date"]
-    laf_type = await get_type_from_id(request, laf["type_id"])
 
     return {
         "id": laf["_id"],
@@ -151,13 +429,12 @@ async def laf_archived_helper(request: Request, laf: dict) -> ArchivedLAFItem:
         "archived": laf["archived"],
         "name": laf["name"],
         "email": laf["email"],
-        "returned": f"{returned_date[5:7]}/{returned_date[8:]}/{returned_date[:4]}",
+        "returned": format_returned_date(laf.get("returned")),
     }
 
 
-async def lost_report_helper(request: Request, lost_report: dict) -> LostReportItem:
+def format_lost_report(lost_report: dict, laf_type: dict) -> LostReportItem:
     date = lost_report["date"]
-    laf_type = await get_type_from_id(request, lost_report["type_id"])
 
     return {
         "id": str(lost_report["_id"]),
@@ -172,9 +449,112 @@ async def lost_report_helper(request: Request, lost_report: dict) -> LostReportI
     }
 
 
+async def laf_helper(request: Request, laf: dict) -> LAFItem:
+    return format_laf_item(laf, await get_type_from_id(request, laf["type_id"]))
+
+
+async def laf_archived_helper(request: Request, laf: dict) -> ArchivedLAFItem:
+    return format_archived_laf_item(
+        laf, await get_type_from_id(request, laf["type_id"])
+    )
+
+
+async def lost_report_helper(request: Request, lost_report: dict) -> LostReportItem:
+    return format_lost_report(
+        lost_report, await get_type_from_id(request, lost_report["type_id"])
+    )
+
+
+# Types can be deleted while rows still reference them. Exports keep those rows
+# with a blank type rather than failing partway through the stream.
+DELETED_LAF_TYPE = {"type": "", "letter": ""}
+
+
+async def export_laf_items(
+    request: Request, archived: bool = True
+) -> AsyncIterator[ArchivedLAFItem]:
+    """Every LAF item with the given archived state, newest first, one at a time."""
+    laf_items_collection = request.app.state.mongo_database.get_collection("laf_items")
+    laf_item_cursor = (
+        laf_items_collection.find(
+            {"archived": archived}, projection=ARCHIVED_LAF_ITEM_PROJECTION
+        )
+        .sort(PAGE_SORT)
+        .batch_size(EXPORT_BATCH_SIZE)
+    )
+    async for laf_item in laf_item_cursor:
+        try:
+            row = await laf_archived_helper(request, laf_item)
+        except HTTPException:
+            row = format_archived_laf_item(laf_item, DELETED_LAF_TYPE)
+        yield row
+
+
+async def export_lost_reports(
+    request: Request, archived: bool = True
+) -> AsyncIterator[LostReportItem]:
+    """Every lost report with the given archived state, newest first, one at a time."""
+    lost_reports_collection = request.app.state.mongo_database.get_collection(
+        "lost_reports"
+    )
+    lost_report_cursor = (
+        lost_reports_collection.find(
+            {"archived": archived}, projection=LOST_REPORT_PROJECTION
+        )
+        .sort(PAGE_SORT)
+        .batch_size(EXPORT_BATCH_SIZE)
+    )
+    async for lost_report in lost_report_cursor:
+        try:
+            row = await lost_report_helper(request, lost_report)
+        except HTTPException:
+            row = format_lost_report(lost_report, DELETED_LAF_TYPE)
+        yield row
+
+
+async def laf_items_helper(
+    request: Request, laf_items: list[dict], archived: bool = False
+) -> list[LAFItem] | list[ArchivedLAFItem]:
+    """Format a page of LAF items with one type lookup instead of one per row."""
+    laf_types = await resolve_laf_types(request, laf_items)
+    formatter = format_archived_laf_item if archived else format_laf_item
+    return [formatter(laf, laf_types[laf["type_id"]]) for laf in laf_items]
+
+
+async def lost_reports_helper(
+    request: Request, lost_reports: list[dict]
+) -> list[LostReportItem]:
+    """Format a page of lost reports with one type lookup instead of one per row."""
+    laf_types = await resolve_laf_types(request, lost_reports)
+    return [
+        format_lost_report(lost_report, laf_types[lost_report["type_id"]])
+        for lost_report in lost_reports
+    ]
+
+
 # LAF Queries
 
 
+def new_laf_document(
+    laf_data: dict, laf_id: int, type_id: ObjectId, now: datetime
+) -> dict:
+    type_name = laf_data["type"]
+    laf_data = {key: value for key, value in laf_data.items() if key != "type"}
+    laf_data["_id"] = laf_id
+    laf_data["description"] = laf_data["description"].strip()
+    laf_data.update(search_fields(laf_data["description"]))
+    laf_data["found"] = False
+    laf_data["archived"] = False
+    laf_data["created"] = now
+    laf_data["updated"] = now
+    laf_data["name"] = None
+    laf_data["email"] = None
+    laf_data["returned"] = None
+    laf_data["type_id"] = type_id
+    laf_data.update(expiry_fields(laf_data["date"], type_name))
+    return laf_data
+
+
 # Add a new laf item into to the database
 async def add_laf(request: Request, laf_data: dict) -> LAFItem:
     reject_mongo_operators(laf_data)
@@ -183,32 +563,71 @@ async def add_laf(request: Request, laf_data: dict) -> LAFItem:
     laf_items_collection = database.get_collection("laf_items")
 
     type_id = await get_type_id(request, laf_data["type"])
-    del laf_data["type"]
+    laf_id = await sequence_allocator.next(
+        "laf_id",
+        sequence_id_collection,
+        laf_items_collection,
+    )
+    laf_data = new_laf_document(laf_data, laf_id, type_id, datetime.now())
 
-    now = datetime.now()
+    # The response is formatted from the document just written, not read back
+    await insert_sequenced(
+        laf_items_collection, laf_data, "laf_id", sequence_id_collection
+    )
+    laf_items_description_index.add(laf_data["_id"], laf_data["description"])
+    await invalidation_bus.publish(request, "laf_items", [laf_data["_id"]])
+    return await laf_helper(request, laf_data)
+
+
+# Add a batch of laf items with one sequence reservation and one insert
+async def add_laf_items(request: Request, laf_items_data: list[dict]) -> list[LAFItem]:
+    for laf_data in laf_items_data:
+        reject_mongo_operators(laf_data)
+    database = request.app.state.mongo_database
+    sequence_id_collection = database.get_collection("sequence_id")
+    laf_items_collection = database.get_collection("laf_items")
 
-    laf_data["_id"] = await get_next_sequence_value(
+    type_ids = {
+        type_name: await get_type_id(request, type_name)
+        for type_name in dict.fromkeys(laf_data["type"] for laf_data in laf_items_data)
+    }
+    first_id = await reserve_sequence_block(
         "laf_id",
         sequence_id_collection,
         laf_items_collection,
+        len(laf_items_data),
     )
-    laf_data["description"] = laf_data["description"].strip()
-    laf_data["found"] = False
-    laf_data["archived"] = False
-    laf_data["created"] = now
-    laf_data["updated"] = now
-    laf_data["name"] = None
-    laf_data["email"] = None
-    laf_data["returned"] = None
-    laf_data["type_id"] = type_id
+    now = datetime.now()
+    laf_docs = [
+        new_laf_document(laf_data, laf_id, type_ids[laf_data["type"]], now)
+        for laf_id, laf_data in enumerate(laf_items_data, start=first_id)
+    ]
+
+    try:
+        await laf_items_collection.insert_many(laf_docs)
+    except BulkWriteError as error:
+        # The insert is ordered, so every document before the failing one was saved
+        inserted = laf_docs[: error.details.get("nInserted", 0)]
+        await record_new_laf_items(request, inserted)
+        logger.exception("Bulk LAF insert stopped after %d items", len(inserted))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "message": "Only some LAF items were added",
+                "data": await laf_items_helper(request, inserted),
+            },
+        )
+    await record_new_laf_items(request, laf_docs)
+    return await laf_items_helper(request, laf_docs)
+
 
-    laf_item = await laf_items_collection.insert_one(laf_data)
-    new_laf_item = await laf_items_collection.find_one({"_id": laf_item.inserted_id})
-    if new_laf_item:
-        return await laf_helper(request, new_laf_item)
-    raise HTTPException(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        detail="Failed to create LAF item",
+async def record_new_laf_items(request: Request, laf_docs: list[dict]) -> None:
+    if not laf_docs:
+        return
+    for laf_doc in laf_docs:
+        laf_items_description_index.add(laf_doc["_id"], laf_doc["description"])
+    await invalidation_bus.publish(
+        request, "laf_items", [laf_doc["_id"] for laf_doc in laf_docs]
     )
 
 
@@ -218,22 +637,26 @@ async def update_laf(
     reject_mongo_operators(laf_data)
     laf_items_collection = request.app.state.mongo_database.get_collection("laf_items")
 
-    laf_item = await laf_items_collection.find_one({"_id": laf_id})
-    if laf_item is None:
-        return False
-
     laf_data["updated"] = now
+    if "description" in laf_data:
+        laf_data.update(search_fields(laf_data["description"]))
+    # Item edits always carry both; found_laf_item changes neither
+    if "date" in laf_data and laf_data.get("type"):
+        laf_data.update(expiry_fields(laf_data["date"], laf_data["type"]))
     if laf_data.get("type", False):
         type_id = await get_type_id(request, laf_data["type"])
         del laf_data["type"]
         laf_data["type_id"] = type_id
-    updated_laf_item = await laf_items_collection.update_one(
-        {"_id": laf_id}, {"$set": laf_data}
-    )
-    if updated_laf_item.modified_count == 1:
-        return True
+    if not await update_by_id(laf_items_collection, laf_id, laf_data):
+        return False
 
-    return False
+    laf_items_description_index.update(
+        laf_id,
+        description=laf_data.get("description"),
+        archived=laf_data.get("archived"),
+    )
+    await invalidation_bus.publish(request, "laf_items", [laf_id])
+    return True
 
 
 async def found_laf_item(request: Request, laf_id: int, laf_found: dict) -> bool:
@@ -259,6 +682,8 @@ async def archive_laf_items(request: Request, ids: list[int]) -> None:
         {"_id": {"$in": ids}},
         {"$set": {"archived": True, "updated": now}},
     )
+    laf_items_description_index.set_archived(ids)
+    await invalidation_bus.publish(request, "laf_items", ids)
 
 
 laf_item_query_mapping = {
@@ -271,10 +696,33 @@ laf_item_query_mapping = {
 }
 
 
+def paged_query(query: dict, description_query: str, cursor: str | None) -> dict:
+    if cursor is None:
+        return query
+    if description_query:
+        # Ranked results are ordered by score, not by the keyset
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Description searches cannot be paged with a cursor",
+        )
+    return {"$and": [query, after_cursor(cursor)]}
+
+
 # Retrieve all relevant laf items from the database
 async def retrieve_laf_items(
-    request: Request, laf_query_data: dict, archived: bool = False
-) -> list:
+    request: Request,
+    laf_query_data: dict,
+    archived: bool = False,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    cursor: str | None = None,
+) -> Page:
+    cache_key = laf_query_cache.key(
+        "laf_items", archived, query_filter_key(laf_query_data), limit, cursor
+    )
+    cached_page = laf_query_cache.get(cache_key)
+    if cached_page is not None:
+        return cached_page
+
     laf_items_collection = request.app.state.mongo_database.get_collection("laf_items")
     query: dict[str, Union[bool, dict, ObjectId, str, int]] = {"archived": archived}
     description_query = normalize_search_text(laf_query_data.get("description") or "")
@@ -289,222 +737,227 @@ async def retrieve_laf_items(
             elif k == "type" and v:
                 query["type_id"] = await get_type_id(request, v)
 
-    if description_query and not laf_query_data["id"]:
-        description_prefilter = build_description_prefilter(description_query)
-        if description_prefilter:
-            query.update(description_prefilter)
-
-    db_limit = (
-        DESCRIPTION_SEARCH_CANDIDATE_LIMIT
-        if description_query and not laf_query_data["id"]
-        else DESCRIPTION_SEARCH_RESULT_LIMIT
-    )
-
-    laf_item_docs = []
-    async for laf_item in (
-        laf_items_collection.find(query).sort("date", -1).limit(db_limit)
-    ):
-        laf_item_docs.append(laf_item)
-
-    if description_query and not laf_query_data["id"]:
-        laf_item_docs = await rank_by_description_async(
-            laf_item_docs, description_query
+    if laf_query_data["id"]:
+        description_query = ""
+    if description_query:
+        prefilter = description_prefilter(
+            laf_items_description_index, description_query, archived
         )
+        if prefilter:
+            query.update(prefilter)
 
-    laf_items = []
-    for laf_item in laf_item_docs:
-        if archived:
-            laf_items.append(await laf_archived_helper(request, laf_item))
-        else:
-            laf_items.append(await laf_helper(request, laf_item))
-    return laf_items
+    # One row past the page tells whether there is a next one
+    db_limit = DESCRIPTION_SEARCH_CANDIDATE_LIMIT if description_query else limit + 1
 
+    projection = ARCHIVED_LAF_ITEM_PROJECTION if archived else LAF_ITEM_PROJECTION
+    if description_query:
+        projection = {**projection, **DESCRIPTION_SEARCH_PROJECTION}
+    laf_item_cursor = (
+        laf_items_collection.find(
+            paged_query(query, description_query, cursor), projection=projection
+        )
+        .sort(PAGE_SORT)
+        .limit(db_limit)
+    )
+    if description_query:
+        ranked = await rank_cursor_by_description(
+            laf_item_cursor, description_query, executor=ranking_executor, k=limit
+        )
+        laf_item_docs, next_cursor = ranked[:limit], None
+    else:
+        laf_item_docs, next_cursor = split_page(
+            [laf_item async for laf_item in laf_item_cursor], limit
+        )
 
-@cached(ttl=86400, key_builder=cache_key_exclude_request)
-async def water_bottle_expiration_query(
-    request: Request, wb: int, c: int, u: int, now: datetime
-) -> dict:
-    cutoff_date = await datetime_time_delta(now, wb)
-    type_id = await get_type_id(request, "Water Bottle")
-    return {
-        "type_id": type_id,
-        "date": {"$lte": cutoff_date},
-    }
+    page = Page(await laf_items_helper(request, laf_item_docs, archived), next_cursor)
+    laf_query_cache.set(cache_key, page)
+    return page
 
 
-@cached(ttl=86400, key_builder=cache_key_exclude_request)
-async def attire_expiration_query(
-    request: Request, wb: int, c: int, u: int, now: datetime
+async def type_expiration_query(
+    request: Request, type_name: str, days: int, day: date
 ) -> dict:
-    cutoff_date = await datetime_time_delta(now, c)
-    type_id = await get_type_id(request, "Attire")
-
     return {
-        "type_id": type_id,
-        "date": {"$lte": cutoff_date},
+        "type_id": await get_type_id(request, type_name),
+        "date": {"$lte": expiry_cutoff(day, days)},
     }
 
 
-@cached(ttl=86400, key_builder=cache_key_exclude_request)
-async def umbrella_expiration_query(
-    request: Request, wb: int, c: int, u: int, now: datetime
-) -> dict:
-    cutoff_date = await datetime_time_delta(now, u)
-    type_id = await get_type_id(request, "Umbrellas")
-
-    return {
-        "type_id": type_id,
-        "date": {"$lte": cutoff_date},
-    }
-
-
-type_expiration_mapping = {
-    "Water Bottle": water_bottle_expiration_query,
-    "Attire": attire_expiration_query,
-    "Umbrellas": umbrella_expiration_query,
-}
-
-
 async def fetch_expired_laf_items(
     request: Request, expired_query: dict
 ) -> list[LAFItem]:
     laf_items_collection = request.app.state.mongo_database.get_collection("laf_items")
-    expired_laf_items = []
-    async for laf_item in (
-        laf_items_collection.find(expired_query).sort("date", -1).limit(30)
-    ):
-        expired_laf_items.append(await laf_helper(request, laf_item))
+    expired_laf_items = await (
+        laf_items_collection.find(expired_query, projection=LAF_ITEM_PROJECTION)
+        .sort("date", -1)
+        .limit(30)
+        .to_list(length=None)
+    )
 
-    return expired_laf_items
+    return await laf_items_helper(request, expired_laf_items)
 
 
 async def fetch_potentially_expired_laf_items(
     request: Request, potentially_expired_query: dict
 ) -> list[LAFItem]:
     laf_items_collection = request.app.state.mongo_database.get_collection("laf_items")
-    potentially_expired_laf_items = []
-    async for laf_item in (
-        laf_items_collection.find(potentially_expired_query).sort("date", -1).limit(30)
-    ):
-        potentially_expired_laf_items.append(await laf_helper(request, laf_item))
+    potentially_expired_laf_items = await (
+        laf_items_collection.find(
+            potentially_expired_query, projection=LAF_ITEM_PROJECTION
+        )
+        .sort("date", -1)
+        .limit(30)
+        .to_list(length=None)
+    )
 
-    return potentially_expired_laf_items
+    return await laf_items_helper(request, potentially_expired_laf_items)
 
 
-async def retrieve_expired_laf(
-    request: Request,
-    water_bottle_expiration: int,
-    attire_expiration: int,
-    umbrella_expiration: int,
-    inexpensive_expiration: int,
-    expensive_expiration: int,
-    type: str,
+async def retrieve_materialized_expired_laf(
+    request: Request, type: str, now: datetime
 ) -> ExpiredItem:
-    now = datetime.now()
+    """
+    ``retrieve_expired_laf`` under ``LAF_EXPIRY_POLICY``, from the stored fields.
+
+    Items written before the fields existed match through a second branch with the
+    per-request cutoffs, so the lists stay complete until ``rematerialize_expiry``
+    has run; after that the branch is an empty range of the ``expires_at`` index.
+    """
+    today = expiry_day(now)
+    cutoff_expired, cutoff_potential = await cutoff_expiry_queries(
+        request, LAF_EXPIRY_POLICY, type, today.date()
+    )
+    expired_query = {"archived": False, "expires_at": {"$lte": today}}
 
     if type == "All":
-        wb, a, u, expensive_cutoff_date, inexpensive_cutoff_date = await gather(
-            water_bottle_expiration_query(
-                request,
-                water_bottle_expiration,
-                attire_expiration,
-                umbrella_expiration,
-                now,
-            ),
-            attire_expiration_query(
-                request,
-                water_bottle_expiration,
-                attire_expiration,
-                umbrella_expiration,
-                now,
-            ),
-            umbrella_expiration_query(
-                request,
-                water_bottle_expiration,
-                attire_expiration,
-                umbrella_expiration,
-                now,
-            ),
-            datetime_time_delta(now, expensive_expiration),
-            datetime_time_delta(now, inexpensive_expiration),
+        # Every type shows here by age alone, whatever its own schedule
+        potentially_expired_query = cutoff_potential
+    else:
+        expired_query["type_id"] = cutoff_expired["type_id"]
+        if cutoff_potential is None:
+            return {
+                "expired": await fetch_expired_laf_items(
+                    request, unmaterialized_or(expired_query, cutoff_expired)
+                ),
+                "potential": [],
+            }
+        potentially_expired_query = unmaterialized_or(
+            {
+                "archived": False,
+                "type_id": expired_query["type_id"],
+                "potentially_expires_at": {"$lte": today},
+                "expires_at": {"$gt": today},
+            },
+            cutoff_potential,
+        )
+
+    expired_laf_items, potentially_expired_laf_items = await gather(
+        fetch_expired_laf_items(
+            request, unmaterialized_or(expired_query, cutoff_expired)
+        ),
+        fetch_potentially_expired_laf_items(request, potentially_expired_query),
+    )
+
+    return {
+        "expired": expired_laf_items,
+        "potential": potentially_expired_laf_items,
+    }
+
+
+def unmaterialized_or(materialized_query: dict, cutoff_query: dict) -> dict:
+    """``materialized_query``, or ``cutoff_query`` for items without stored expiry."""
+    return {
+        "$or": [
+            materialized_query,
+            {**cutoff_query, "expires_at": {"$exists": False}},
+        ]
+    }
+
+
+async def cutoff_expiry_queries(
+    request: Request, policy: ExpiryPolicy, type: str, day: date
+) -> tuple[dict, dict | None]:
+    """
+    Expired and potentially expired queries from date cutoffs computed for ``day``.
+
+    Types on their own schedule have no potentially expired list, so their second
+    query is ``None``.
+    """
+    type_field = expiry_policy_field(type)
+    if type_field is not None:
+        expired_query = {"archived": False}
+        expired_query.update(
+            await type_expiration_query(request, type, getattr(policy, type_field), day)
         )
+        return expired_query, None
 
-        type_ids = []
-        for type_name in type_expiration_mapping.keys():
-            type_id = await get_type_id(request, type_name)
-            type_ids.append(type_id)
+    expensive_cutoff_date = expiry_cutoff(day, policy.expensive)
+    inexpensive_cutoff_date = expiry_cutoff(day, policy.inexpensive)
+    potentially_expired_query = {
+        "archived": False,
+        "date": {"$lte": inexpensive_cutoff_date, "$gt": expensive_cutoff_date},
+    }
 
+    if type == "All":
+        type_queries = [
+            await type_expiration_query(request, type_name, getattr(policy, field), day)
+            for type_name, field in EXPIRY_POLICY_TYPES.items()
+        ]
         expired_query = {
             "archived": False,
             "$or": [
-                wb,
-                a,
-                u,
+                *type_queries,
                 {
-                    "type_id": {"$nin": type_ids},
+                    "type_id": {
+                        "$nin": [type_query["type_id"] for type_query in type_queries]
+                    },
                     "date": {"$lte": expensive_cutoff_date},
                 },
             ],
         }
-
-        potentially_expired_query = {
+    else:
+        type_id = await get_type_id(request, type)
+        expired_query = {
             "archived": False,
-            "date": {"$lte": inexpensive_cutoff_date, "$gt": expensive_cutoff_date},
+            "date": {"$lte": expensive_cutoff_date},
+            "type_id": type_id,
         }
+        potentially_expired_query["type_id"] = type_id
 
-        expired_laf_items, potentially_expired_laf_items = await gather(
-            fetch_expired_laf_items(request, expired_query),
-            fetch_potentially_expired_laf_items(request, potentially_expired_query),
-        )
+    return expired_query, potentially_expired_query
 
-        return {
-            "expired": expired_laf_items,
-            "potential": potentially_expired_laf_items,
-        }
 
-    if type in type_expiration_mapping:
-        laf_items_collection = request.app.state.mongo_database.get_collection(
-            "laf_items"
-        )
-        query = {"archived": False}
-        query.update(
-            await type_expiration_mapping[type](
-                request,
-                water_bottle_expiration,
-                attire_expiration,
-                umbrella_expiration,
-                now,
-            )
-        )
+async def retrieve_expired_laf(
+    request: Request,
+    water_bottle_expiration: int,
+    attire_expiration: int,
+    umbrella_expiration: int,
+    inexpensive_expiration: int,
+    expensive_expiration: int,
+    type: str,
+) -> ExpiredItem:
+    now = datetime.now()
 
-        laf_items = []
-        async for laf_item in (
-            laf_items_collection.find(query).sort("date", -1).limit(30)
-        ):
-            laf_items.append(await laf_helper(request, laf_item))
+    policy = ExpiryPolicy(
+        water_bottle_expiration,
+        attire_expiration,
+        umbrella_expiration,
+        inexpensive_expiration,
+        expensive_expiration,
+    )
+    if policy == LAF_EXPIRY_POLICY:
+        return await retrieve_materialized_expired_laf(request, type, now)
 
+    # Ad hoc thresholds: cutoffs computed per request
+    expired_query, potentially_expired_query = await cutoff_expiry_queries(
+        request, policy, type, now.date()
+    )
+    if potentially_expired_query is None:
         return {
-            "expired": laf_items,
+            "expired": await fetch_expired_laf_items(request, expired_query),
             "potential": [],
         }
 
-    expensive_cutoff_date, inexpensive_cutoff_date = await gather(
-        datetime_time_delta(now, expensive_expiration),
-        datetime_time_delta(now, inexpensive_expiration),
-    )
-
-    type_id = await get_type_id(request, type)
-    expired_query = {
-        "archived": False,
-        "date": {"$lte": expensive_cutoff_date},
-        "type_id": type_id,
-    }
-    potentially_expired_query = {
-        "archived": False,
-        "date": {"$lte": inexpensive_cutoff_date, "$gt": expensive_cutoff_date},
-        "type_id": type_id,
-    }
-
     expired_laf_items, potentially_expired_laf_items = await gather(
         fetch_expired_laf_items(request, expired_query),
         fetch_potentially_expired_laf_items(request, potentially_expired_query),
@@ -532,6 +985,7 @@ async def add_lost_report(
     del lost_report_data["type"]
     now = datetime.now()
     lost_report_data["description"] = lost_report_data["description"].strip()
+    lost_report_data.update(search_fields(lost_report_data["description"]))
     lost_report_data["name"] = lost_report_data["name"].strip()
     lost_report_data["email"] = lost_report_data["email"].strip()
     lost_report_data["found"] = False
@@ -542,15 +996,12 @@ async def add_lost_report(
     lost_report_data["type_id"] = type_id
 
     lost_report = await lost_reports_collection.insert_one(lost_report_data)
-    new_lost_report = await lost_reports_collection.find_one(
-        {"_id": lost_report.inserted_id}
-    )
-    if new_lost_report:
-        return await lost_report_helper(request, new_lost_report)
-    raise HTTPException(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        detail="Failed to create Lost Report",
+    lost_report_data["_id"] = lost_report.inserted_id
+    lost_reports_description_index.add(
+        lost_report.inserted_id, lost_report_data["description"]
     )
+    await invalidation_bus.publish(request, "lost_reports", [lost_report.inserted_id])
+    return await lost_report_helper(request, lost_report_data)
 
 
 async def update_lost_report(
@@ -568,23 +1019,26 @@ async def update_lost_report(
     )
 
     lost_report_id_bson = ObjectId(lost_report_id)
-    lost_report = await lost_reports_collection.find_one({"_id": lost_report_id_bson})
-    if lost_report is None:
-        return False
-
     lost_report_data["updated"] = now
     lost_report_data["viewed"] = True
+    if "description" in lost_report_data:
+        lost_report_data.update(search_fields(lost_report_data["description"]))
     if lost_report_data.get("type", False):
         type_id = await get_type_id(request, lost_report_data["type"])
         del lost_report_data["type"]
         lost_report_data["type_id"] = type_id
-    updated_lost_report = await lost_reports_collection.update_one(
-        {"_id": lost_report_id_bson}, {"$set": lost_report_data}
-    )
-    if updated_lost_report.modified_count == 1:
-        return True
+    if not await update_by_id(
+        lost_reports_collection, lost_report_id_bson, lost_report_data
+    ):
+        return False
 
-    return False
+    lost_reports_description_index.update(
+        lost_report_id_bson,
+        description=lost_report_data.get("description"),
+        archived=lost_report_data.get("archived"),
+    )
+    await invalidation_bus.publish(request, "lost_reports", [lost_report_id_bson])
+    return True
 
 
 async def found_lost_report(request: Request, lost_report_id: str) -> bool:
@@ -620,14 +1074,15 @@ async def retrieve_new_lost_reports(request: Request, limit: int = 30) -> list:
     lost_reports_collection = request.app.state.mongo_database.get_collection(
         "lost_reports"
     )
-    lost_reports = []
-    async for laf_item in (
-        lost_reports_collection.find({"viewed": False, "archived": False})
+    lost_reports = await (
+        lost_reports_collection.find(
+            {"viewed": False, "archived": False}, projection=LOST_REPORT_PROJECTION
+        )
         .sort("date", -1)
         .limit(limit)
-    ):
-        lost_reports.append(await lost_report_helper(request, laf_item))
-    return lost_reports
+        .to_list(length=None)
+    )
+    return await lost_reports_helper(request, lost_reports)
 
 
 async def mark_lost_report_as_viewed(request: Request, lost_report_id: str) -> bool:
@@ -649,8 +1104,23 @@ lost_report_query_mapping = {
 
 # Retrieve all relevant lost reports from the database
 async def retrieve_lost_reports(
-    request: Request, lost_report_query_data: dict, archived: bool = False
-) -> list:
+    request: Request,
+    lost_report_query_data: dict,
+    archived: bool = False,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    cursor: str | None = None,
+) -> Page:
+    cache_key = laf_query_cache.key(
+        "lost_reports",
+        archived,
+        query_filter_key(lost_report_query_data),
+        limit,
+        cursor,
+    )
+    cached_page = laf_query_cache.get(cache_key)
+    if cached_page is not None:
+        return cached_page
+
     lost_reports_collection = request.app.state.mongo_database.get_collection(
         "lost_reports"
     )
@@ -667,62 +1137,66 @@ async def retrieve_lost_reports(
             query["type_id"] = await get_type_id(request, v)
 
     if description_query:
-        description_prefilter = build_description_prefilter(description_query)
-        if description_prefilter:
-            query.update(description_prefilter)
+        prefilter = description_prefilter(
+            lost_reports_description_index, description_query, archived
+        )
+        if prefilter:
+            query.update(prefilter)
 
-    db_limit = (
-        DESCRIPTION_SEARCH_CANDIDATE_LIMIT
-        if description_query
-        else DESCRIPTION_SEARCH_RESULT_LIMIT
-    )
-
-    lost_report_docs = []
-    async for lost_report in (
-        lost_reports_collection.find(query).sort("date", -1).limit(db_limit)
-    ):
-        lost_report_docs.append(lost_report)
+    db_limit = DESCRIPTION_SEARCH_CANDIDATE_LIMIT if description_query else limit + 1
 
+    projection = LOST_REPORT_PROJECTION
     if description_query:
-        lost_report_docs = await rank_by_description_async(
-            lost_report_docs, description_query
+        projection = {**projection, **DESCRIPTION_SEARCH_PROJECTION}
+    lost_report_cursor = (
+        lost_reports_collection.find(
+            paged_query(query, description_query, cursor), projection=projection
+        )
+        .sort(PAGE_SORT)
+        .limit(db_limit)
+    )
+    if description_query:
+        ranked = await rank_cursor_by_description(
+            lost_report_cursor, description_query, executor=ranking_executor, k=limit
+        )
+        lost_report_docs, next_cursor = ranked[:limit], None
+    else:
+        lost_report_docs, next_cursor = split_page(
+            [lost_report async for lost_report in lost_report_cursor], limit
         )
 
-    lost_reports = []
-    for lost_report in lost_report_docs:
-        lost_reports.append(await lost_report_helper(request, lost_report))
-    return lost_reports
+    page = Page(await lost_reports_helper(request, lost_report_docs), next_cursor)
+    laf_query_cache.set(cache_key, page)
+    return page
 
 
-@cached(ttl=86400, key_builder=cache_key_exclude_request)
 async def retrieve_laf_types(request: Request) -> list[str]:
-    laf_types_collection = request.app.state.mongo_database.get_collection("laf_types")
-    laf_types = await laf_types_collection.find({"view": True}).to_list(length=None)
-    return [
-        unescape(laf_type["type"])
-        if isinstance(laf_type.get("type"), str)
-        else laf_type["type"]
-        for laf_type in laf_types
-    ]
+    if not laf_type_registry.ready:
+        await laf_type_registry.reload(
+            request.app.state.mongo_database.get_collection("laf_types")
+        )
+    await reload_expired_laf_types(request)
+    return laf_type_registry.viewable()
 
 
 async def add_laf_type(request: Request, laf_type: str) -> bool:
     database = request.app.state.mongo_database
     laf_types_collection = database.get_collection("laf_types")
     laf_type_added = await laf_types_collection.insert_one({"type": laf_type})
-    new_laf_type = await laf_types_collection.find_one(
-        {"_id": laf_type_added.inserted_id}
-    )
-    return new_laf_type is not None
+    # The registry reloads through the bus; a failed reload is logged there and
+    # retried on the next lookup miss, so it does not decide whether the add worked
+    await invalidation_bus.publish(request, "laf_types")
+    return laf_type_added.inserted_id is not None
 
 
 async def delete_laf_type(request: Request, laf_type: str) -> bool:
     laf_types_collection = request.app.state.mongo_database.get_collection("laf_types")
     laf_type_deleted = await laf_types_collection.delete_one({"type": laf_type})
+    await invalidation_bus.publish(request, "laf_types")
     return laf_type_deleted.deleted_count > 0
 
 
-@cached(ttl=86400, key_builder=cache_key_exclude_request)
+@tiered_cached(ttl=CATALOG_CACHE_TTL, l1_ttl=CATALOG_L1_CACHE_TTL)
 async def retrieve_laf_locations(request: Request) -> list[str]:
     laf_locations_collection = request.app.state.mongo_database.get_collection(
         "laf_locations"
@@ -731,16 +1205,20 @@ async def retrieve_laf_locations(request: Request) -> list[str]:
     return laf_locations
 
 
+async def invalidate_laf_locations(request: Request) -> None:
+    # Retire the shared Valkey copy before other workers are told to refill from it
+    await retrieve_laf_locations.invalidate(request)
+    await invalidation_bus.publish(request, "laf_locations")
+
+
 async def add_laf_location(request: Request, laf_location: str) -> bool:
     database = request.app.state.mongo_database
     laf_locations_collection = database.get_collection("laf_locations")
     laf_location_added = await laf_locations_collection.insert_one(
         {"location": laf_location}
     )
-    new_laf_location = await laf_locations_collection.find_one(
-        {"_id": laf_location_added.inserted_id}
-    )
-    return new_laf_location is not None
+    await invalidate_laf_locations(request)
+    return laf_location_added.inserted_id is not None
 
 
 async def delete_laf_location(request: Request, laf_location: str) -> bool:
@@ -750,4 +1228,5 @@ async def delete_laf_location(request: Request, laf_location: str) -> bool:
     laf_location_deleted = await laf_locations_collection.delete_one(
         {"location": laf_location}
     )
+    await invalidate_laf_locations(request)
     return laf_location_deleted.deleted_count > 0
@@ -1,8 +1,22 @@
-from fastapi import HTTPException, Request, status
-
-from server.helpers.db import get_next_sequence_value
+from asyncio import Lock
+from time import monotonic
+from typing import NamedTuple
+
+from fastapi import FastAPI, Request
+
+from server.helpers.db import (
+    delete_by_id,
+    insert_sequenced,
+    sequence_allocator,
+    update_by_id,
+)
+from server.helpers.invalidation import invalidation_bus
 from server.helpers.sanitize import reject_mongo_operators
-from server.models.loanertech import LoanerTechItem, LoanerTechItemUnauthorized
+from server.models.loanertech import (
+    LoanerTechBulkStatus,
+    LoanerTechItem,
+    LoanerTechItemUnauthorized,
+)
 
 
 def loanertech_helper(loanertech: dict) -> LoanerTechItem:
@@ -24,30 +38,97 @@ def loanertech_helper_unprotected(loanertech: dict) -> LoanerTechItemUnauthorize
     }
 
 
+# Writes invalidate the snapshot over the bus; the age bound caps how long a worker
+# serves an old inventory if one of those messages never reaches it.
+LOANERTECH_SNAPSHOT_MAX_AGE = 300
+
+
+class LoanerTechSnapshot(NamedTuple):
+    version: int
+    items: list[LoanerTechItem]
+    public_items: list[LoanerTechItemUnauthorized]
+    loaded_at: float
+
+
+class LoanerTechInventory:
+    """
+    Process-local copy of ``loanertech_collection`` in both response shapes.
+
+    Writes bump ``version`` in every worker over the invalidation bus, and the next
+    read rebuilds the snapshot with one ``find``. A snapshot records the version it
+    was read under, so a write landing mid-rebuild leaves it stale and the read after
+    rebuilds again. A snapshot older than ``max_age`` is rebuilt too. Each snapshot
+    keeps its lists until replaced; callers must not mutate them, as their identity
+    keys the encoded response bodies.
+    """
+
+    def __init__(self, max_age: float = LOANERTECH_SNAPSHOT_MAX_AGE) -> None:
+        self.version = 0
+        self.max_age = max_age
+        self._snapshot: LoanerTechSnapshot | None = None
+        self._lock = Lock()
+
+    def invalidate(self) -> None:
+        self.version += 1
+
+    def load(self, loanertechs: list[dict], version: int) -> LoanerTechSnapshot:
+        self._snapshot = LoanerTechSnapshot(
+            version,
+            [loanertech_helper(loanertech) for loanertech in loanertechs],
+            [loanertech_helper_unprotected(loanertech) for loanertech in loanertechs],
+            monotonic(),
+        )
+        return self._snapshot
+
+    def _current(self, snapshot: LoanerTechSnapshot | None) -> bool:
+        return (
+            snapshot is not None
+            and snapshot.version == self.version
+            and monotonic() - snapshot.loaded_at <= self.max_age
+        )
+
+    async def snapshot(self, loanertech_collection) -> LoanerTechSnapshot:
+        snapshot = self._snapshot
+        if self._current(snapshot):
+            return snapshot
+        async with self._lock:
+            # Concurrent misses wait for one rebuild instead of each scanning
+            snapshot = self._snapshot
+            if self._current(snapshot):
+                return snapshot
+            version = self.version
+            loanertechs = (
+                await loanertech_collection.find().sort("_id").to_list(length=None)
+            )
+            return self.load(loanertechs, version)
+
+
+loanertech_inventory = LoanerTechInventory()
+
+
+@invalidation_bus.on("loanertech")
+async def _invalidate_loanertech_inventory(app: FastAPI) -> None:
+    loanertech_inventory.invalidate()
+
+
+async def loanertech_snapshot(request: Request) -> LoanerTechSnapshot:
+    return await loanertech_inventory.snapshot(
+        request.app.state.mongo_database.get_collection("loanertech_collection")
+    )
+
+
 # Retrieve all loaner tech items present in the database with data
 # for unauthenticated users
 async def retrieve_loanertechs_unauthenticated(
     request: Request,
 ) -> list[LoanerTechItemUnauthorized]:
-    loanertech_collection = request.app.state.mongo_database.get_collection(
-        "loanertech_collection"
-    )
-    loanertechs = []
-    async for loanertech in loanertech_collection.find().sort("_id"):
-        loanertechs.append(loanertech_helper_unprotected(loanertech))
-    return loanertechs
+    return (await loanertech_snapshot(request)).public_items
 
 
 # Retrieve all loaner tech items present in the database with
 # data for authenticated users
 async def retrieve_loanertechs(request: Request) -> list[LoanerTechItem]:
-    loanertech_collection = request.app.state.mongo_database.get_collection(
-        "loanertech_collection"
-    )
-    loanertechs = []
-    async for loanertech in loanertech_collection.find().sort("_id"):
-        loanertechs.append(loanertech_helper(loanertech))
-    return loanertechs
+    return (await loanertech_snapshot(request)).items
 
 
 # Add a new loanertech item into to the database
@@ -57,7 +138,7 @@ async def add_loanertech(request: Request, loanertech_data: dict) -> LoanerTechI
     sequence_id_collection = database.get_collection("sequence_id")
     loanertech_collection = database.get_collection("loanertech_collection")
 
-    loanertech_data["_id"] = await get_next_sequence_value(
+    loanertech_data["_id"] = await sequence_allocator.next(
         "loanertech_id",
         sequence_id_collection,
         loanertech_collection,
@@ -67,16 +148,11 @@ async def add_loanertech(request: Request, loanertech_data: dict) -> LoanerTechI
     loanertech_data["email"] = ""
     loanertech_data["name"] = ""
 
-    loanertech = await loanertech_collection.insert_one(loanertech_data)
-    new_loanertech = await loanertech_collection.find_one(
-        {"_id": loanertech.inserted_id}
-    )
-    if new_loanertech:
-        return loanertech_helper(new_loanertech)
-    raise HTTPException(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        detail="Failed to create Loanertech",
+    await insert_sequenced(
+        loanertech_collection, loanertech_data, "loanertech_id", sequence_id_collection
     )
+    await invalidation_bus.publish(request, "loanertech")
+    return loanertech_helper(loanertech_data)
 
 
 # Retrieve a loanertech item with a matching ID
@@ -98,14 +174,35 @@ async def update_loanertech(request: Request, id: int, data: dict) -> bool:
     loanertech_collection = request.app.state.mongo_database.get_collection(
         "loanertech_collection"
     )
-    loanertech = await loanertech_collection.find_one({"_id": id})
-    if loanertech:
-        updated_loanertech = await loanertech_collection.update_one(
-            {"_id": id}, {"$set": data}
-        )
-        if updated_loanertech:
-            return True
-    return False
+    if not await update_by_id(loanertech_collection, id, data):
+        return False
+    await invalidation_bus.publish(request, "loanertech")
+    return True
+
+
+# Apply the same fields to several loanertech items, all or none
+async def update_loanertechs(
+    request: Request, ids: list[int], data: dict
+) -> dict[int, LoanerTechBulkStatus]:
+    """
+    ``$set`` ``data`` on every item in ``ids`` with one ``$in`` lookup and one
+    ``update_many``. If any id is unknown nothing is written, so a checkout never
+    half succeeds: unknown ids come back ``not_found`` and the rest ``skipped``.
+    """
+    reject_mongo_operators(data)
+    ids = list(dict.fromkeys(ids))
+    if not ids:
+        return {}
+    loanertech_collection = request.app.state.mongo_database.get_collection(
+        "loanertech_collection"
+    )
+    found = set(await loanertech_collection.distinct("_id", {"_id": {"$in": ids}}))
+    if len(found) < len(ids):
+        return {id: "skipped" if id in found else "not_found" for id in ids}
+
+    await loanertech_collection.update_many({"_id": {"$in": ids}}, {"$set": data})
+    await invalidation_bus.publish(request, "loanertech")
+    return dict.fromkeys(ids, "updated")
 
 
 # Delete a loanertech item from the database
@@ -113,8 +210,7 @@ async def delete_loanertech(request: Request, id: int) -> bool:
     loanertech_collection = request.app.state.mongo_database.get_collection(
         "loanertech_collection"
     )
-    loanertech = await loanertech_collection.find_one({"_id": id})
-    if loanertech:
-        await loanertech_collection.delete_one({"_id": id})
-        return True
-    return False
+    if not await delete_by_id(loanertech_collection, id):
+        return False
+    await invalidation_bus.publish(request, "loanertech")
+    return True
@@ -6,22 +6,26 @@ from fastapi import FastAPI, HTTPException, Request
 from glide import GlideClient, GlideClientConfiguration, NodeAddress, ServerCredentials
 
 from server.config import settings
+from server.helpers.invalidation import INVALIDATION_CHANNEL, invalidation_bus
 
 logger = logging.getLogger(__name__)
 
 
+def valkey_configuration(**kwargs) -> GlideClientConfiguration:
+    addresses = [NodeAddress(settings.VALKEY_ADDRESS, 6379)]
+    config_kwargs = {"addresses": addresses, **kwargs}
+    if settings.VALKEY_PASSWORD:
+        config_kwargs["credentials"] = ServerCredentials(
+            password=settings.VALKEY_PASSWORD
+        )
+    return GlideClientConfiguration(**config_kwargs)
+
+
 async def valkey_setup(app: FastAPI) -> None:
     logger.info("Connecting to Valkey...")
     try:
         # Configure and create the Valkey client instance
-        addresses = [NodeAddress(settings.VALKEY_ADDRESS, 6379)]
-        config_kwargs = {"addresses": addresses}
-        if settings.VALKEY_PASSWORD:
-            config_kwargs["credentials"] = ServerCredentials(
-                password=settings.VALKEY_PASSWORD
-            )
-        config = GlideClientConfiguration(**config_kwargs)
-        client = await GlideClient.create(config)
+        client = await GlideClient.create(valkey_configuration())
 
         pong = await client.ping()
         logger.info("Valkey Connection Successful: %s", pong)
@@ -34,6 +38,35 @@ async def valkey_setup(app: FastAPI) -> None:
         sys.exit(1)
 
 
+async def valkey_pubsub_setup(app: FastAPI) -> None:
+    """Subscribe this worker to cache invalidations published by the others."""
+    logger.info("Subscribing to Valkey cache invalidations...")
+    try:
+        subscriptions = GlideClientConfiguration.PubSubSubscriptions(
+            channels_and_patterns={
+                GlideClientConfiguration.PubSubChannelModes.Exact: {
+                    INVALIDATION_CHANNEL
+                }
+            },
+            callback=None,
+            context=None,
+        )
+        # Subscribed clients cannot run regular commands, so this is a second client
+        client = await GlideClient.create(
+            valkey_configuration(pubsub_subscriptions=subscriptions)
+        )
+        invalidation_bus.start(app, client)
+        logger.info("Subscribed to %s", INVALIDATION_CHANNEL)
+    except Exception as e:
+        logger.exception("Failed to subscribe to Valkey invalidations: %s", e)
+        sys.exit(1)
+
+
+async def valkey_pubsub_shutdown(app: FastAPI) -> None:
+    logger.info("Closing Valkey invalidation subscription...")
+    await invalidation_bus.stop()
+
+
 async def valkey_shutdown(app: FastAPI) -> None:
     if hasattr(app.state, "valkey_client") and app.state.valkey_client:
         logger.info("Closing Valkey connection...")
@@ -1,4 +1,40 @@
+import logging
+from asyncio import sleep
+from collections import Counter, OrderedDict
+from collections.abc import Hashable
+from functools import wraps
+from time import monotonic
+from typing import Any
+
+import bson
+from aiocache import SimpleMemoryCache
 from fastapi import Request
+from glide import ExpirySet, ExpiryType
+
+logger = logging.getLogger(__name__)
+
+# Valkey key prefixes for values shared between workers by tiered_cached, and for
+# the per-function generation counters their writes bump
+L2_KEY_PREFIX = "cache:"
+L2_GENERATION_PREFIX = "cache-generation:"
+
+# Process-wide hit/miss counts per tier: l1_hit, l1_miss, l2_hit, l2_miss, l2_error.
+# Every l2_hit is a Mongo read some other worker already paid for.
+cache_stats: Counter[str] = Counter()
+CACHE_STATS_FIELDS = ("l1_hit", "l1_miss", "l2_hit", "l2_miss", "l2_error")
+# Seconds between the cache_stats log lines each worker writes
+CACHE_STATS_LOG_INTERVAL = 300
+
+
+def format_cache_stats() -> str:
+    return " ".join(f"{field}={cache_stats[field]}" for field in CACHE_STATS_FIELDS)
+
+
+async def log_cache_stats(interval: float = CACHE_STATS_LOG_INTERVAL) -> None:
+    """Log this worker's running ``cache_stats`` every ``interval`` seconds."""
+    while True:
+        await sleep(interval)
+        logger.info("Tiered cache stats: %s", format_cache_stats())
 
 
 def cache_key_exclude_request(f, *args, **kwargs):
@@ -8,3 +44,173 @@ def cache_key_exclude_request(f, *args, **kwargs):
         (k, v) for k, v in sorted(kwargs.items()) if not isinstance(v, Request)
     )
     return f"{f.__module__}.{f.__name__}:{key_args!r}:{key_kwargs!r}"
+
+
+def encode_cached_value(value: Any, generation: int = 0) -> bytes:
+    """Compact binary form for Valkey; BSON keeps ObjectIds and datetimes intact."""
+    return bson.encode({"g": generation, "v": value})
+
+
+def decode_cached_entry(data: bytes) -> tuple[int, Any]:
+    """The generation an L2 value was computed under, and the value."""
+    entry = bson.decode(data)
+    return entry.get("g", 0), entry["v"]
+
+
+def decode_cached_value(data: bytes) -> Any:
+    return decode_cached_entry(data)[1]
+
+
+def _valkey_client(args: tuple, kwargs: dict):
+    for value in (*args, *kwargs.values()):
+        if isinstance(value, Request):
+            return getattr(value.app.state, "valkey_client", None)
+    return None
+
+
+def tiered_cached(ttl: int, l1_ttl: int | None = None):
+    """
+    Cache an async lookup in process memory (L1) in front of Valkey (L2).
+
+    Keys come from ``cache_key_exclude_request``. The Valkey client is the
+    ``GlideClient`` on the ``Request`` argument's app state; without one only L1 is
+    used. Valkey errors are logged and treated as misses, so a Valkey outage falls
+    back to the wrapped function rather than failing the request. Exceptions from the
+    wrapped function are not cached.
+
+    ``invalidate`` bumps the function's generation counter in Valkey. L2 values are
+    stamped with the generation read before the wrapped function ran and only served
+    while it is current, so a value computed before a write never outlives it, even
+    when it reaches Valkey after the bump. ``clear_local`` does the same for this
+    worker's L1. ``l1_ttl`` bounds how long a worker that missed an invalidation
+    message keeps serving its own copy.
+    """
+
+    def decorator(f):
+        l1 = SimpleMemoryCache()
+        generation_key = L2_GENERATION_PREFIX + f"{f.__module__}.{f.__name__}"
+        # Bumped by clear_local; a lookup that spans a bump keeps its value out of L1
+        epoch = 0
+
+        @wraps(f)
+        async def wrapper(*args, **kwargs):
+            key = cache_key_exclude_request(f, *args, **kwargs)
+            value = await l1.get(key)
+            if value is not None:
+                cache_stats["l1_hit"] += 1
+                return value
+            cache_stats["l1_miss"] += 1
+            started_epoch = epoch
+
+            client = _valkey_client(args, kwargs)
+            l2_key = L2_KEY_PREFIX + key
+            generation = None
+            if client is not None:
+                try:
+                    current, data = await client.mget([generation_key, l2_key])
+                except Exception:
+                    logger.warning(
+                        "Valkey cache read failed for %s", key, exc_info=True
+                    )
+                    cache_stats["l2_error"] += 1
+                else:
+                    generation = int(current or 0)
+                    if data is not None:
+                        stamped, value = decode_cached_entry(data)
+                        if stamped == generation:
+                            cache_stats["l2_hit"] += 1
+                            if started_epoch == epoch:
+                                await l1.set(key, value, ttl=l1_ttl or ttl)
+                            return value
+                    cache_stats["l2_miss"] += 1
+
+            value = await f(*args, **kwargs)
+            if started_epoch == epoch:
+                await l1.set(key, value, ttl=l1_ttl or ttl)
+            if generation is not None:
+                try:
+                    await client.set(
+                        l2_key,
+                        encode_cached_value(value, generation),
+                        expiry=ExpirySet(ExpiryType.SEC, ttl),
+                    )
+                except Exception:
+                    logger.warning(
+                        "Valkey cache write failed for %s", key, exc_info=True
+                    )
+                    cache_stats["l2_error"] += 1
+            return value
+
+        async def clear_local() -> None:
+            """Drop every value of this function from this process's L1."""
+            nonlocal epoch
+            epoch += 1
+            await l1.clear()
+
+        async def invalidate(*args, **kwargs) -> None:
+            """Retire every cached value of this function in Valkey and this L1."""
+            await clear_local()
+            client = _valkey_client(args, kwargs)
+            if client is not None:
+                try:
+                    await client.incr(generation_key)
+                except Exception:
+                    logger.error(
+                        "Valkey cache generation bump failed for %s",
+                        generation_key,
+                        exc_info=True,
+                    )
+                    cache_stats["l2_error"] += 1
+
+        wrapper.cache = l1
+        wrapper.clear_local = clear_local
+        wrapper.invalidate = invalidate
+        return wrapper
+
+    return decorator
+
+
+class QueryResultCache:
+    """
+    Process-local LRU of query results with a short TTL.
+
+    Keys carry the generation of their collection, read before the query runs.
+    Writes bump the generation, so a result computed before a write is never served
+    after it, even when the write lands while the query is still in flight.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 256) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+
+    def generation(self, collection: str) -> int:
+        return self._generations.get(collection, 0)
+
+    def bump(self, collection: str) -> None:
+        """Invalidate every cached result for ``collection``."""
+        self._generations[collection] = self.generation(collection) + 1
+
+    def key(self, collection: str, *parts: Hashable) -> tuple:
+        return (collection, self.generation(collection), *parts)
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,180 @@
+"""
+Process-local index of LAF and lost report descriptions.
+
+Widens the description prefilter (see ``build_description_prefilter``) from whole
+tokens to substrings. A synonym-expanded query token of
+``DESCRIPTION_SUBSTRING_MIN_LENGTH`` or more characters matches every known word
+containing it, found through a trigram index over the vocabulary, and so every stored
+token those words were saved as. Per-token postings then resolve the tokens to
+document ids. The ``_id`` lookup and the ``description_tokens`` ``$in`` over the same
+tokens therefore select the same documents, whichever one the caller sends to Mongo.
+"""
+
+from collections.abc import Collection, Hashable, Iterable
+from typing import Any
+
+from server.helpers.description_search import (
+    DESCRIPTION_SUBSTRING_MIN_LENGTH,
+    canonicalize_token,
+    normalize_search_text,
+    split_prefilter_alternates,
+)
+
+NGRAM_SIZE = DESCRIPTION_SUBSTRING_MIN_LENGTH
+
+# Past this many ids an ``_id`` ``$in`` stops being cheaper than the
+# ``description_tokens`` ``$in`` over the same tokens, which Mongo answers from the
+# ``(archived, description_tokens, date)`` index.
+DESCRIPTION_INDEX_MAX_CANDIDATES = 5000
+
+
+def word_ngrams(word: str) -> set[str]:
+    return {word[i : i + NGRAM_SIZE] for i in range(len(word) - NGRAM_SIZE + 1)}
+
+
+class DescriptionIndex:
+    """Maps description words to their stored tokens, and tokens to document ids.
+
+    The vocabulary only grows: a word whose documents are gone still resolves to its
+    token, which then simply has no postings.
+    """
+
+    def __init__(self) -> None:
+        self._words: dict[str, str] = {}
+        self._word_ngrams: dict[str, set[str]] = {}
+        # Postings are partitioned by archived state so a search only ever touches
+        # the side of the collection it is filtering on.
+        self._postings: dict[bool, dict[str, set[Hashable]]] = {False: {}, True: {}}
+        self._documents: dict[Hashable, tuple[frozenset[str], bool]] = {}
+        self.ready = False
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def load(self, documents: Iterable[dict[str, Any]]) -> None:
+        """Replace the index contents with ``documents`` and mark it ready."""
+        self._words = {}
+        self._word_ngrams = {}
+        self._postings = {False: {}, True: {}}
+        self._documents = {}
+        self.add_documents(documents)
+        self.ready = True
+
+    def add_documents(self, documents: Iterable[dict[str, Any]]) -> None:
+        """Index ``description`` / ``archived`` documents, replacing their entries."""
+        for document in documents:
+            self.add(
+                document["_id"],
+                document.get("description") or "",
+                bool(document.get("archived", False)),
+            )
+
+    def _token_for(self, word: str) -> str:
+        token = self._words.get(word)
+        if token is None:
+            token = self._words[word] = canonicalize_token(word)
+            for gram in word_ngrams(word):
+                self._word_ngrams.setdefault(gram, set()).add(word)
+        return token
+
+    def add(self, doc_id: Hashable, description: str, archived: bool = False) -> None:
+        """Index ``description`` under ``doc_id``, replacing any previous entry."""
+        words = normalize_search_text(description).split(" ")
+        self._store(
+            doc_id, frozenset(self._token_for(word) for word in words if word), archived
+        )
+
+    def _store(self, doc_id: Hashable, tokens: frozenset[str], archived: bool) -> None:
+        self.remove(doc_id)
+        self._documents[doc_id] = (tokens, archived)
+        postings = self._postings[archived]
+        for token in tokens:
+            postings.setdefault(token, set()).add(doc_id)
+
+    def update(
+        self,
+        doc_id: Hashable,
+        description: str | None = None,
+        archived: bool | None = None,
+    ) -> None:
+        """Apply a partial write; unknown ids are indexed only with a description."""
+        current = self._documents.get(doc_id)
+        if current is None:
+            if description is not None:
+                self.add(doc_id, description, bool(archived))
+            return
+        if description is not None:
+            self.add(doc_id, description, current[1] if archived is None else archived)
+        elif archived is not None and archived != current[1]:
+            self._store(doc_id, current[0], archived)
+
+    def set_archived(self, doc_ids: Iterable[Hashable], archived: bool = True) -> None:
+        for doc_id in doc_ids:
+            self.update(doc_id, archived=archived)
+
+    def remove(self, doc_id: Hashable) -> None:
+        current = self._documents.pop(doc_id, None)
+        if current is None:
+            return
+        postings = self._postings[current[1]]
+        for token in current[0]:
+            posting = postings.get(token)
+            if posting is None:
+                continue
+            posting.discard(doc_id)
+            if not posting:
+                del postings[token]
+
+    def _words_containing(self, alternate: str) -> set[str]:
+        if len(alternate) == NGRAM_SIZE:
+            return self._word_ngrams.get(alternate, set())
+
+        grams = sorted(
+            (self._word_ngrams.get(gram, set()) for gram in word_ngrams(alternate)),
+            key=len,
+        )
+        matched = grams[0] & grams[1]
+        for words in grams[2:]:
+            if not matched:
+                break
+            matched = matched & words
+        return {word for word in matched if alternate in word}
+
+    def matching_tokens(self, description_query: str) -> set[str] | None:
+        """
+        Stored tokens a description matching ``description_query`` holds one of.
+
+        Returns ``None`` when the index cannot answer (not loaded yet, or a blank
+        query), so the caller matches the query tokens as whole words.
+        """
+        if not self.ready:
+            return None
+        normalized_query = normalize_search_text(description_query)
+        if not normalized_query:
+            return None
+
+        substrings, whole_tokens = split_prefilter_alternates(normalized_query)
+        tokens = {canonicalize_token(token) for token in whole_tokens}
+        for alternate in substrings:
+            tokens.add(canonicalize_token(alternate))
+            tokens.update(
+                self._words[word] for word in self._words_containing(alternate)
+            )
+        return tokens
+
+    def candidates(
+        self, tokens: Collection[str], archived: bool
+    ) -> set[Hashable] | None:
+        """
+        Ids of the documents holding any of ``tokens``.
+
+        Returns ``None`` past ``DESCRIPTION_INDEX_MAX_CANDIDATES``, so the caller
+        sends Mongo the tokens instead.
+        """
+        postings = self._postings[archived]
+        candidates: set[Hashable] = set()
+        for token in tokens:
+            candidates |= postings.get(token, set())
+            if len(candidates) > DESCRIPTION_INDEX_MAX_CANDIDATES:
+                return None
+        return candidates
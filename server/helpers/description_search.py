@@ -2,17 +2,44 @@
 Fuzzy description search for LAF, inventory, and similar item lookups.
 
 Pure helpers plus async ranking via asyncio.to_thread so callers stay non-blocking.
+Ranking scores candidates in batches with rapidfuzz.process.cdist so the per-item
+work happens in native code rather than a Python loop, and keeps only the best
+DESCRIPTION_SEARCH_RESULT_LIMIT matches in a bounded heap.
 """
 
 import re
 from asyncio import to_thread
-from typing import Any
+from collections.abc import AsyncIterable, Collection
+from heapq import heappush, heapreplace
+from itertools import count
+from typing import TYPE_CHECKING, Any
 
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
+
+if TYPE_CHECKING:
+    from server.helpers.ranking_executor import RankingExecutor
 
 DESCRIPTION_SEARCH_CANDIDATE_LIMIT = 300
 DESCRIPTION_SEARCH_RESULT_LIMIT = 30
 DESCRIPTION_MATCH_THRESHOLD = 55
+# Candidates scored per batch when ranking straight off a Mongo cursor
+DESCRIPTION_SEARCH_CHUNK_SIZE = 100
+# Query tokens at least this long also match every word containing them; shorter ones
+# only match a whole word (see DescriptionIndex)
+DESCRIPTION_SUBSTRING_MIN_LENGTH = 3
+# rapidfuzz cdist worker threads per batch; -1 uses every core
+DESCRIPTION_SCORE_WORKERS = -1
+
+# Weights of the scorers combined into a description similarity score
+WRATIO_WEIGHT = 0.35
+TOKEN_SET_WEIGHT = 0.35
+PARTIAL_WEIGHT = 0.20
+TOKEN_MATCH_WEIGHT = 0.10
+CONTAINS_BONUS = 10
+# Slack taken off derived per-scorer cutoffs so float rounding never prunes a
+# candidate that lands exactly on the cutoff
+SCORE_CUTOFF_SLACK = 1e-6
 
 SYNONYM_GROUPS = [
     {"hat", "beanie", "beenie", "cap", "toque", "headwear"},
@@ -66,8 +93,14 @@ TOKEN_TO_SYNONYM_SET: dict[str, frozenset[str]] = {
 }
 
 
+_NON_ALPHANUMERIC_RE = re.compile(r"[^a-z0-9\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_NUL_SAFE_NON_ALPHANUMERIC_RE = re.compile(r"[^a-z0-9\s\x00]")
+_NUL_SAFE_WHITESPACE_RE = re.compile(r"[^\S\x00]+")
+
+
 def normalize_search_text(text: str) -> str:
-    return re.sub(r"\s+", " ", re.sub(r"[^a-z0-9\s]", " ", text.lower())).strip()
+    return _WHITESPACE_RE.sub(" ", _NON_ALPHANUMERIC_RE.sub(" ", text.lower())).strip()
 
 
 def canonicalize_token(token: str) -> str:
@@ -97,7 +130,15 @@ def token_match_score(query_tokens: list[str], text_tokens: list[str]) -> float:
     return total / len(query_tokens)
 
 
-def description_similarity_score(query: str, text: str) -> float:
+def description_similarity_score(
+    query: str, text: str, score_cutoff: float | None = None
+) -> float:
+    """
+    Weighted similarity of ``text`` to ``query``.
+
+    With ``score_cutoff``, scoring stops as soon as the cutoff is out of reach and
+    returns 0.0; scores at or above the cutoff are unchanged.
+    """
     normalized_query = normalize_search_text(query)
     normalized_text = normalize_search_text(text)
     if not normalized_query or not normalized_text:
@@ -106,47 +147,463 @@ def description_similarity_score(query: str, text: str) -> float:
     query_tokens = tokenize_search_text(normalized_query)
     text_tokens = tokenize_search_text(normalized_text)
 
+    if score_cutoff is not None:
+        return _cutoff_similarity_score(
+            normalized_query, normalized_text, query_tokens, text_tokens, score_cutoff
+        )
+
     wratio_score = fuzz.WRatio(normalized_query, normalized_text)
     token_set_score = fuzz.token_set_ratio(normalized_query, normalized_text)
     partial_score = fuzz.partial_ratio(normalized_query, normalized_text)
     token_score = token_match_score(query_tokens, text_tokens)
 
-    contains_bonus = 10 if normalized_query in normalized_text else 0
+    contains_bonus = CONTAINS_BONUS if normalized_query in normalized_text else 0
+
+    return _weighted_score(
+        wratio_score, token_set_score, partial_score, token_score, contains_bonus
+    )
+
+
+def _cutoff_similarity_score(
+    normalized_query: str,
+    normalized_text: str,
+    query_tokens: list[str],
+    text_tokens: list[str],
+    score_cutoff: float,
+) -> float:
+    """
+    Per-item similarity score that bails out once ``score_cutoff`` is unreachable.
+
+    Scorers run cheapest first. Before each one, the minimum it must return for the
+    cutoff to stay reachable (everything after it taken as 100) is derived from the
+    weights and handed to rapidfuzz as ``score_cutoff``, which lets it skip work and
+    return 0 for hopeless pairs.
+    """
+    contains_bonus = CONTAINS_BONUS if normalized_query in normalized_text else 0
+    stages = (
+        (
+            TOKEN_SET_WEIGHT,
+            lambda cutoff: fuzz.token_set_ratio(
+                normalized_query, normalized_text, score_cutoff=cutoff
+            ),
+        ),
+        (
+            TOKEN_MATCH_WEIGHT,
+            lambda cutoff: token_match_score(query_tokens, text_tokens),
+        ),
+        (
+            WRATIO_WEIGHT,
+            lambda cutoff: fuzz.WRatio(
+                normalized_query, normalized_text, score_cutoff=cutoff
+            ),
+        ),
+        (
+            PARTIAL_WEIGHT,
+            lambda cutoff: fuzz.partial_ratio(
+                normalized_query, normalized_text, score_cutoff=cutoff
+            ),
+        ),
+    )
+
+    reached = float(contains_bonus)
+    remaining_weight = sum(weight for weight, _ in stages)
+    stage_scores = []
+    for weight, scorer in stages:
+        remaining_weight -= weight
+        minimum = (
+            score_cutoff - reached - 100 * remaining_weight
+        ) / weight - SCORE_CUTOFF_SLACK
+        if minimum > 100:
+            return 0.0
+        stage_score = scorer(max(minimum, 0.0))
+        if stage_score < minimum:
+            return 0.0
+        reached += weight * stage_score
+        stage_scores.append(stage_score)
+
+    token_set_score, token_score, wratio_score, partial_score = stage_scores
+    return _weighted_score(
+        wratio_score, token_set_score, partial_score, token_score, contains_bonus
+    )
+
+
+def _score_matrix(queries: list[str], choices: list[str], scorer: Any) -> np.ndarray:
+    return process.cdist(
+        queries,
+        choices,
+        scorer=scorer,
+        dtype=np.float64,
+        workers=DESCRIPTION_SCORE_WORKERS,
+    )
+
 
+def batch_token_match_scores(
+    query_tokens: list[str], texts_tokens: list[list[str]]
+) -> np.ndarray:
+    """Vectorized ``token_match_score`` of one query against many token lists."""
+    scores = np.zeros(len(texts_tokens))
+    scored = [index for index, text_tokens in enumerate(texts_tokens) if text_tokens]
+    if not query_tokens or not scored:
+        return scores
+
+    scores[scored] = _token_match_scores(
+        query_tokens,
+        [token for index in scored for token in texts_tokens[index]],
+        [len(texts_tokens[index]) for index in scored],
+    )
+    return scores
+
+
+def _token_match_scores(
+    query_tokens: list[str], flat_tokens: list[str], lengths: list[int]
+) -> np.ndarray:
+    # Score each distinct query token against each distinct text token once, then
+    # take every text's best ratio per query token with a segmented maximum.
+    query_rows = {token: row for row, token in enumerate(dict.fromkeys(query_tokens))}
+    vocabulary = {
+        token: column for column, token in enumerate(dict.fromkeys(flat_tokens))
+    }
+    columns = list(map(vocabulary.__getitem__, flat_tokens))
+    offsets = np.cumsum([0, *lengths[:-1]])
+
+    ratios = _score_matrix(
+        list(query_rows),
+        [canonicalize_token(token) for token in vocabulary],
+        fuzz.ratio,
+    )
+    best = np.maximum.reduceat(ratios[:, columns], offsets, axis=1)
+
+    # Accumulate in query order so the floats match token_match_score exactly
+    total = np.zeros(len(lengths))
+    for query_token in query_tokens:
+        total += best[query_rows[query_token]]
+    return total / len(query_tokens)
+
+
+def _normalize_many(texts: list[str]) -> list[str]:
+    # One regex pass over all texts joined by a NUL separator, which neither
+    # substitution touches; per-text normalization if a text contains NUL itself.
+    joined = "\x00".join(texts)
+    if joined.count("\x00") != len(texts) - 1:
+        return [normalize_search_text(text) for text in texts]
+    normalized = _NUL_SAFE_WHITESPACE_RE.sub(
+        " ", _NUL_SAFE_NON_ALPHANUMERIC_RE.sub(" ", joined.lower())
+    )
+    return [text.strip() for text in normalized.split("\x00")]
+
+
+def description_similarity_scores(
+    normalized_query: str, texts: list[str]
+) -> list[float]:
+    """``description_similarity_score`` for every text against one query, batched."""
+    return normalized_similarity_scores(
+        normalized_query, _normalize_many(texts) if texts else []
+    )
+
+
+def _weighted_score(wratio, token_set, partial, token_match, contains_bonus):
     return (
-        (0.35 * wratio_score)
-        + (0.35 * token_set_score)
-        + (0.20 * partial_score)
-        + (0.10 * token_score)
+        (WRATIO_WEIGHT * wratio)
+        + (TOKEN_SET_WEIGHT * token_set)
+        + (PARTIAL_WEIGHT * partial)
+        + (TOKEN_MATCH_WEIGHT * token_match)
         + contains_bonus
     )
 
 
+def normalized_similarity_scores(
+    normalized_query: str,
+    normalized_texts: list[str],
+    texts_tokens: list[list[str] | None] | None = None,
+    score_floor: float | None = None,
+) -> list[float]:
+    """
+    Batched scores for texts already passed through ``normalize_search_text``.
+
+    ``texts_tokens`` may carry stored ``tokenize_search_text`` output per text; texts
+    without one are tokenized from their normalized form.
+
+    With ``score_floor``, the expensive WRatio and partial_ratio scorers only run for
+    texts whose upper bound (both taken as 100) reaches the floor; the rest score 0.0.
+    """
+    scores = np.zeros(len(normalized_texts))
+    normalized_query = normalize_search_text(normalized_query)
+    scored = [index for index, text in enumerate(normalized_texts) if text]
+    if not normalized_query or not scored:
+        return scores.tolist()
+
+    choices = [normalized_texts[index] for index in scored]
+    query = [normalized_query]
+    token_set_scores = _score_matrix(query, choices, fuzz.token_set_ratio)[0]
+    if texts_tokens is None:
+        # Normalized text is single-space separated, so splitting the joined
+        # choices yields every token in order without re-running normalization.
+        flat_tokens = " ".join(choices).split(" ")
+        lengths = [choice.count(" ") + 1 for choice in choices]
+    else:
+        choice_tokens = [
+            texts_tokens[index] or normalized_texts[index].split(" ")
+            for index in scored
+        ]
+        flat_tokens = [token for tokens in choice_tokens for token in tokens]
+        lengths = [len(tokens) for tokens in choice_tokens]
+    token_scores = _token_match_scores(
+        tokenize_search_text(normalized_query), flat_tokens, lengths
+    )
+    contains_bonus = np.array(
+        [CONTAINS_BONUS if normalized_query in choice else 0 for choice in choices]
+    )
+
+    wratio_scores = np.full(len(choices), 100.0)
+    partial_scores = np.full(len(choices), 100.0)
+    expensive = np.arange(len(choices))
+    if score_floor is not None:
+        upper_bounds = _weighted_score(
+            wratio_scores,
+            token_set_scores,
+            partial_scores,
+            token_scores,
+            contains_bonus,
+        )
+        expensive = np.flatnonzero(upper_bounds >= score_floor)
+    if expensive.size:
+        expensive_choices = [choices[index] for index in expensive]
+        wratio_scores[expensive], partial_scores[expensive] = (
+            _score_matrix(query, expensive_choices, scorer)[0]
+            for scorer in (fuzz.WRatio, fuzz.partial_ratio)
+        )
+
+    combined = np.zeros(len(choices))
+    combined[expensive] = _weighted_score(
+        wratio_scores[expensive],
+        token_set_scores[expensive],
+        partial_scores[expensive],
+        token_scores[expensive],
+        contains_bonus[expensive],
+    )
+    scores[scored] = combined
+    return scores.tolist()
+
+
+def search_fields(text: str, field: str = "description") -> dict[str, Any]:
+    """
+    Normalized text and canonical tokens persisted next to ``field`` at write time.
+
+    ``rank_by_description`` reads ``<field>_norm`` and ``<field>_tokens`` when present
+    instead of normalizing and tokenizing every candidate on every search.
+    """
+    normalized = normalize_search_text(text or "")
+    return {
+        f"{field}_norm": normalized,
+        f"{field}_tokens": list(dict.fromkeys(tokenize_search_text(normalized))),
+    }
+
+
+def _stored_search_fields(
+    items: list[dict[str, Any]], description_field: str
+) -> tuple[list[str], list[list[str] | None]]:
+    norm_field = f"{description_field}_norm"
+    tokens_field = f"{description_field}_tokens"
+    normalized_texts = [item.get(norm_field) for item in items]
+    missing = [index for index, text in enumerate(normalized_texts) if text is None]
+    if missing:
+        # Documents written before the fields existed (or not yet backfilled)
+        backfilled = _normalize_many(
+            [items[index].get(description_field, "") for index in missing]
+        )
+        for index, text in zip(missing, backfilled):
+            normalized_texts[index] = text
+    return normalized_texts, [item.get(tokens_field) for item in items]
+
+
+class TopKSelector:
+    """
+    Bounded min-heap of the best ``k`` matches in ``rank_by_description`` order.
+
+    Entries compare on (score, date, -arrival), so ties keep arrival order exactly
+    like a stable descending sort over every candidate would.
+    """
+
+    def __init__(
+        self,
+        k: int = DESCRIPTION_SEARCH_RESULT_LIMIT,
+        threshold: float = DESCRIPTION_MATCH_THRESHOLD,
+    ) -> None:
+        self.k = k
+        self.threshold = threshold
+        self._heap: list[tuple[float, Any, int, dict[str, Any]]] = []
+        self._arrivals = count()
+
+    def floor(self) -> float:
+        """Lowest score a new candidate could still enter the top ``k`` with."""
+        if len(self._heap) < self.k:
+            return self.threshold
+        return self._heap[0][0]
+
+    def push(self, score: float, item: dict[str, Any]) -> None:
+        if score < self.threshold:
+            return
+        entry = (score, item.get("date", ""), -next(self._arrivals), item)
+        if len(self._heap) < self.k:
+            heappush(self._heap, entry)
+        elif entry[:3] > self._heap[0][:3]:
+            heapreplace(self._heap, entry)
+
+    def results(self) -> list[dict[str, Any]]:
+        ranked = sorted(self._heap, key=lambda entry: entry[:3], reverse=True)
+        return [entry[3] for entry in ranked]
+
+    def scored_items(self) -> list[tuple[float, dict[str, Any]]]:
+        """Kept (score, item) pairs in the order they were pushed."""
+        pushed = sorted(self._heap, key=lambda entry: entry[2], reverse=True)
+        return [(entry[0], entry[3]) for entry in pushed]
+
+
+def rank_into(
+    selector: TopKSelector,
+    normalized_query: str,
+    items: list[dict[str, Any]],
+    description_field: str,
+    early_exit: bool = False,
+) -> None:
+    """
+    Score ``items`` against ``normalized_query`` and push them into ``selector``.
+
+    With ``early_exit`` each candidate is scored against the selector's current
+    floor, skipping the expensive scorers once it cannot place.
+    """
+    normalized_texts, texts_tokens = _stored_search_fields(items, description_field)
+    if early_exit:
+        # One candidate at a time against the live heap floor, which rises as
+        # better matches arrive and lets later candidates bail out sooner.
+        query_tokens = tokenize_search_text(normalized_query)
+        for item, text, tokens in zip(items, normalized_texts, texts_tokens):
+            if not text:
+                continue
+            score = _cutoff_similarity_score(
+                normalized_query,
+                text,
+                query_tokens,
+                tokens or tokenize_search_text(text),
+                selector.floor(),
+            )
+            selector.push(score, item)
+        return
+
+    scores = normalized_similarity_scores(
+        normalized_query, normalized_texts, texts_tokens, selector.floor()
+    )
+    for score, item in zip(scores, items):
+        selector.push(score, item)
+
+
+def compact_candidates(
+    items: list[dict[str, Any]], description_field: str = "description"
+) -> list[tuple[Any, Any, str]]:
+    """
+    ``(_id, date, text)`` tuples for shipping candidates to a ranking worker.
+
+    ``text`` is the stored normalized description when present; normalizing it
+    again is a no-op, so workers treat both forms alike.
+    """
+    norm_field = f"{description_field}_norm"
+    return [
+        (
+            item.get("_id"),
+            item.get("date", ""),
+            item.get(norm_field) or item.get(description_field) or "",
+        )
+        for item in items
+    ]
+
+
+def top_candidates(
+    candidates: list[tuple[Any, Any, str]],
+    normalized_query: str,
+    score_floor: float = DESCRIPTION_MATCH_THRESHOLD,
+    k: int = DESCRIPTION_SEARCH_RESULT_LIMIT,
+    early_exit: bool = False,
+) -> list[tuple[Any, float]]:
+    """
+    ``(_id, score)`` of the best ``k`` compact candidates scoring at least
+    ``score_floor``, in candidate order so the caller's heap keeps its tie-breaking.
+    """
+    selector = TopKSelector(k, score_floor)
+    items = [
+        {"_id": doc_id, "date": date, "description": text}
+        for doc_id, date, text in candidates
+    ]
+    rank_into(selector, normalized_query, items, "description", early_exit)
+    return [(item["_id"], score) for score, item in selector.scored_items()]
+
+
 def rank_by_description(
     items: list[dict[str, Any]],
     description_query: str,
     description_field: str = "description",
+    early_exit: bool = False,
 ) -> list[dict[str, Any]]:
+    """
+    Best description matches for ``description_query``, highest score first.
+
+    ``early_exit`` scores candidates one by one with score cutoffs derived from the
+    current top-k floor instead of in batches; the ranking is identical.
+    """
     normalized_query = normalize_search_text(description_query)
     if not normalized_query:
         return items
 
-    ranked_items: list[tuple[float, dict[str, Any]]] = []
-    for item in items:
-        score = description_similarity_score(
-            normalized_query, item.get(description_field, "")
-        )
-        if score >= DESCRIPTION_MATCH_THRESHOLD:
-            ranked_items.append((score, item))
+    selector = TopKSelector()
+    rank_into(selector, normalized_query, items, description_field, early_exit)
+    return selector.results()
 
-    ranked_items.sort(
-        key=lambda pair: (
-            pair[0],
-            pair[1].get("date", ""),
-        ),
-        reverse=True,
-    )
-    return [item for _, item in ranked_items[:DESCRIPTION_SEARCH_RESULT_LIMIT]]
+
+async def rank_cursor_by_description(
+    cursor: AsyncIterable[dict[str, Any]],
+    description_query: str,
+    description_field: str = "description",
+    chunk_size: int = DESCRIPTION_SEARCH_CHUNK_SIZE,
+    early_exit: bool = False,
+    executor: "RankingExecutor | None" = None,
+    k: int = DESCRIPTION_SEARCH_RESULT_LIMIT,
+) -> list[dict[str, Any]]:
+    """
+    Best ``k`` description matches over documents as they arrive from an async cursor.
+
+    Each chunk is scored off the event loop (on ``executor`` when given, otherwise a
+    thread) while the heap's floor rises, so later chunks skip the expensive scorers
+    for candidates that can no longer place.
+    """
+    normalized_query = normalize_search_text(description_query)
+    if not normalized_query:
+        return [item async for item in cursor]
+
+    selector = TopKSelector(k)
+
+    async def _rank_chunk(chunk: list[dict[str, Any]]) -> None:
+        if executor is None:
+            await to_thread(
+                rank_into,
+                selector,
+                normalized_query,
+                chunk,
+                description_field,
+                early_exit,
+            )
+        else:
+            await executor.rank_into(
+                selector, normalized_query, chunk, description_field, early_exit
+            )
+
+    chunk: list[dict[str, Any]] = []
+    async for item in cursor:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            await _rank_chunk(chunk)
+            chunk = []
+    if chunk:
+        await _rank_chunk(chunk)
+    return selector.results()
 
 
 def _prefilter_regex_alternates(normalized_query: str) -> list[str]:
@@ -157,26 +614,42 @@ def _prefilter_regex_alternates(normalized_query: str) -> list[str]:
     return sorted(expanded)
 
 
+def split_prefilter_alternates(normalized_query: str) -> tuple[list[str], list[str]]:
+    """Synonym-expanded query tokens, split into substring and whole-token matches."""
+    alternates = _prefilter_regex_alternates(normalized_query)
+    return (
+        [alt for alt in alternates if len(alt) >= DESCRIPTION_SUBSTRING_MIN_LENGTH],
+        [alt for alt in alternates if len(alt) < DESCRIPTION_SUBSTRING_MIN_LENGTH],
+    )
+
+
 def build_description_prefilter(
     description_query: str,
-) -> dict[str, dict[str, str]] | None:
+    matching_tokens: Collection[str] | None = None,
+    candidate_ids: Collection[Any] | None = None,
+) -> dict[str, Any] | None:
+    """
+    Match documents whose stored tokens contain any synonym-expanded query token.
+
+    ``description_tokens`` is a multikey array, so this ``$in`` is answered from the
+    ``(archived, description_tokens, date)`` index rather than a collection scan.
+    Stored tokens are canonical and every synonym set contains its canonical form.
+
+    ``matching_tokens`` and ``candidate_ids`` come from a loaded ``DescriptionIndex``:
+    the stored tokens of every known word containing a query token, and the ids of
+    the documents holding them when there are few enough. Both select the same
+    documents; without them the query tokens match as whole words only.
+    """
     normalized_query = normalize_search_text(description_query)
     if not normalized_query:
         return None
-
-    alternates = _prefilter_regex_alternates(normalized_query)
-    if not alternates:
+    if candidate_ids is not None:
+        return {"_id": {"$in": list(candidate_ids)}}
+
+    if matching_tokens is None:
+        tokens = _prefilter_regex_alternates(normalized_query)
+    else:
+        tokens = sorted(matching_tokens)
+    if not tokens:
         return None
-
-    token_pattern = "|".join(re.escape(token) for token in alternates)
-    return {"description": {"$regex": token_pattern, "$options": "i"}}
-
-
-async def rank_by_description_async(
-    items: list[dict[str, Any]],
-    description_query: str,
-    description_field: str = "description",
-) -> list[dict[str, Any]]:
-    return await to_thread(
-        rank_by_description, items, description_query, description_field
-    )
+    return {"description_tokens": {"$in": tokens}}
@@ -0,0 +1,78 @@
+"""
+Write-time expiry for LAF items.
+
+Every item stores ``expires_at`` and ``potentially_expires_at``: midnight of the day it
+turns expired or potentially expired under ``LAF_EXPIRY_POLICY``. The expired lists
+are then range scans on ``(archived, expires_at)`` instead of an ``$or`` of per-type
+date cutoffs. After changing the policy, rewrite the stored fields with
+``uv run python -m server.scripts.rematerialize_expiry``.
+"""
+
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import NamedTuple
+
+from server.helpers.type_registry import normalize_type_name
+
+
+class ExpiryPolicy(NamedTuple):
+    """Days after an item's date at which it expires, by kind of item."""
+
+    water_bottle: int = 30
+    clothing: int = 90
+    umbrella: int = 90
+    inexpensive: int = 180
+    expensive: int = 365
+
+
+LAF_EXPIRY_POLICY = ExpiryPolicy()
+
+# Types on their own schedule; every other type expires after ``expensive`` days
+EXPIRY_POLICY_TYPES = {
+    "Water Bottle": "water_bottle",
+    "Attire": "clothing",
+    "Umbrellas": "umbrella",
+}
+_NORMALIZED_POLICY_TYPES = {
+    normalize_type_name(name): field for name, field in EXPIRY_POLICY_TYPES.items()
+}
+
+
+def expiry_policy_field(type_name: str) -> str | None:
+    """``ExpiryPolicy`` field for a type on its own schedule, matched normalized."""
+    return _NORMALIZED_POLICY_TYPES.get(normalize_type_name(type_name))
+
+
+def expiry_days(type_name: str, policy: ExpiryPolicy = LAF_EXPIRY_POLICY) -> int:
+    field = expiry_policy_field(type_name)
+    return getattr(policy, field) if field else policy.expensive
+
+
+def expiry_fields(
+    date: str, type_name: str, policy: ExpiryPolicy = LAF_EXPIRY_POLICY
+) -> dict[str, datetime]:
+    """``expires_at`` / ``potentially_expires_at`` for an item found on ``date``."""
+    day = datetime.strptime(date, "%Y-%m-%d")
+    return {
+        "expires_at": day + timedelta(days=expiry_days(type_name, policy)),
+        "potentially_expires_at": day + timedelta(days=policy.inexpensive),
+    }
+
+
+def expiry_day(now: datetime) -> datetime:
+    """
+    Midnight of ``now``. An item has expired once ``expires_at`` is at or before it,
+    matching the ``date <= now - days`` cutoffs of the per-request queries.
+    """
+    return datetime(now.year, now.month, now.day)
+
+
+# A day's cutoffs never change, so entries need no TTL. The bound caps memory however
+# many days and threshold combinations requests go through.
+EXPIRY_CUTOFF_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=EXPIRY_CUTOFF_CACHE_SIZE)
+def expiry_cutoff(day: date, days: int) -> str:
+    """Latest item date (``YYYY-MM-DD``) at least ``days`` days old on ``day``."""
+    return (day - timedelta(days=days)).strftime("%Y-%m-%d")
@@ -0,0 +1,90 @@
+"""
+Streaming NDJSON and CSV encoders for bulk exports.
+
+Rows arrive from an async iterator (normally a batched Mongo cursor) and leave as
+byte chunks of ``EXPORT_CHUNK_ROWS`` rows, so an export holds one cursor batch and
+one chunk in memory however many rows it covers.
+"""
+
+import csv
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from io import StringIO
+from typing import Any
+
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+
+# Rows fetched per cursor round trip and written per response chunk
+EXPORT_BATCH_SIZE = 500
+EXPORT_CHUNK_ROWS = 200
+
+# Spreadsheet apps evaluate cells starting with these as formulas
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def csv_cell(value: Any) -> Any:
+    if isinstance(value, list):
+        value = ", ".join(str(item) for item in value)
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+async def ndjson_chunks(
+    rows: AsyncIterable[dict[str, Any]], chunk_rows: int = EXPORT_CHUNK_ROWS
+) -> AsyncIterator[bytes]:
+    lines: list[bytes] = []
+    async for row in rows:
+        lines.append(to_json(row))
+        if len(lines) >= chunk_rows:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+async def csv_chunks(
+    rows: AsyncIterable[dict[str, Any]],
+    fieldnames: Iterable[str],
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+) -> AsyncIterator[bytes]:
+    """CSV with a header row; list cells are comma-joined, formula-like cells quoted."""
+    buffer = StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(fieldnames), extrasaction="ignore")
+    writer.writeheader()
+    pending = 0
+    async for row in rows:
+        writer.writerow({key: csv_cell(value) for key, value in row.items()})
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    # Also sends the bare header of an empty export
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def export_response(
+    rows: AsyncIterable[dict[str, Any]],
+    export_format: str,
+    filename: str,
+    fieldnames: Iterable[str],
+) -> StreamingResponse:
+    """Stream ``rows`` as an ``ndjson`` or ``csv`` attachment named ``filename``."""
+    chunks = (
+        csv_chunks(rows, fieldnames) if export_format == "csv" else ndjson_chunks(rows)
+    )
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{filename}.{export_format}"'
+            )
+        },
+    )
@@ -0,0 +1,101 @@
+"""
+Conditional GET support for catalog endpoints backed by cached values.
+
+A cached lookup hands back the same object until its data changes, so the encoded
+response body and its ETag are built once per cached value and reused by identity.
+Hits are returned as raw bytes, skipping ``response_model`` validation and JSON
+encoding; matching ``If-None-Match`` requests get a bare 304.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from hashlib import blake2b
+from typing import Any, NamedTuple
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+# Browsers always revalidate, so a catalog change shows up on the next page load;
+# unchanged catalogs cost a 304 with no body.
+CATALOG_CACHE_CONTROL = "public, no-cache"
+
+
+class VersionedPayload(NamedTuple):
+    source: Any
+    body: bytes
+    etag: str
+
+
+def content_etag(body: bytes) -> str:
+    return f'"{blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of ``etag`` against an ``If-None-Match`` header."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class PayloadVersions:
+    """
+    LRU of encoded response bodies and ETags keyed on (namespace, id(cached value)).
+
+    Entries hold a reference to the cached value, so its id cannot be reused by a
+    different object while the entry is alive.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[Hashable, int], VersionedPayload] = (
+            OrderedDict()
+        )
+
+    def get(
+        self,
+        namespace: Hashable,
+        source: Any,
+        build: Callable[[Any], BaseModel],
+    ) -> VersionedPayload:
+        key = (namespace, id(source))
+        payload = self._entries.get(key)
+        if payload is not None and payload.source is source:
+            self._entries.move_to_end(key)
+            return payload
+
+        body = build(source).model_dump_json().encode()
+        payload = VersionedPayload(source, body, content_etag(body))
+        self._entries[key] = payload
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return payload
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+payload_versions = PayloadVersions()
+
+
+def conditional_response(
+    request: Request,
+    namespace: Hashable,
+    source: Any,
+    build: Callable[[Any], BaseModel],
+) -> Response:
+    """
+    Pre-encoded JSON body for ``source`` with ETag and Cache-Control headers, or a
+    304 when the client already holds this version.
+
+    ``build`` must return the route's ``response_model``; it is validated once per
+    cached value, when the body is first encoded.
+    """
+    payload = payload_versions.get(namespace, source, build)
+    headers = {"ETag": payload.etag, "Cache-Control": CATALOG_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), payload.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(payload.body, media_type="application/json", headers=headers)
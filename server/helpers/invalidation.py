@@ -0,0 +1,147 @@
+"""
+Cache invalidation bus over Valkey pub/sub.
+
+Write paths call ``invalidation_bus.publish`` with a namespace such as
+``"laf_types"``. The namespace's handlers run in this worker straight away, and the
+message is broadcast on ``INVALIDATION_CHANNEL`` so every other worker runs them too.
+Process-local caches can then keep long TTLs without serving stale data.
+
+A publish may also name the keys it wrote. Handlers registered with ``on_remote``
+receive them on every other worker, for state the writing worker has already updated
+itself, such as the in-memory description indexes. Writers update that state before
+publishing, and other workers run the ``on_remote`` handlers before the plain ones, so
+a cache is never refilled from state that predates the write.
+"""
+
+import logging
+from asyncio import CancelledError, Task, create_task, sleep
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from uuid import uuid4
+
+from fastapi import FastAPI, Request
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+InvalidationHandler = Callable[[FastAPI], Awaitable[None]]
+RemoteInvalidationHandler = Callable[[FastAPI, tuple[str, ...]], Awaitable[None]]
+
+
+class InvalidationBus:
+    """Routes namespaced invalidation messages to the handlers registered for them.
+
+    Messages are ``"<worker id>:<namespace>"``, followed by ``":<key>,<key>..."`` when
+    the publish named keys; a worker ignores its own messages because ``publish`` has
+    already applied them locally.
+    """
+
+    def __init__(self) -> None:
+        self.worker_id = uuid4().hex
+        self._handlers: dict[str, list[InvalidationHandler]] = {}
+        self._remote_handlers: dict[str, list[RemoteInvalidationHandler]] = {}
+        self._task: Task | None = None
+        self._client = None
+
+    def on(
+        self, namespace: str
+    ) -> Callable[[InvalidationHandler], InvalidationHandler]:
+        """Register the decorated coroutine to run when ``namespace`` is invalidated."""
+
+        def decorator(handler: InvalidationHandler) -> InvalidationHandler:
+            self._handlers.setdefault(namespace, []).append(handler)
+            return handler
+
+        return decorator
+
+    def on_remote(
+        self, namespace: str
+    ) -> Callable[[RemoteInvalidationHandler], RemoteInvalidationHandler]:
+        """
+        Register the decorated coroutine to run, with the published keys, when another
+        worker invalidates ``namespace``.
+        """
+
+        def decorator(handler: RemoteInvalidationHandler) -> RemoteInvalidationHandler:
+            self._remote_handlers.setdefault(namespace, []).append(handler)
+            return handler
+
+        return decorator
+
+    async def apply(self, app: FastAPI, namespace: str) -> None:
+        for handler in self._handlers.get(namespace, []):
+            try:
+                await handler(app)
+            except Exception:
+                logger.exception("Invalidation handler for %s failed", namespace)
+
+    async def apply_remote(
+        self, app: FastAPI, namespace: str, keys: tuple[str, ...]
+    ) -> None:
+        for handler in self._remote_handlers.get(namespace, []):
+            try:
+                await handler(app, keys)
+            except Exception:
+                logger.exception("Invalidation handler for %s failed", namespace)
+
+    async def publish(
+        self, request: Request, namespace: str, keys: Iterable[Hashable] = ()
+    ) -> None:
+        """Invalidate ``namespace`` here, then on every other subscribed worker."""
+        await self.apply(request.app, namespace)
+        if self._task is None:
+            # No subscriber running (tests, scripts): this process is all there is
+            return
+        message = f"{self.worker_id}:{namespace}"
+        key_list = ",".join(str(key) for key in keys)
+        if key_list:
+            message = f"{message}:{key_list}"
+        try:
+            await request.app.state.valkey_client.publish(message, INVALIDATION_CHANNEL)
+        except Exception:
+            logger.warning(
+                "Failed to publish %s invalidation", namespace, exc_info=True
+            )
+
+    async def handle_message(self, app: FastAPI, message: str | bytes) -> None:
+        if isinstance(message, bytes):
+            message = message.decode("utf-8")
+        origin, _, namespace = message.partition(":")
+        namespace, _, key_list = namespace.partition(":")
+        if origin != self.worker_id and namespace:
+            await self.apply_remote(
+                app, namespace, tuple(key_list.split(",")) if key_list else ()
+            )
+            await self.apply(app, namespace)
+
+    async def _listen(self, app: FastAPI) -> None:
+        while True:
+            try:
+                pubsub_message = await self._client.get_pubsub_message()
+                await self.handle_message(app, pubsub_message.message)
+            except CancelledError:
+                raise
+            except Exception:
+                logger.exception("Invalidation listener failed to read a message")
+                # Back off while the client reconnects and resubscribes
+                await sleep(1)
+
+    def start(self, app: FastAPI, subscriber_client) -> None:
+        """Consume invalidations from a client subscribed to the channel until stop."""
+        self._client = subscriber_client
+        self._task = create_task(self._listen(app))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except CancelledError:
+                pass
+            self._task = None
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+invalidation_bus = InvalidationBus()
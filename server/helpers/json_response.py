@@ -0,0 +1,25 @@
+"""
+JSON responses for payloads built from database rows by this app's formatters.
+
+The LAF formatters already produce exactly the shape and types of their response
+models, so validating every row again against ``response_model`` only costs time.
+``TrustedJSONResponse`` skips that validation and encodes with pydantic-core's Rust
+serializer, which produces the same bytes as FastAPI's stdlib ``JSONResponse``.
+"""
+
+from typing import Any
+
+from fastapi import Response
+from pydantic_core import to_json
+
+
+class TrustedJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def trusted_response(data: Any, message: str, **fields: Any) -> TrustedJSONResponse:
+    """``ResponseModel``-shaped body for ``data`` without output validation."""
+    return TrustedJSONResponse({"data": data, "message": message, **fields})
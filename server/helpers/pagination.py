@@ -0,0 +1,58 @@
+"""
+Keyset pagination over ``(date, _id)`` for LAF item and lost report listings.
+
+Listings sort newest first on ``date`` with ``_id`` breaking ties, which the
+``(archived, date, _id)`` and ``(archived, type_id, date, _id)`` indexes serve in
+order. A page's cursor is the sort key of its last row, so the next page is an index
+range scan from there: no ``skip()``, and rows written in between never shift pages.
+"""
+
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from typing import Any, NamedTuple
+
+from bson import ObjectId, json_util
+
+PAGE_SORT = [("date", -1), ("_id", -1)]
+DEFAULT_PAGE_LIMIT = 30
+MAX_PAGE_LIMIT = 200
+
+
+class Page(NamedTuple):
+    items: list
+    next_cursor: str | None
+
+
+def encode_cursor(document: dict[str, Any]) -> str:
+    key = json_util.dumps([document["date"], document["_id"]])
+    return urlsafe_b64encode(key.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, int | ObjectId]:
+    """Sort key from ``encode_cursor``; ValueError for anything it cannot produce."""
+    try:
+        key = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        date, _id = json_util.loads(key)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError("invalid page cursor") from e
+    if (
+        not isinstance(date, str)
+        or isinstance(_id, bool)
+        or not isinstance(_id, (int, ObjectId))
+    ):
+        raise ValueError("invalid page cursor")
+    return date, _id
+
+
+def after_cursor(cursor: str) -> dict[str, Any]:
+    """Filter for the rows that sort after ``cursor`` under ``PAGE_SORT``."""
+    date, _id = decode_cursor(cursor)
+    return {"$or": [{"date": {"$lt": date}}, {"date": date, "_id": {"$lt": _id}}]}
+
+
+def split_page(documents: list[dict[str, Any]], limit: int) -> tuple[list, str | None]:
+    """Split up to ``limit + 1`` fetched rows into a page and the next page's cursor."""
+    if len(documents) <= limit:
+        return documents, None
+    documents = documents[:limit]
+    return documents, encode_cursor(documents[-1])
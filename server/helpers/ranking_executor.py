@@ -0,0 +1,110 @@
+"""
+Pluggable executors for description ranking.
+
+``thread`` scores on a worker thread (the default), ``inline`` scores on the event
+loop, and ``process`` scores in a process pool so concurrent searches are not
+serialized on the GIL. Process workers only ever receive compact
+``(_id, date, text)`` tuples and hand back ``(_id, score)`` pairs.
+"""
+
+from asyncio import get_running_loop, to_thread
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any
+
+from server.config import settings
+from server.helpers.description_search import (
+    TopKSelector,
+    compact_candidates,
+    normalize_search_text,
+    rank_into,
+    top_candidates,
+)
+
+RANKING_BACKENDS = ("thread", "process", "inline")
+
+
+class RankingExecutor:
+    """Runs description ranking on the configured backend."""
+
+    def __init__(self, backend: str = "thread", max_workers: int | None = None):
+        if backend not in RANKING_BACKENDS:
+            raise ValueError(
+                f"Unknown ranking backend {backend!r}, expected one of "
+                f"{', '.join(RANKING_BACKENDS)}"
+            )
+        self.backend = backend
+        self.max_workers = max_workers
+        self._pool: ProcessPoolExecutor | None = None
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # Spawned workers import only the search helpers, not the running app
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=get_context("spawn")
+            )
+        return self._pool
+
+    async def rank_into(
+        self,
+        selector: TopKSelector,
+        normalized_query: str,
+        items: list[dict[str, Any]],
+        description_field: str = "description",
+        early_exit: bool = False,
+    ) -> None:
+        """Score ``items`` and push the ones that can still place into ``selector``."""
+        if self.backend == "inline":
+            rank_into(selector, normalized_query, items, description_field, early_exit)
+            return
+        if self.backend == "thread":
+            await to_thread(
+                rank_into,
+                selector,
+                normalized_query,
+                items,
+                description_field,
+                early_exit,
+            )
+            return
+
+        ranked = await get_running_loop().run_in_executor(
+            self._process_pool(),
+            top_candidates,
+            compact_candidates(items, description_field),
+            normalized_query,
+            selector.floor(),
+            selector.k,
+            early_exit,
+        )
+        by_id = {item.get("_id"): item for item in items}
+        for doc_id, score in ranked:
+            selector.push(score, by_id[doc_id])
+
+    async def rank(
+        self,
+        items: list[dict[str, Any]],
+        description_query: str,
+        description_field: str = "description",
+        early_exit: bool = False,
+    ) -> list[dict[str, Any]]:
+        """``rank_by_description`` on this executor's backend."""
+        normalized_query = normalize_search_text(description_query)
+        if not normalized_query:
+            return items
+
+        selector = TopKSelector()
+        await self.rank_into(
+            selector, normalized_query, items, description_field, early_exit
+        )
+        return selector.results()
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+
+ranking_executor = RankingExecutor(
+    settings.DESCRIPTION_RANKING_BACKEND, settings.DESCRIPTION_RANKING_WORKERS
+)
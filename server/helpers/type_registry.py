@@ -0,0 +1,146 @@
+"""
+Process-local registry of LAF types.
+
+Loaded from ``laf_types`` at startup and reloaded whenever a type is added or
+deleted, so type lookups on the request path are plain dictionary hits. A snapshot
+older than ``max_age`` is reloaded on the next lookup, which bounds how long a worker
+serves a deleted type if the invalidation for it never arrives. Lookups that
+miss are negative-cached for a short while, so a stream of unknown type filters
+costs at most one reload per name per ``miss_ttl`` instead of a collection scan each.
+Concurrent misses share one in-flight reload.
+"""
+
+from asyncio import Task, create_task, shield
+from collections.abc import Hashable, Iterable
+from html import unescape
+from time import monotonic
+from typing import Any, NamedTuple
+
+from bson import ObjectId
+
+LAF_TYPE_MISS_TTL = 60
+LAF_TYPE_MAX_AGE = 300
+LAF_TYPE_MAX_MISSES = 1024
+
+
+def normalize_type_name(name: str) -> str:
+    """Folds historical ``&amp;`` / ``&`` differences and letter case."""
+    return unescape(name).casefold()
+
+
+class _Snapshot(NamedTuple):
+    by_id: dict[ObjectId, dict[str, Any]]
+    by_name: dict[str, ObjectId]
+    by_normalized_name: dict[str, ObjectId]
+    viewable: list[str]
+
+
+class LAFTypeRegistry:
+    """Maps LAF type ids and names to type documents from one loaded snapshot.
+
+    Documents keep their stored fields, with ``type`` unescaped for display. Names
+    resolve by exact stored value first, then by ``normalize_type_name``.
+    """
+
+    def __init__(
+        self,
+        miss_ttl: float = LAF_TYPE_MISS_TTL,
+        max_misses: int = LAF_TYPE_MAX_MISSES,
+        max_age: float = LAF_TYPE_MAX_AGE,
+    ) -> None:
+        self.miss_ttl = miss_ttl
+        self.max_misses = max_misses
+        self.max_age = max_age
+        self._snapshot = _Snapshot({}, {}, {}, [])
+        self._loaded_at = 0.0
+        self._misses: dict[Hashable, float] = {}
+        self._miss_reload: Task | None = None
+        self.ready = False
+
+    def __len__(self) -> int:
+        return len(self._snapshot.by_id)
+
+    def load(self, laf_types: Iterable[dict[str, Any]]) -> None:
+        """Replace the registry contents in one swap.
+
+        Recorded misses survive a load: they only gate reloads, and a name that a
+        load brings in resolves before the miss is ever consulted.
+        """
+        by_id: dict[ObjectId, dict[str, Any]] = {}
+        by_name: dict[str, ObjectId] = {}
+        by_normalized_name: dict[str, ObjectId] = {}
+        viewable: list[str] = []
+        for laf_type in laf_types:
+            laf_type = dict(laf_type)
+            name = laf_type.get("type")
+            if isinstance(name, str):
+                by_name[name] = laf_type["_id"]
+                by_normalized_name.setdefault(
+                    normalize_type_name(name), laf_type["_id"]
+                )
+                laf_type["type"] = unescape(name)
+            by_id[laf_type["_id"]] = laf_type
+            if laf_type.get("view") is True:
+                viewable.append(laf_type["type"])
+        self._snapshot = _Snapshot(by_id, by_name, by_normalized_name, viewable)
+        self._loaded_at = monotonic()
+        self.ready = True
+
+    def expired(self) -> bool:
+        """Whether the loaded snapshot is older than ``max_age``."""
+        return self.ready and monotonic() - self._loaded_at > self.max_age
+
+    async def reload(self, laf_types_collection) -> None:
+        self.load(await laf_types_collection.find({}).to_list(length=None))
+
+    async def reload_after_miss(self, laf_types_collection) -> None:
+        """
+        Reload for a lookup miss or an expired snapshot, joining the reload already in
+        flight if any.
+
+        A burst of requests all miss before the first reload finishes, so without
+        this each one would scan ``laf_types``.
+        """
+        if self._miss_reload is None:
+            self._miss_reload = create_task(self.reload(laf_types_collection))
+            self._miss_reload.add_done_callback(self._clear_miss_reload)
+        await shield(self._miss_reload)
+
+    def _clear_miss_reload(self, task: Task) -> None:
+        if self._miss_reload is task:
+            self._miss_reload = None
+
+    def get(self, type_id: ObjectId) -> dict[str, Any] | None:
+        return self._snapshot.by_id.get(type_id)
+
+    def id_for(self, name: str) -> ObjectId | None:
+        snapshot = self._snapshot
+        type_id = snapshot.by_name.get(name)
+        if type_id is None:
+            type_id = snapshot.by_normalized_name.get(normalize_type_name(name))
+        return type_id
+
+    def viewable(self) -> list[str]:
+        """
+        Names of types with ``view`` set, in collection order.
+
+        The same list is returned until the next load, so callers must not mutate it;
+        its identity doubles as the catalog's version for ETags.
+        """
+        return self._snapshot.viewable
+
+    @staticmethod
+    def _miss_key(key: Hashable) -> Hashable:
+        return normalize_type_name(key) if isinstance(key, str) else key
+
+    def recently_missed(self, key: Hashable) -> bool:
+        expires_at = self._misses.get(self._miss_key(key))
+        return expires_at is not None and expires_at > monotonic()
+
+    def record_miss(self, key: Hashable) -> None:
+        if len(self._misses) >= self.max_misses:
+            now = monotonic()
+            self._misses = {k: t for k, t in self._misses.items() if t > now}
+            if len(self._misses) >= self.max_misses:
+                self._misses.clear()
+        self._misses[self._miss_key(key)] = monotonic() + self.miss_ttl
@@ -1,7 +1,7 @@
 from datetime import datetime
 from enum import Enum
 from html import unescape
-from typing import Annotated, TypedDict
+from typing import Annotated, Optional, TypedDict
 
 from pydantic import (
     BaseModel,
@@ -12,6 +12,7 @@ from pydantic import (
     PlainSerializer,
 )
 
+from server.helpers.pagination import decode_cursor
 from server.helpers.sanitize import sanitize_text
 from server.models.common import Name, ResponseModel
 
@@ -19,6 +20,8 @@ from server.models.common import Name, ResponseModel
 LOCATION_MAX_LEN = 60
 DESCRIPTION_MAX_LEN = 2000
 TYPE_MAX_LEN = 40
+# Items accepted by one bulk intake request
+LAF_BULK_MAX_ITEMS = 100
 
 
 def parse_date_flexible(date_str: str) -> str:
@@ -85,9 +88,18 @@ def validate_type_filter(v: str | None) -> str | None:
     return validate_type(v)
 
 
+def validate_page_cursor(v: str | None) -> str | None:
+    """Validate that a page cursor is one the listing endpoints handed out."""
+    if v is None:
+        return None
+    decode_cursor(v)
+    return v
+
+
 # Optional versions for query parameters
 DescriptionFilter = Annotated[str, BeforeValidator(validate_description_filter)]
 TypeFilter = Annotated[str, BeforeValidator(validate_type_filter)]
+PageCursor = Annotated[str, BeforeValidator(validate_page_cursor)]
 
 # Non-optional versions for required model fields
 Description = Annotated[str, BeforeValidator(validate_description)]
@@ -180,6 +192,11 @@ class DateFilter(str, Enum):
     after = "After"
 
 
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
 DateString = Annotated[
     str,
     BeforeValidator(lambda x: None if x is None else str(x)),
@@ -200,9 +217,9 @@ class LAFItem(TypedDict):
 class ArchivedLAFItem(LAFItem):
     found: bool
     archived: str
-    name: str
-    email: EmailStr
-    returned: str
+    name: Optional[str]
+    email: Optional[EmailStr]
+    returned: Optional[str]
 
 
 class LostReportItem(TypedDict):
@@ -228,6 +245,7 @@ class LAFItemResponse(ResponseModel):
 
 class LAFItemsResponse(ResponseModel):
     data: list[LAFItem]
+    next_cursor: Optional[str] = None
 
 
 class ExpireLAFItemsReponse(ResponseModel):
@@ -244,3 +262,4 @@ class LostReportItemResponse(ResponseModel):
 
 class LostReportItemsResponse(ResponseModel):
     data: list[LostReportItem]
+    next_cursor: Optional[str] = None
@@ -3,7 +3,7 @@ from typing import Annotated, Literal, Optional, TypedDict, Union
 from pydantic import BaseModel, BeforeValidator, ConfigDict, EmailStr, Field
 
 from server.helpers.sanitize import sanitize_text
-from server.models.common import Name, ResponseModel
+from server.models.common import BoolResponse, Name, ResponseModel
 
 
 def validate_loanertech_description(v: str) -> str:
@@ -77,3 +77,15 @@ class LoanerTechItem(TypedDict):
 
 class LoanerTechResponse(ResponseModel):
     data: LoanerTechItem
+
+
+LoanerTechBulkStatus = Literal["updated", "not_found", "skipped"]
+
+
+class LoanerTechBulkResult(TypedDict):
+    id: int
+    status: LoanerTechBulkStatus
+
+
+class LoanerTechBulkResponse(BoolResponse):
+    results: list[LoanerTechBulkResult]
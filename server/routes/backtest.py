@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response
 
 from server.database.backtest import (
     retrieve_backtest,
     retrieve_coursecodes,
     retrieve_courses,
 )
+from server.helpers.http_cache import conditional_response
 from server.models.backtest import (
     BacktestsReponse,
     CourseCode,
@@ -21,10 +22,15 @@ router = APIRouter()
     response_description="Course Code list retrieved",
     response_model=StringListResponse,
 )
-async def get_coursecodes(request: Request) -> StringListResponse:
+async def get_coursecodes(request: Request) -> Response:
     course_codes = await retrieve_coursecodes(request)
-    return StringListResponse(
-        data=course_codes, message="Course Codes data retrieved successfully"
+    return conditional_response(
+        request,
+        "coursecodes",
+        course_codes,
+        lambda data: StringListResponse(
+            data=data, message="Course Codes data retrieved successfully"
+        ),
     )
 
 
@@ -33,9 +39,16 @@ async def get_coursecodes(request: Request) -> StringListResponse:
     response_description="Courses list retrieved",
     response_model=CoursesResponse,
 )
-async def get_courses(request: Request, course_code: CourseCode) -> CoursesResponse:
+async def get_courses(request: Request, course_code: CourseCode) -> Response:
     courses = await retrieve_courses(request, course_code)
-    return CoursesResponse(data=courses, message="Courses data retrieved successfully")
+    return conditional_response(
+        request,
+        ("courses", course_code),
+        courses,
+        lambda data: CoursesResponse(
+            data=data, message="Courses data retrieved successfully"
+        ),
+    )
 
 
 @router.get(
@@ -43,8 +56,13 @@ async def get_courses(request: Request, course_code: CourseCode) -> CoursesRespo
     response_description="Backtests retrieved",
     response_model=BacktestsReponse,
 )
-async def get_backtest(request: Request, course_id: CourseId) -> BacktestsReponse:
+async def get_backtest(request: Request, course_id: CourseId) -> Response:
     backtest = await retrieve_backtest(request, course_id)
-    return BacktestsReponse(
-        data=backtest, message="Backtests data retrieved successfully"
+    return conditional_response(
+        request,
+        ("backtest", course_id),
+        backtest,
+        lambda data: BacktestsReponse(
+            data=data, message="Backtests data retrieved successfully"
+        ),
     )
@@ -1,17 +1,29 @@
 from typing import Optional, Tuple
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, status
-from fastapi.encoders import jsonable_encoder
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from pydantic import EmailStr
 
 from server.database.laf import (
     add_laf,
+    add_laf_items,
     add_laf_location,
     add_laf_type,
     add_lost_report,
     archive_laf_items,
     delete_laf_location,
     delete_laf_type,
+    export_laf_items,
+    export_lost_reports,
     found_laf_item,
     found_lost_report,
     mark_lost_report_as_viewed,
@@ -26,6 +38,11 @@ from server.database.laf import (
     update_lost_report_item,
 )
 from server.helpers.auth import required_auth, simple_auth_check
+from server.helpers.expiry import LAF_EXPIRY_POLICY
+from server.helpers.export import export_response
+from server.helpers.http_cache import conditional_response
+from server.helpers.json_response import trusted_response
+from server.helpers.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
 from server.helpers.sanitize import sanitize_text
 from server.models.common import (
     BoolResponse,
@@ -35,11 +52,14 @@ from server.models.common import (
     StringListResponse,
 )
 from server.models.laf import (
+    LAF_BULK_MAX_ITEMS,
     LOCATION_MAX_LEN,
+    ArchivedLAFItem,
     DateFilter,
     DateString,
     DescriptionFilter,
     ExpireLAFItemsReponse,
+    ExportFormat,
     LAFArchiveItems,
     LAFFoundItem,
     LAFItemRequest,
@@ -47,9 +67,11 @@ from server.models.laf import (
     LAFItemsResponse,
     LAFLocation,
     LAFType,
+    LostReportItem,
     LostReportItemResponse,
     LostReportItemsResponse,
     LostReportRequest,
+    PageCursor,
     TypeFilter,
 )
 
@@ -64,10 +86,15 @@ router = APIRouter()
     response_description="LAF types list retrieved",
     response_model=StringListResponse,
 )
-async def get_laf_types(request: Request) -> StringListResponse:
+async def get_laf_types(request: Request) -> Response:
     laf_types = await retrieve_laf_types(request)
-    return StringListResponse(
-        data=laf_types, message="Laf types data retrieved successfully"
+    return conditional_response(
+        request,
+        "laf_types",
+        laf_types,
+        lambda data: StringListResponse(
+            data=data, message="Laf types data retrieved successfully"
+        ),
     )
 
 
@@ -81,7 +108,7 @@ async def new_laf_type(
     laf_type: LAFType = Body(...),
     auth: dict = Depends(required_auth),
 ) -> BoolResponse:
-    dict_laf_type = jsonable_encoder(laf_type)
+    dict_laf_type = laf_type.model_dump(mode="json")
     if await add_laf_type(request, dict_laf_type["type"]):
         return BoolResponse(data=True, message="LAF type added successfully")
     raise HTTPException(
@@ -98,7 +125,7 @@ async def delete_laf_type_route(
     laf_type: LAFType = Body(...),
     auth: dict = Depends(required_auth),
 ) -> BoolResponse:
-    dict_laf_type = jsonable_encoder(laf_type)
+    dict_laf_type = laf_type.model_dump(mode="json")
     if await delete_laf_type(request, dict_laf_type["type"]):
         return BoolResponse(data=True, message="LAF type deleted successfully")
     raise HTTPException(
@@ -115,10 +142,15 @@ async def delete_laf_type_route(
     response_description="LAF locations list retrieved",
     response_model=StringListResponse,
 )
-async def get_laf_locations(request: Request) -> StringListResponse:
+async def get_laf_locations(request: Request) -> Response:
     laf_locations = await retrieve_laf_locations(request)
-    return StringListResponse(
-        data=laf_locations, message="Laf locations data retrieved successfully"
+    return conditional_response(
+        request,
+        "laf_locations",
+        laf_locations,
+        lambda data: StringListResponse(
+            data=data, message="Laf locations data retrieved successfully"
+        ),
     )
 
 
@@ -132,7 +164,7 @@ async def new_laf_location(
     laf_location: LAFLocation = Body(...),
     auth: dict = Depends(required_auth),
 ) -> BoolResponse:
-    dict_laf_location = jsonable_encoder(laf_location)
+    dict_laf_location = laf_location.model_dump(mode="json")
     if await add_laf_location(request, dict_laf_location["location"]):
         return BoolResponse(data=True, message="LAF location added successfully")
     raise HTTPException(status_code=500, detail="Failed to add LAF location")
@@ -148,7 +180,7 @@ async def delete_laf_location_route(
     laf_location: LAFLocation = Body(...),
     auth: dict = Depends(required_auth),
 ) -> BoolResponse:
-    dict_laf_location = jsonable_encoder(laf_location)
+    dict_laf_location = laf_location.model_dump(mode="json")
     if await delete_laf_location(request, dict_laf_location["location"]):
         return BoolResponse(data=True, message="LAF location deleted successfully")
     raise HTTPException(status_code=500, detail="Failed to delete LAF location")
@@ -167,11 +199,31 @@ async def new_laf_item(
     laf_item: LAFItemRequest = Body(...),
     auth: dict = Depends(required_auth),
 ) -> LAFItemResponse:
-    dict_laf = jsonable_encoder(laf_item)
+    dict_laf = laf_item.model_dump(mode="json")
     new_laf_item = await add_laf(request, dict_laf)
     return LAFItemResponse(data=new_laf_item, message="LAF added successfully")
 
 
+@router.post(
+    "/items/",
+    response_description="Created a batch of LAF items",
+    response_model=LAFItemsResponse,
+)
+async def new_laf_items(
+    request: Request,
+    laf_items: list[LAFItemRequest] = Body(
+        ..., min_length=1, max_length=LAF_BULK_MAX_ITEMS
+    ),
+    auth: dict = Depends(required_auth),
+) -> Response:
+    new_laf_items = await add_laf_items(
+        request, [laf_item.model_dump(mode="json") for laf_item in laf_items]
+    )
+    return trusted_response(
+        new_laf_items, "LAF items added successfully", next_cursor=None
+    )
+
+
 @router.get(
     "/items/",
     response_description="Filter for LAF items",
@@ -190,8 +242,14 @@ async def get_laf_items(
     type: Optional[TypeFilter] = Query(None, description="Type of the item"),
     archived: bool = Query(False, description="Archived items"),
     id: Optional[int] = Query(None, description="ID of the item", ge=1),
+    limit: int = Query(
+        DEFAULT_PAGE_LIMIT, description="Maximum rows per page", ge=1, le=MAX_PAGE_LIMIT
+    ),
+    cursor: Optional[PageCursor] = Query(
+        None, description="next_cursor of the previous page"
+    ),
     auth: dict = Depends(required_auth),
-) -> LAFItemsResponse:
+) -> LAFItemsResponse | Response:
     sanitized_locations = (
         [sanitize_text(x, max_len=LOCATION_MAX_LEN) for x in location]
         if location is not None
@@ -206,8 +264,34 @@ async def get_laf_items(
         "id": id,
     }
 
-    laf_items = await retrieve_laf_items(request, dict_laf_filters, archived)
-    return LAFItemsResponse(data=laf_items, message="Retrieved LAF items")
+    laf_items, next_cursor = await retrieve_laf_items(
+        request, dict_laf_filters, archived, limit, cursor
+    )
+    if archived:
+        # Archived rows carry fields LAFItemsResponse trims, so they stay validated
+        return LAFItemsResponse(
+            data=laf_items, message="Retrieved LAF items", next_cursor=next_cursor
+        )
+    return trusted_response(laf_items, "Retrieved LAF items", next_cursor=next_cursor)
+
+
+@router.get(
+    "/items/export/",
+    response_description="Stream every LAF item as NDJSON or CSV",
+    response_class=StreamingResponse,
+)
+async def export_laf_items_route(
+    request: Request,
+    format: ExportFormat = Query(ExportFormat.ndjson, description="Export format"),
+    archived: bool = Query(True, description="Archived items"),
+    auth: dict = Depends(required_auth),
+) -> StreamingResponse:
+    return export_response(
+        export_laf_items(request, archived),
+        format.value,
+        "archived_laf_items" if archived else "laf_items",
+        ArchivedLAFItem.__annotations__,
+    )
 
 
 @router.get(
@@ -217,14 +301,24 @@ async def get_laf_items(
 )
 async def get_laf_items_expired(
     request: Request,
-    water_bottle: int = Query(30, description="Water Bottle days to expiration"),
-    clothing: int = Query(90, description="Clothing days to expiration"),
-    umbrella: int = Query(90, description="Umbrella days to expiration"),
-    inexpensive: int = Query(180, description="Inexpensive days to expiration"),
-    expensive: int = Query(365, description="Expensive days to expiration"),
+    water_bottle: int = Query(
+        LAF_EXPIRY_POLICY.water_bottle, description="Water Bottle days to expiration"
+    ),
+    clothing: int = Query(
+        LAF_EXPIRY_POLICY.clothing, description="Clothing days to expiration"
+    ),
+    umbrella: int = Query(
+        LAF_EXPIRY_POLICY.umbrella, description="Umbrella days to expiration"
+    ),
+    inexpensive: int = Query(
+        LAF_EXPIRY_POLICY.inexpensive, description="Inexpensive days to expiration"
+    ),
+    expensive: int = Query(
+        LAF_EXPIRY_POLICY.expensive, description="Expensive days to expiration"
+    ),
     type: TypeFilter = Query("All", description="Type of the item"),
     auth: dict = Depends(required_auth),
-) -> ExpireLAFItemsReponse:
+) -> Response:
     laf_items = await retrieve_expired_laf(
         request,
         water_bottle,
@@ -234,7 +328,7 @@ async def get_laf_items_expired(
         expensive,
         type,
     )
-    return ExpireLAFItemsReponse(data=laf_items, message="Retrieved expired LAF items")
+    return trusted_response(laf_items, "Retrieved expired LAF items")
 
 
 @router.put(
@@ -248,7 +342,7 @@ async def found_laf_item_route(
     laf_found: LAFFoundItem = Body(...),
     auth: dict = Depends(required_auth),
 ) -> BoolResponse:
-    laf_found_dict = jsonable_encoder(laf_found)
+    laf_found_dict = laf_found.model_dump(mode="json")
     if await found_laf_item(request, id, laf_found_dict):
         return BoolResponse(data=True, message="LAF item updated successfully")
     raise HTTPException(
@@ -266,7 +360,7 @@ async def update_laf_item_route(
     laf_item: LAFItemRequest = Body(...),
     auth: dict = Depends(required_auth),
 ) -> BoolResponse:
-    dict_laf = jsonable_encoder(laf_item)
+    dict_laf = laf_item.model_dump(mode="json")
     if await update_laf_item(request, id, dict_laf):
         return BoolResponse(data=True, message="LAF item updated successfully")
     raise HTTPException(
@@ -285,7 +379,7 @@ async def archive_laf_items_route(
     laf_items: LAFArchiveItems = Body(...),
     auth: dict = Depends(required_auth),
 ) -> BoolResponse:
-    dict_laf = jsonable_encoder(laf_items)
+    dict_laf = laf_items.model_dump(mode="json")
     await archive_laf_items(request, dict_laf["ids"])
     return BoolResponse(data=True, message="LAF items archived successfully")
 
@@ -317,7 +411,7 @@ async def new_lost_report(
 ) -> LostReportItemResponse:
     authenticated = auth[0]
 
-    dict_lost_report = jsonable_encoder(lost_report)
+    dict_lost_report = lost_report.model_dump(mode="json")
     dict_lost_report["location"] = [
         sanitize_text(location, max_len=LOCATION_MAX_LEN)
         for location in dict_lost_report["location"].split(",")
@@ -347,8 +441,14 @@ async def get_lost_reports(
     name: Optional[NameFilter] = Query(None, description="Name of the owner"),
     email: Optional[EmailStr] = Query(None, description="Email of the owner"),
     archived: bool = Query(False, description="Archived items"),
+    limit: int = Query(
+        DEFAULT_PAGE_LIMIT, description="Maximum rows per page", ge=1, le=MAX_PAGE_LIMIT
+    ),
+    cursor: Optional[PageCursor] = Query(
+        None, description="next_cursor of the previous page"
+    ),
     auth: bool = Depends(required_auth),
-) -> LostReportItemsResponse:
+) -> Response:
     sanitized_locations = (
         [sanitize_text(x, max_len=LOCATION_MAX_LEN) for x in location]
         if location is not None
@@ -363,10 +463,31 @@ async def get_lost_reports(
         "name": name,
         "email": email,
     }
-    lost_reports = await retrieve_lost_reports(
-        request, dict_lost_report_filters, archived
+    lost_reports, next_cursor = await retrieve_lost_reports(
+        request, dict_lost_report_filters, archived, limit, cursor
+    )
+    return trusted_response(
+        lost_reports, "Retrieved Lost Reports", next_cursor=next_cursor
+    )
+
+
+@router.get(
+    "/reports/export/",
+    response_description="Stream every Lost Report as NDJSON or CSV",
+    response_class=StreamingResponse,
+)
+async def export_lost_reports_route(
+    request: Request,
+    format: ExportFormat = Query(ExportFormat.ndjson, description="Export format"),
+    archived: bool = Query(True, description="Archived items"),
+    auth: dict = Depends(required_auth),
+) -> StreamingResponse:
+    return export_response(
+        export_lost_reports(request, archived),
+        format.value,
+        "archived_lost_reports" if archived else "lost_reports",
+        LostReportItem.__annotations__,
     )
-    return LostReportItemsResponse(data=lost_reports, message="Retrieved Lost Reports")
 
 
 @router.put(
@@ -398,7 +519,7 @@ async def update_lost_report_route(
     lost_report: LostReportRequest = Body(...),
     auth: dict = Depends(required_auth),
 ) -> BoolResponse:
-    dict_lost_report = jsonable_encoder(lost_report)
+    dict_lost_report = lost_report.model_dump(mode="json")
     dict_lost_report["location"] = [
         sanitize_text(loc, max_len=LOCATION_MAX_LEN)
         for loc in dict_lost_report["location"].split(",")
@@ -432,10 +553,11 @@ async def get_new_report_count(
 )
 async def get_new_reports(
     request: Request, auth: dict = Depends(required_auth)
-) -> LostReportItemsResponse:
-    return LostReportItemsResponse(
-        data=await retrieve_new_lost_reports(request),
-        message="New Lost Reports retrieved",
+) -> Response:
+    return trusted_response(
+        await retrieve_new_lost_reports(request),
+        "New Lost Reports retrieved",
+        next_cursor=None,
     )
 
 
@@ -1,8 +1,16 @@
 from typing import Tuple
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Path, Request, status
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Path,
+    Request,
+    Response,
+    status,
+)
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 
 from server.database.loanertech import (
     add_loanertech,
@@ -11,10 +19,14 @@ from server.database.loanertech import (
     retrieve_loanertechs,
     retrieve_loanertechs_unauthenticated,
     update_loanertech,
+    update_loanertechs,
 )
 from server.helpers.auth import required_auth, simple_auth_check
-from server.models.common import BoolResponse
+from server.helpers.http_cache import conditional_response, payload_versions
+from server.models.common import BoolResponse, ResponseModel
 from server.models.loanertech import (
+    LoanerTechBulkResponse,
+    LoanerTechBulkStatus,
     LoanerTechCheckin,
     LoanerTechCheckout,
     LoanerTechRequest,
@@ -31,16 +43,31 @@ router = APIRouter()
 async def get_loanertechs(
     request: Request,
     auth: Tuple[bool, str, dict | None] = Depends(simple_auth_check),
-) -> JSONResponse:
+) -> Response:
     authenticated = auth[0]
 
-    loanertechs = (
-        await retrieve_loanertechs(request)
-        if authenticated
-        else await retrieve_loanertechs_unauthenticated(request)
+    if not authenticated:
+        return conditional_response(
+            request,
+            "loanertech_public",
+            await retrieve_loanertechs_unauthenticated(request),
+            lambda data: ResponseModel(
+                data=data, message="LoanerTech data retrieved successfully"
+            ),
+        )
+
+    # Borrower details stay out of shared caches and off the public ETag
+    payload = payload_versions.get(
+        "loanertech",
+        await retrieve_loanertechs(request),
+        lambda data: ResponseModel(
+            data=data, message="LoanerTech data retrieved successfully"
+        ),
     )
-    return JSONResponse(
-        {"data": loanertechs, "message": "LoanerTech data retrieved successfully"}
+    return Response(
+        payload.body,
+        media_type="application/json",
+        headers={"Cache-Control": "private, no-store"},
     )
 
 
@@ -112,16 +139,33 @@ async def delete_loanertech_data(
     )
 
 
+def bulk_response(
+    response: Response, outcomes: dict[int, LoanerTechBulkStatus], action: str
+) -> LoanerTechBulkResponse:
+    results = [{"id": id, "status": outcome} for id, outcome in outcomes.items()]
+    if all(outcome == "updated" for outcome in outcomes.values()):
+        return LoanerTechBulkResponse(
+            data=True, message=f"LoanerTech {action} successfully", results=results
+        )
+    response.status_code = status.HTTP_404_NOT_FOUND
+    return LoanerTechBulkResponse(
+        data=False,
+        message=f"No LoanerTech {action}, some ids were not found",
+        results=results,
+    )
+
+
 @router.put(
     "/checkout",
     response_description="Checked out LAF items",
-    response_model=BoolResponse,
+    response_model=LoanerTechBulkResponse,
 )
 async def checkout_loanertech(
     request: Request,
+    response: Response,
     req: LoanerTechCheckout = Body(...),
     auth: dict = Depends(required_auth),
-) -> BoolResponse:
+) -> LoanerTechBulkResponse:
     dict_req = jsonable_encoder(req)
     item = {
         "in_office": False,
@@ -129,14 +173,8 @@ async def checkout_loanertech(
         "email": dict_req["email"],
         "name": dict_req["name"],
     }
-    for id in dict_req["ids"]:
-        if not await update_loanertech(request, id, item):
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to add checkout loanertech",
-            )
-
-    return BoolResponse(data=True, message="LoanerTech checked out successfully")
+    outcomes = await update_loanertechs(request, dict_req["ids"], item)
+    return bulk_response(response, outcomes, "checked out")
 
 
 checkin_item = {
@@ -148,19 +186,16 @@ checkin_item = {
 
 
 @router.put(
-    "/checkin", response_description="Checked in LAF items", response_model=BoolResponse
+    "/checkin",
+    response_description="Checked in LAF items",
+    response_model=LoanerTechBulkResponse,
 )
 async def checkin_loanertech(
     request: Request,
+    response: Response,
     req: LoanerTechCheckin = Body(...),
     auth: dict = Depends(required_auth),
-) -> BoolResponse:
+) -> LoanerTechBulkResponse:
     dict_req = jsonable_encoder(req)
-    for id in dict_req["ids"]:
-        if not await update_loanertech(request, id, checkin_item):
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to add checking loanertech",
-            )
-
-    return BoolResponse(data=True, message="LoanerTech checked in successfully")
+    outcomes = await update_loanertechs(request, dict_req["ids"], checkin_item)
+    return bulk_response(response, outcomes, "checked in")
@@ -0,0 +1,91 @@
+"""
+One-shot backfill of ``description_norm`` / ``description_tokens`` on LAF documents.
+
+New and edited documents get these fields at write time; this fills them in for
+documents written before they existed. Safe to re-run: by default only documents
+missing the fields are touched, ``--all`` recomputes every document (e.g. after the
+synonym groups change).
+
+Run with ``uv run python -m server.scripts.backfill_search_fields``.
+"""
+
+import argparse
+import asyncio
+import logging
+
+from pymongo import AsyncMongoClient, UpdateOne
+
+from server.config import settings
+from server.helpers.description_search import search_fields
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_COLLECTIONS = ("laf_items", "lost_reports")
+BACKFILL_BATCH_SIZE = 500
+
+
+def backfill_query(recompute_all: bool) -> dict:
+    if recompute_all:
+        return {}
+    return {
+        "$or": [
+            {"description_norm": {"$exists": False}},
+            {"description_tokens": {"$exists": False}},
+        ]
+    }
+
+
+def backfill_update(document: dict) -> UpdateOne:
+    return UpdateOne(
+        {"_id": document["_id"]},
+        {"$set": search_fields(document.get("description") or "")},
+    )
+
+
+async def backfill_collection(collection, recompute_all: bool = False) -> int:
+    updated = 0
+    batch: list[UpdateOne] = []
+    cursor = collection.find(
+        backfill_query(recompute_all),
+        projection={"description": 1},
+        batch_size=BACKFILL_BATCH_SIZE,
+    )
+    async for document in cursor:
+        batch.append(backfill_update(document))
+        if len(batch) >= BACKFILL_BATCH_SIZE:
+            result = await collection.bulk_write(batch, ordered=False)
+            updated += result.modified_count
+            batch = []
+    if batch:
+        result = await collection.bulk_write(batch, ordered=False)
+        updated += result.modified_count
+    return updated
+
+
+async def backfill(recompute_all: bool = False) -> None:
+    client = AsyncMongoClient(settings.MONGO_DETAILS)
+    try:
+        database = client.apo_main
+        for name in BACKFILL_COLLECTIONS:
+            updated = await backfill_collection(
+                database.get_collection(name), recompute_all
+            )
+            logger.info("Backfilled search fields on %d %s documents", updated, name)
+    finally:
+        await client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="recompute the fields on every document, not just missing ones",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(backfill(recompute_all=args.all))
+
+
+if __name__ == "__main__":
+    main()
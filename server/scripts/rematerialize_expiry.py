@@ -0,0 +1,98 @@
+"""
+Rewrite ``expires_at`` / ``potentially_expires_at`` on LAF items.
+
+New and edited items get these fields at write time from ``LAF_EXPIRY_POLICY``. Run
+this once after upgrading to fill them in on older items, and with ``--all`` after
+changing the policy in ``server/helpers/expiry.py`` so stored items follow it.
+
+Run with ``uv run python -m server.scripts.rematerialize_expiry``.
+"""
+
+import argparse
+import asyncio
+import logging
+
+from pymongo import AsyncMongoClient, UpdateOne
+
+from server.config import settings
+from server.helpers.expiry import expiry_fields
+
+logger = logging.getLogger(__name__)
+
+REMATERIALIZE_BATCH_SIZE = 500
+
+
+def rematerialize_query(recompute_all: bool) -> dict:
+    if recompute_all:
+        return {}
+    return {
+        "$or": [
+            {"expires_at": {"$exists": False}},
+            {"potentially_expires_at": {"$exists": False}},
+        ]
+    }
+
+
+def rematerialize_update(document: dict, type_names: dict) -> UpdateOne:
+    # Items whose type was deleted expire on the default schedule
+    type_name = type_names.get(document.get("type_id"), "")
+    return UpdateOne(
+        {"_id": document["_id"]},
+        {"$set": expiry_fields(document["date"], type_name)},
+    )
+
+
+async def rematerialize_collection(
+    laf_items_collection, type_names: dict, recompute_all: bool = False
+) -> int:
+    updated = 0
+    batch: list[UpdateOne] = []
+    cursor = laf_items_collection.find(
+        rematerialize_query(recompute_all),
+        projection={"date": 1, "type_id": 1},
+        batch_size=REMATERIALIZE_BATCH_SIZE,
+    )
+    async for document in cursor:
+        batch.append(rematerialize_update(document, type_names))
+        if len(batch) >= REMATERIALIZE_BATCH_SIZE:
+            result = await laf_items_collection.bulk_write(batch, ordered=False)
+            updated += result.modified_count
+            batch = []
+    if batch:
+        result = await laf_items_collection.bulk_write(batch, ordered=False)
+        updated += result.modified_count
+    return updated
+
+
+async def rematerialize(recompute_all: bool = False) -> None:
+    client = AsyncMongoClient(settings.MONGO_DETAILS)
+    try:
+        database = client.apo_main
+        type_names = {
+            laf_type["_id"]: laf_type.get("type", "")
+            async for laf_type in database.get_collection("laf_types").find(
+                {}, projection={"type": 1}
+            )
+        }
+        updated = await rematerialize_collection(
+            database.get_collection("laf_items"), type_names, recompute_all
+        )
+        logger.info("Rematerialized expiry on %d laf_items documents", updated)
+    finally:
+        await client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="recompute the fields on every item, e.g. after a policy change",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(rematerialize(recompute_all=args.all))
+
+
+if __name__ == "__main__":
+    main()
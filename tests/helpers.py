@@ -0,0 +1,17 @@
+"""Test doubles shared across test modules."""
+
+
+class AsyncItems:
+    """Async iterator over ``items``, standing in for a Mongo cursor."""
+
+    def __init__(self, items: list[dict]) -> None:
+        self._items = iter(items)
+
+    def __aiter__(self) -> "AsyncItems":
+        return self
+
+    async def __anext__(self) -> dict:
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise StopAsyncIteration
@@ -0,0 +1,41 @@
+"""Unit tests for server.scripts.backfill_search_fields."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from server.helpers.description_search import search_fields
+from server.scripts import backfill_search_fields as backfill_module
+from tests.helpers import AsyncItems
+
+
+def _collection(docs: list[dict]) -> MagicMock:
+    collection = MagicMock()
+    collection.find = MagicMock(return_value=AsyncItems(docs))
+    collection.bulk_write = AsyncMock(
+        side_effect=lambda ops, ordered: MagicMock(modified_count=len(ops))
+    )
+    return collection
+
+
+def test_backfill_query_targets_missing_fields_unless_recomputing_all() -> None:
+    assert backfill_module.backfill_query(recompute_all=True) == {}
+    missing = backfill_module.backfill_query(recompute_all=False)
+    assert {"description_tokens": {"$exists": False}} in missing["$or"]
+
+
+def test_backfill_update_sets_search_fields() -> None:
+    update = backfill_module.backfill_update({"_id": 4, "description": "Red Hat"})
+    assert update._filter == {"_id": 4}
+    assert update._doc == {"$set": search_fields("Red Hat")}
+
+
+def test_backfill_collection_writes_in_batches(monkeypatch) -> None:
+    monkeypatch.setattr(backfill_module, "BACKFILL_BATCH_SIZE", 2)
+    docs = [{"_id": i, "description": f"item {i}"} for i in range(5)]
+    collection = _collection(docs)
+
+    updated = asyncio.run(backfill_module.backfill_collection(collection))
+
+    assert updated == 5
+    assert [len(c.args[0]) for c in collection.bulk_write.call_args_list] == [2, 2, 1]
+    assert collection.find.call_args.kwargs["projection"] == {"description": 1}
@@ -1,8 +1,23 @@
 """Unit tests for server.helpers.cache."""
 
+import asyncio
+import logging
+from collections import Counter
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
 from fastapi import Request
 
-from server.helpers.cache import cache_key_exclude_request
+from server.helpers import cache as cache_module
+from server.helpers.cache import (
+    L2_KEY_PREFIX,
+    QueryResultCache,
+    cache_key_exclude_request,
+    decode_cached_value,
+    encode_cached_value,
+    tiered_cached,
+)
 
 
 def _http_request() -> Request:
@@ -53,3 +68,207 @@ def test_cache_key_exclude_request_kwargs_sorted_deterministically() -> None:
 def test_cache_key_exclude_request_includes_module_and_function_name() -> None:
     key = cache_key_exclude_request(sample_fn, 42)
     assert key.startswith(f"{sample_fn.__module__}.{sample_fn.__name__}:")
+
+
+def test_query_result_cache_hit_until_generation_bump() -> None:
+    cache = QueryResultCache(ttl=60)
+    key = cache.key("laf_items", ("type", "Other"))
+    cache.set(key, ["row"])
+    assert cache.get(cache.key("laf_items", ("type", "Other"))) == ["row"]
+
+    cache.bump("laf_items")
+    assert cache.get(cache.key("laf_items", ("type", "Other"))) is None
+    assert cache.key("lost_reports") == ("lost_reports", 0)
+
+
+def test_query_result_cache_in_flight_result_not_served_after_bump() -> None:
+    cache = QueryResultCache(ttl=60)
+    key = cache.key("laf_items")
+    cache.bump("laf_items")  # write lands while the query runs
+    cache.set(key, ["stale"])
+    assert cache.get(cache.key("laf_items")) is None
+
+
+def test_query_result_cache_expires_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [100.0]
+    monkeypatch.setattr(cache_module, "monotonic", lambda: clock[0])
+    cache = QueryResultCache(ttl=5)
+    cache.set("k", [])
+    assert cache.get("k") == []
+    clock[0] = 105.0
+    assert cache.get("k") is None
+
+
+def test_query_result_cache_evicts_least_recently_used() -> None:
+    cache = QueryResultCache(ttl=60, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+class _FakeValkey:
+    """In-memory stand-in for the GlideClient calls tiered_cached makes."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.store: dict[str, bytes] = {}
+        self.fail = fail
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        if self.fail:
+            raise ConnectionError("valkey down")
+        return [self.store.get(key) for key in keys]
+
+    async def incr(self, key: str) -> int:
+        if self.fail:
+            raise ConnectionError("valkey down")
+        value = int(self.store.get(key, 0)) + 1
+        self.store[key] = str(value).encode()
+        return value
+
+    async def set(self, key: str, value: bytes, expiry=None) -> str:
+        if self.fail:
+            raise ConnectionError("valkey down")
+        self.store[key] = value
+        return "OK"
+
+
+def _request_with_valkey(client: _FakeValkey | None) -> Request:
+    app = MagicMock()
+    app.state.valkey_client = client
+    request = _http_request()
+    request.scope["app"] = app
+    return request
+
+
+def _counted_lookup(calls: list[str]):
+    @tiered_cached(ttl=60)
+    async def lookup(request: Request, code: str) -> dict:
+        calls.append(code)
+        return {"code": code, "id": ObjectId("674000000000000000000001")}
+
+    return lookup
+
+
+def test_encode_cached_value_round_trips_bson_types() -> None:
+    value = [{"id": ObjectId("674000000000000000000001"), "name": "Calc I"}]
+    assert decode_cached_value(encode_cached_value(value)) == value
+
+
+def test_tiered_cached_l1_then_l2_then_source(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache_module, "cache_stats", Counter())
+    valkey = _FakeValkey()
+    request = _request_with_valkey(valkey)
+    calls: list[str] = []
+    lookup = _counted_lookup(calls)
+
+    async def _run() -> list[dict]:
+        first = await lookup(request, "CSCI")
+        second = await lookup(request, "CSCI")
+        await lookup.cache.clear()  # another worker: cold L1, warm Valkey
+        third = await lookup(request, "CSCI")
+        return [first, second, third]
+
+    first, second, third = asyncio.run(_run())
+    assert calls == ["CSCI"]
+    assert first == second == third
+    assert list(valkey.store) == [
+        L2_KEY_PREFIX + cache_key_exclude_request(lookup.__wrapped__, request, "CSCI")
+    ]
+    assert cache_module.cache_stats == Counter(l1_hit=1, l1_miss=2, l2_miss=1, l2_hit=1)
+
+
+def test_tiered_cached_falls_back_when_valkey_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(cache_module, "cache_stats", Counter())
+    request = _request_with_valkey(_FakeValkey(fail=True))
+    calls: list[str] = []
+    lookup = _counted_lookup(calls)
+
+    result = asyncio.run(lookup(request, "MATH"))
+    assert result["code"] == "MATH"
+    assert calls == ["MATH"]
+    # The write is skipped too: without the generation the value cannot be stamped
+    assert cache_module.cache_stats["l2_error"] == 1
+
+
+def test_log_cache_stats_reports_every_tier(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setattr(cache_module, "cache_stats", Counter(l1_hit=3, l2_hit=1))
+
+    async def _run() -> None:
+        task = asyncio.create_task(cache_module.log_cache_stats(interval=0))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+    with caplog.at_level(logging.INFO, logger=cache_module.__name__):
+        asyncio.run(_run())
+    assert (
+        "Tiered cache stats: l1_hit=3 l1_miss=0 l2_hit=1 l2_miss=0 l2_error=0"
+        in caplog.messages
+    )
+
+
+def test_tiered_cached_without_request_uses_l1_only() -> None:
+    calls: list[str] = []
+    lookup = _counted_lookup(calls)
+
+    async def _run() -> None:
+        await lookup(MagicMock(), "PHYS")
+        await lookup(None, "PHYS")
+        await lookup(None, "PHYS")
+
+    asyncio.run(_run())
+    assert len(calls) == 2
+
+
+def test_tiered_cached_invalidate_retires_both_tiers() -> None:
+    valkey = _FakeValkey()
+    request = _request_with_valkey(valkey)
+    calls: list[str] = []
+    lookup = _counted_lookup(calls)
+
+    async def _run() -> None:
+        await lookup(request, "CSCI")
+        await lookup.invalidate(request, "CSCI")
+        await lookup(request, "CSCI")
+        # Another worker whose L1 already expired refills from the new value
+        await lookup.cache.clear()
+        await lookup(request, "CSCI")
+
+    asyncio.run(_run())
+    assert calls == ["CSCI", "CSCI"]
+
+
+def test_tiered_cached_lookup_racing_a_write_is_not_served_after_it() -> None:
+    valkey = _FakeValkey()
+    request = _request_with_valkey(valkey)
+    versions = ["old", "new"]
+    started, written = asyncio.Event(), asyncio.Event()
+
+    @tiered_cached(ttl=60)
+    async def lookup(request: Request) -> list[str]:
+        value = [versions.pop(0)]
+        if value == ["old"]:
+            # The write commits and invalidates while this read is in flight
+            started.set()
+            await written.wait()
+        return value
+
+    async def _write() -> None:
+        await started.wait()
+        await lookup.invalidate(request)
+        written.set()
+
+    async def _run() -> list[list[str]]:
+        stale, _ = await asyncio.gather(lookup(request), _write())
+        after_write = await lookup(request)
+        await lookup.clear_local()  # another worker with a cold L1
+        return [stale, after_write, await lookup(request)]
+
+    assert asyncio.run(_run()) == [["old"], ["new"], ["new"]]
@@ -1,15 +1,17 @@
 """Unit tests for server.helpers.db."""
 
 import asyncio
-from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pymongo.errors import DuplicateKeyError
 
+from server.helpers import db as db_module
 from server.helpers.db import (
+    SequenceAllocator,
     async_dict_itr,
-    datetime_time_delta,
-    get_next_sequence_value,
+    insert_sequenced,
+    reserve_sequence_block,
 )
 
 
@@ -23,116 +25,156 @@ def test_async_dict_itr_yields_items_in_order() -> None:
     assert asyncio.run(_run()) == [("a", 1), ("b", 2)]
 
 
-@pytest.mark.parametrize(
-    "now,days,expected",
-    [
-        (
-            datetime(2024, 3, 10, 15, 0, 0, tzinfo=timezone.utc),
-            5,
-            "2024-03-05",
-        ),
-        (
-            datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
-            0,
-            "2024-01-01",
-        ),
-    ],
-    ids=["subtract_five_days", "zero_days"],
-)
-def test_datetime_time_delta(now: datetime, days: int, expected: str) -> None:
-    async def _run() -> str:
-        return await datetime_time_delta(now, days)
-
-    assert asyncio.run(_run()) == expected
-
-
-def test_get_next_sequence_value_returns_incremented_unique() -> None:
-    seq_coll = MagicMock()
-    seq_coll.find_one_and_update = AsyncMock(return_value={"seq": 7})
-    check_coll = MagicMock()
-    check_coll.find_one = AsyncMock(return_value=None)
-
-    async def _run() -> int:
-        return await get_next_sequence_value("myseq", seq_coll, check_coll)
-
-    assert asyncio.run(_run()) == 7
-    seq_coll.insert_one.assert_not_called()
-    check_coll.find_one.assert_called_once_with({"_id": 7})
-
-
-def test_get_next_sequence_value_inserts_when_sequence_missing() -> None:
+def test_reserve_sequence_block_returns_first_of_free_range() -> None:
     seq_coll = MagicMock()
-    seq_coll.find_one_and_update = AsyncMock(return_value=None)
-    seq_coll.insert_one = AsyncMock()
+    seq_coll.find_one_and_update = AsyncMock(return_value={"seq": 24})
     check_coll = MagicMock()
     check_coll.find_one = AsyncMock(return_value=None)
 
     async def _run() -> int:
-        return await get_next_sequence_value("newseq", seq_coll, check_coll)
+        return await reserve_sequence_block("laf_id", seq_coll, check_coll, 5)
 
-    assert asyncio.run(_run()) == 1
-    seq_coll.insert_one.assert_awaited_once_with({"_id": "newseq", "seq": 1})
+    assert asyncio.run(_run()) == 20
+    seq_coll.find_one_and_update.assert_awaited_once_with(
+        {"_id": "laf_id"}, {"$inc": {"seq": 5}}, return_document=True
+    )
+    check_coll.find_one.assert_awaited_once_with(
+        {"_id": {"$gte": 20, "$lte": 24}}, projection={"_id": 1}
+    )
 
 
-def test_get_next_sequence_value_repairs_duplicate_then_returns_next() -> None:
+def test_reserve_sequence_block_repairs_overlap_then_reserves_past_max() -> None:
     seq_coll = MagicMock()
     check_coll = MagicMock()
-
-    # First inc gives 3 but _id 3 exists; max _id is 10; second inc gives 11, free.
-    seq_coll.find_one_and_update = AsyncMock(
-        side_effect=[{"seq": 3}, {"seq": 11}],
-    )
+    # 1-3 overlaps a manual insert at 2; max _id is 8, so the retry gets 9-11
+    seq_coll.find_one_and_update = AsyncMock(side_effect=[{"seq": 3}, {"seq": 11}])
     seq_coll.update_one = AsyncMock()
 
-    async def find_one_side_effect(
-        filter=None, sort=None, projection=None, **_kwargs
-    ):
-        if filter == {"_id": 3}:
-            return {"_id": 3, "data": "dup"}
+    async def find_one_side_effect(filter=None, sort=None, projection=None):
         if sort == [("_id", -1)]:
-            return {"_id": 10}
-        if filter == {"_id": 11}:
-            return None
+            return {"_id": 8}
+        if filter == {"_id": {"$gte": 1, "$lte": 3}}:
+            return {"_id": 2}
         return None
 
     check_coll.find_one = AsyncMock(side_effect=find_one_side_effect)
 
     async def _run() -> int:
-        return await get_next_sequence_value("s", seq_coll, check_coll)
+        return await reserve_sequence_block("laf_id", seq_coll, check_coll, 3)
 
-    assert asyncio.run(_run()) == 11
+    assert asyncio.run(_run()) == 9
     seq_coll.update_one.assert_awaited_once_with(
-        {"_id": "s"},
-        {"$max": {"seq": 10}},
+        {"_id": "laf_id"}, {"$max": {"seq": 8}}
     )
 
 
-def test_get_next_sequence_value_duplicate_max_collection_empty() -> None:
-    seq_coll = MagicMock()
-    check_coll = MagicMock()
-    seq_coll.find_one_and_update = AsyncMock(
-        side_effect=[{"seq": 2}, {"seq": 3}],
-    )
-    seq_coll.update_one = AsyncMock()
+class _FakeSequenceCollection:
+    """In-memory ``sequence_id``; yields to the loop like a network round trip."""
 
-    async def find_one_side_effect(
-        filter=None, sort=None, projection=None, **_kwargs
-    ):
-        if filter == {"_id": 2}:
-            return {"_id": 2}
-        if sort == [("_id", -1)]:
-            return None
-        if filter == {"_id": 3}:
-            return None
-        return None
+    def __init__(self) -> None:
+        self.seq: dict[str, int] = {}
+        self.round_trips = 0
 
-    check_coll.find_one = AsyncMock(side_effect=find_one_side_effect)
+    async def find_one_and_update(self, filter, update, return_document) -> dict:
+        self.round_trips += 1
+        await asyncio.sleep(0)
+        name = filter["_id"]
+        self.seq[name] = self.seq.get(name, 0) + update["$inc"]["seq"]
+        return {"_id": name, "seq": self.seq[name]}
 
-    async def _run() -> int:
-        return await get_next_sequence_value("empty_max", seq_coll, check_coll)
+    async def update_one(self, filter, update) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(0)
+        name = filter["_id"]
+        self.seq[name] = max(self.seq.get(name, 0), update["$max"]["seq"])
 
-    assert asyncio.run(_run()) == 3
-    seq_coll.update_one.assert_awaited_once_with(
-        {"_id": "empty_max"},
-        {"$max": {"seq": 0}},
-    )
+
+class _FakeItemsCollection:
+    """In-memory collection keyed on integer ``_id`` with a unique index."""
+
+    def __init__(self, ids: set[int] | None = None) -> None:
+        self.ids = set(ids or ())
+        self.round_trips = 0
+
+    async def find_one(self, filter=None, sort=None, projection=None) -> dict | None:
+        self.round_trips += 1
+        await asyncio.sleep(0)
+        if sort is not None:
+            return {"_id": max(self.ids)} if self.ids else None
+        condition = filter["_id"]
+        if isinstance(condition, dict):
+            low, high = condition["$gte"], condition["$lte"]
+            hits = [_id for _id in self.ids if low <= _id <= high]
+            return {"_id": min(hits)} if hits else None
+        return {"_id": condition} if condition in self.ids else None
+
+    async def insert_one(self, document: dict) -> None:
+        await asyncio.sleep(0)
+        if document["_id"] in self.ids:
+            raise DuplicateKeyError(f"duplicate _id {document['_id']}")
+        self.ids.add(document["_id"])
+
+
+def test_sequence_allocator_concurrent_inserts_are_unique_with_fewer_round_trips() -> (
+    None
+):
+    inserts = 200
+    manual_ids = {5, 37, 38}
+
+    async def _allocated() -> tuple[_FakeSequenceCollection, _FakeItemsCollection]:
+        sequences, items = _FakeSequenceCollection(), _FakeItemsCollection(manual_ids)
+        # Two workers, each with its own blocks, inserting at the same time
+        workers = [SequenceAllocator(block_size=10), SequenceAllocator(block_size=10)]
+
+        async def _insert(n: int) -> None:
+            allocator = workers[n % 2]
+            _id = await allocator.next("laf_id", sequences, items)
+            await items.insert_one({"_id": _id})
+
+        await asyncio.gather(*(_insert(n) for n in range(inserts)))
+        return sequences, items
+
+    sequences, items = asyncio.run(_allocated())
+
+    # A duplicate would have raised DuplicateKeyError out of gather
+    assert len(items.ids) == inserts + len(manual_ids)
+    # Reserving ids one at a time costs an increment and a check per insert
+    allocated_trips = sequences.round_trips + items.round_trips
+    assert allocated_trips * 5 < 2 * inserts
+
+
+def test_sequence_allocator_hands_out_block_before_reserving_again() -> None:
+    sequences, items = _FakeSequenceCollection(), _FakeItemsCollection()
+    allocator = SequenceAllocator(block_size=3)
+
+    async def _run() -> list[int]:
+        return [await allocator.next("s", sequences, items) for _ in range(7)]
+
+    assert asyncio.run(_run()) == [1, 2, 3, 4, 5, 6, 7]
+    assert sequences.round_trips == 3
+
+
+def test_insert_sequenced_retries_under_fresh_block_after_duplicate() -> None:
+    sequences, items = _FakeSequenceCollection(), _FakeItemsCollection()
+    allocator = SequenceAllocator(block_size=5)
+
+    async def _run() -> dict:
+        first = {"_id": await allocator.next("s", sequences, items)}
+        await insert_sequenced(items, first, "s", sequences)
+        # Someone writes ids inside this worker's reserved block 1-5
+        items.ids.update({2, 3})
+        second = {"_id": await allocator.next("s", sequences, items)}
+        await insert_sequenced(items, second, "s", sequences)
+        return second
+
+    with patch.object(db_module, "sequence_allocator", allocator):
+        second = asyncio.run(_run())
+
+    # The rest of the stale block is dropped; the next block starts past it
+    assert second["_id"] == 6
+    assert items.ids == {1, 2, 3, 6}
+
+
+def test_sequence_allocator_rejects_empty_blocks() -> None:
+    with pytest.raises(ValueError):
+        SequenceAllocator(block_size=0)
@@ -0,0 +1,145 @@
+"""Unit tests for server.helpers.description_index."""
+
+import pytest
+
+from server.helpers import description_index as description_index_module
+from server.helpers.description_index import DescriptionIndex, word_ngrams
+from server.helpers.description_search import (
+    build_description_prefilter,
+    search_fields,
+)
+
+DOCS = [
+    {"_id": 1, "description": "Black wool beanie", "archived": False},
+    {"_id": 2, "description": "White Apple AirPods in case", "archived": False},
+    {"_id": 3, "description": "Red umbrella small", "archived": False},
+    {"_id": 4, "description": "Blue hat with logo", "archived": True},
+    {"_id": 5, "description": "Student ID card", "archived": False},
+    {"_id": 6, "description": "chatty notebook", "archived": False},
+    {"_id": 7, "description": "Lost idcard, Hydro-Flask", "archived": False},
+]
+QUERIES = [
+    "hat",
+    "airpods",
+    "umbrella small",
+    "id",
+    "book",
+    "Apple AirPods case",
+    "hydroflask",
+    "bean",
+    "zzz",
+]
+
+
+def _loaded_index() -> DescriptionIndex:
+    index = DescriptionIndex()
+    index.load(DOCS)
+    return index
+
+
+def _matches(condition: dict, document: dict) -> bool:
+    """Evaluate the ``$in`` filters the description prefilter produces."""
+    ((field, operator),) = condition.items()
+    value = document[field]
+    values = value if isinstance(value, list) else [value]
+    return any(item in operator["$in"] for item in values)
+
+
+def _prefiltered(
+    query: str, archived: bool, index: DescriptionIndex | None = None, ids=True
+) -> set[int]:
+    tokens = None if index is None else index.matching_tokens(query)
+    candidate_ids = index.candidates(tokens, archived) if index and ids else None
+    prefilter = build_description_prefilter(query, tokens, candidate_ids)
+    stored = [{**doc, **search_fields(doc["description"])} for doc in DOCS]
+    return {
+        doc["_id"]
+        for doc in stored
+        if doc["archived"] == archived and _matches(prefilter, doc)
+    }
+
+
+def _candidates(index: DescriptionIndex, query: str, archived: bool) -> set:
+    return index.candidates(index.matching_tokens(query), archived)
+
+
+def test_word_ngrams_are_trigrams() -> None:
+    assert word_ngrams("abcd") == {"abc", "bcd"}
+    assert word_ngrams("ef") == set()
+
+
+def test_matching_tokens_none_until_loaded() -> None:
+    assert DescriptionIndex().matching_tokens("hat") is None
+
+
+@pytest.mark.parametrize("query", QUERIES)
+@pytest.mark.parametrize("archived", [False, True])
+def test_id_lookup_and_token_in_select_the_same_documents(
+    query: str, archived: bool
+) -> None:
+    index = _loaded_index()
+
+    assert _prefiltered(query, archived, index) == _prefiltered(
+        query, archived, index, ids=False
+    )
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_index_only_widens_whole_token_matches(query: str) -> None:
+    assert _prefiltered(query, False) <= _prefiltered(query, False, _loaded_index())
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        pytest.param("hat", {1, 6}, id="substring_and_synonyms"),
+        pytest.param("id", {5, 7}, id="short_token_whole_longer_synonym_substring"),
+        pytest.param("in", {2}, id="short_token_matches_whole_token_only"),
+        pytest.param("flask", {7}, id="substring_across_punctuation"),
+        pytest.param("bean", {1}, id="substring_of_synonym_word"),
+    ],
+)
+def test_matching_rule(query: str, expected: set[int]) -> None:
+    assert _prefiltered(query, False, _loaded_index()) == expected
+
+
+def test_short_tokens_are_not_widened() -> None:
+    assert _loaded_index().matching_tokens("in") == {"in"}
+
+
+def test_add_replaces_existing_description() -> None:
+    index = _loaded_index()
+    index.add(3, "Green scarf")
+    assert 3 not in _candidates(index, "umbrella", archived=False)
+    assert 3 in _candidates(index, "scarf", archived=False)
+
+
+def test_update_archived_only_keeps_tokens() -> None:
+    index = _loaded_index()
+    index.set_archived([2])
+    assert _candidates(index, "airpods", archived=False) == set()
+    assert _candidates(index, "airpods", archived=True) == {2}
+
+
+def test_update_unknown_id_without_description_is_ignored() -> None:
+    index = _loaded_index()
+    index.update(99, archived=True)
+    assert len(index) == len(DOCS)
+
+
+def test_remove_drops_postings_and_keeps_vocabulary() -> None:
+    index = _loaded_index()
+    index.remove(2)
+    assert _candidates(index, "airpods", archived=False) == set()
+    assert "airpods" not in index._postings[False]
+    assert "airpods" in index.matching_tokens("irpod")
+
+
+def test_candidates_fall_back_when_too_many(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(description_index_module, "DESCRIPTION_INDEX_MAX_CANDIDATES", 1)
+    index = _loaded_index()
+    tokens = index.matching_tokens("black card")
+    assert index.candidates(tokens, archived=False) is None
+    assert build_description_prefilter("black card", tokens) == {
+        "description_tokens": {"$in": sorted(tokens)}
+    }
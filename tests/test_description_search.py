@@ -1,23 +1,30 @@
 """Unit tests for server.helpers.description_search."""
 
 import asyncio
-import re
 
 import pytest
 from rapidfuzz import fuzz
 
+from server.helpers import description_search as description_search_module
 from server.helpers.description_search import (
+    DESCRIPTION_MATCH_THRESHOLD,
     DESCRIPTION_SEARCH_RESULT_LIMIT,
+    TopKSelector,
     _prefilter_regex_alternates,
+    batch_token_match_scores,
     build_description_prefilter,
     canonicalize_token,
     description_similarity_score,
+    description_similarity_scores,
     normalize_search_text,
+    normalized_similarity_scores,
     rank_by_description,
-    rank_by_description_async,
+    rank_cursor_by_description,
+    search_fields,
     token_match_score,
     tokenize_search_text,
 )
+from tests.helpers import AsyncItems
 
 
 @pytest.mark.parametrize(
@@ -101,6 +108,46 @@ def test_token_match_score_averages_across_multiple_query_tokens() -> None:
     assert score == pytest.approx(expected)
 
 
+def test_batch_token_match_scores_matches_token_match_score() -> None:
+    query_tokens = ["cat", "dog", "cat"]
+    texts_tokens = [["bat", "dig", "car"], [], ["dog"], ["zebra", "catalog"]]
+    expected = [token_match_score(query_tokens, tokens) for tokens in texts_tokens]
+    assert batch_token_match_scores(query_tokens, texts_tokens).tolist() == expected
+
+
+def test_batch_token_match_scores_empty_query_scores_zero() -> None:
+    assert batch_token_match_scores([], [["a"], ["b"]]).tolist() == [0.0, 0.0]
+
+
+PARITY_TEXTS = [
+    "Black wool beanie",
+    "Apple AirPods Pro case, white",
+    "blue hydroflask water bottle w/ stickers",
+    "",
+    "!!!",
+    "Student ID card (RPI)",
+    "red umbrella\x00small",
+    "  Lost   keys on a keyring  ",
+]
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["airpods", "black wool hat", "water bottle", "student id", "zzz"],
+)
+def test_description_similarity_scores_match_per_item_scores(query: str) -> None:
+    normalized_query = normalize_search_text(query)
+    expected = [
+        description_similarity_score(normalized_query, text) for text in PARITY_TEXTS
+    ]
+    assert description_similarity_scores(normalized_query, PARITY_TEXTS) == expected
+
+
+def test_description_similarity_scores_empty_inputs() -> None:
+    assert description_similarity_scores("airpods", []) == []
+    assert description_similarity_scores("", ["airpods"]) == [0.0]
+
+
 def test_prefilter_regex_alternates_expands_synonyms_sorted_deduped() -> None:
     """'hat' expands to synonym set; result sorted unique tokens."""
     alts = _prefilter_regex_alternates("hat")
@@ -160,23 +207,32 @@ def test_build_description_prefilter_blank_query(description_query: str) -> None
     assert build_description_prefilter(description_query) is None
 
 
-def test_build_description_prefilter_uses_token_regex() -> None:
+def test_build_description_prefilter_uses_token_in() -> None:
     prefilter = build_description_prefilter("Apple AirPods case")
     assert prefilter is not None
-    assert "$regex" in prefilter["description"]
-    assert "airpods" in prefilter["description"]["$regex"]
-    assert prefilter["description"]["$options"] == "i"
+    alternates = prefilter["description_tokens"]["$in"]
+    assert "airpods" in alternates
+    assert alternates == sorted(set(alternates))
+
+
+def test_build_description_prefilter_uses_index_tokens_then_ids() -> None:
+    assert build_description_prefilter("pods", {"airpods", "pods"}) == {
+        "description_tokens": {"$in": ["airpods", "pods"]}
+    }
+    assert build_description_prefilter("pods", {"airpods"}, [3, 1]) == {
+        "_id": {"$in": [3, 1]}
+    }
 
 
 def test_build_description_prefilter_hat_matches_raw_and_synonym_descriptions() -> None:
-    """Prefilter must not map hat->beanie only; raw descriptions may say 'hat'."""
+    """Prefilter must match stored canonical tokens for every synonym of the query."""
     prefilter = build_description_prefilter("hat")
     assert prefilter is not None
-    pattern = prefilter["description"]["$regex"]
-    assert "hat" in pattern
-    compiled = re.compile(pattern, re.IGNORECASE)
-    assert compiled.search("red wool hat")
-    assert compiled.search("black beanie")
+    alternates = set(prefilter["description_tokens"]["$in"])
+    assert "hat" in alternates
+    for description in ("red wool hat", "black beanie", "blue cap"):
+        assert alternates & set(search_fields(description)["description_tokens"])
+    assert not alternates & set(search_fields("that chat")["description_tokens"])
 
 
 def test_rank_by_description_orders_by_relevance_then_date() -> None:
@@ -209,15 +265,218 @@ def test_rank_by_description_custom_field() -> None:
     assert "airpods" in ranked[0]["title"]
 
 
-def test_rank_by_description_async_matches_sync() -> None:
+def test_search_fields_store_normalized_text_and_unique_canonical_tokens() -> None:
+    assert search_fields("  Black Beanie, black HAT! ") == {
+        "description_norm": "black beanie black hat",
+        "description_tokens": ["black", "beanie"],
+    }
+
+
+def test_search_fields_custom_field_and_empty_text() -> None:
+    assert search_fields("", field="title") == {"title_norm": "", "title_tokens": []}
+
+
+def test_rank_by_description_reads_stored_search_fields() -> None:
+    """Stored fields win over the raw description, so they are not recomputed."""
+    items = [
+        {"_id": 1, "description": "zzz", **search_fields("Apple AirPods case")},
+        {"_id": 2, "description": "zzz"},
+    ]
+    assert [item["_id"] for item in rank_by_description(items, "airpods")] == [1]
+
+
+def test_rank_by_description_same_order_with_and_without_stored_fields() -> None:
     items = [
-        {"description": "coat", "date": "2024-01-01"},
-        {"description": "AirPods Pro", "date": "2024-01-02"},
+        {"_id": i, "description": text, "date": f"2024-01-0{i}"}
+        for i, text in enumerate(PARITY_TEXTS[:8], start=1)
+    ]
+    stored = [{**item, **search_fields(item["description"])} for item in items]
+    for query in ("airpods", "black hat", "water bottle", "keys"):
+        assert rank_by_description(stored, query) == [
+            {**item, **search_fields(item["description"])}
+            for item in rank_by_description(items, query)
+        ]
+
+
+def _ranking_items(count: int) -> list[dict]:
+    words = ["black", "wool", "hat", "airpods", "case", "water", "bottle", "blue"]
+    return [
+        {
+            "_id": i,
+            "description": " ".join(
+                words[(i * 3 + j) % len(words)] for j in range(i % 4 + 1)
+            ),
+            "date": f"2024-0{i % 3 + 1}-01",
+        }
+        for i in range(count)
+    ]
+
+
+def _full_sort_ranking(items: list[dict], query: str) -> list[dict]:
+    """The original score-everything-then-sort ranking."""
+    ranked = [
+        (score, item)
+        for item in items
+        if (score := description_similarity_score(query, item["description"]))
+        >= DESCRIPTION_MATCH_THRESHOLD
     ]
+    ranked.sort(key=lambda pair: (pair[0], pair[1].get("date", "")), reverse=True)
+    return [item for _, item in ranked[:DESCRIPTION_SEARCH_RESULT_LIMIT]]
+
+
+def test_top_k_selector_matches_stable_sort_with_ties() -> None:
+    selector = TopKSelector(k=3, threshold=0)
+    pushed = [
+        (70, "2024-01-01"),
+        (90, "2024-01-01"),
+        (70, "2024-02-01"),
+        (70, "2024-02-01"),
+        (90, "2024-01-01"),
+    ]
+    items = [{"_id": i, "date": date} for i, (_, date) in enumerate(pushed)]
+    for (score, _), item in zip(pushed, items):
+        selector.push(score, item)
+    assert [item["_id"] for item in selector.results()] == [1, 4, 2]
+
+
+def test_top_k_selector_floor_rises_once_full() -> None:
+    selector = TopKSelector(k=2, threshold=55)
+    assert selector.floor() == 55
+    selector.push(80, {"date": "2024-01-01"})
+    selector.push(40, {"date": "2024-01-01"})
+    assert selector.floor() == 55
+    selector.push(60, {"date": "2024-01-01"})
+    assert selector.floor() == 60
+
+
+@pytest.mark.parametrize("query", ["black wool hat", "airpods case", "water bottle"])
+def test_rank_by_description_matches_full_sort(query: str) -> None:
+    items = _ranking_items(120)
+    assert rank_by_description(items, query) == _full_sort_ranking(items, query)
+
+
+def test_normalized_similarity_scores_floor_keeps_scores_that_can_place() -> None:
+    texts = [normalize_search_text(text) for text in PARITY_TEXTS]
+    full = normalized_similarity_scores("black wool hat", texts)
+    pruned = normalized_similarity_scores("black wool hat", texts, score_floor=70)
+    for full_score, pruned_score in zip(full, pruned):
+        assert pruned_score in (full_score, 0.0)
+        if full_score >= 70:
+            assert pruned_score == full_score
+
+
+def test_normalized_similarity_scores_floor_skips_expensive_scorers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    scored_choices: dict[str, int] = {}
+    score_matrix = description_search_module._score_matrix
+
+    def _counting_score_matrix(queries, choices, scorer):
+        scored_choices[scorer.__name__] = len(choices)
+        return score_matrix(queries, choices, scorer)
+
+    monkeypatch.setattr(
+        description_search_module, "_score_matrix", _counting_score_matrix
+    )
+    texts = [normalize_search_text(text) for text in PARITY_TEXTS]
+    normalized_similarity_scores("airpods", texts, score_floor=95)
+    assert scored_choices["token_set_ratio"] == 6
+    assert scored_choices["WRatio"] < 6
+    assert scored_choices["partial_ratio"] == scored_choices["WRatio"]
+
+
+@pytest.mark.parametrize("score_cutoff", [0, 40, 55, 70, 90, 120])
+@pytest.mark.parametrize(
+    "query", ["airpods", "black wool hat", "water bottle", "student id", "zzz"]
+)
+def test_description_similarity_score_cutoff_parity(
+    query: str, score_cutoff: float
+) -> None:
+    for text in PARITY_TEXTS:
+        full = description_similarity_score(query, text)
+        cut = description_similarity_score(query, text, score_cutoff=score_cutoff)
+        if full >= score_cutoff:
+            assert cut == full
+        else:
+            assert cut == 0.0
+
+
+def test_description_similarity_score_cutoff_at_exact_score() -> None:
+    full = description_similarity_score("black wool hat", "Black wool beanie")
+    assert (
+        description_similarity_score(
+            "black wool hat", "Black wool beanie", score_cutoff=full
+        )
+        == full
+    )
+
+
+def test_description_similarity_score_cutoff_skips_later_scorers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def _unexpected(*args, **kwargs):
+        raise AssertionError("scorer should have been skipped")
+
+    monkeypatch.setattr(description_search_module.fuzz, "WRatio", _unexpected)
+    monkeypatch.setattr(description_search_module.fuzz, "partial_ratio", _unexpected)
+    assert (
+        description_similarity_score("airpods", "red umbrella", score_cutoff=90) == 0.0
+    )
+
+
+@pytest.mark.parametrize("query", ["black wool hat", "airpods case", "water bottle"])
+def test_rank_by_description_early_exit_matches_batch(query: str) -> None:
+    items = _ranking_items(300)
+    stored = [{**item, **search_fields(item["description"])} for item in items]
+    expected = rank_by_description(items, query)
+    assert rank_by_description(items, query, early_exit=True) == expected
+    assert [
+        item["_id"] for item in rank_by_description(stored, query, early_exit=True)
+    ] == [item["_id"] for item in expected]
+
+
+def test_rank_cursor_by_description_early_exit_matches_batch() -> None:
+    items = _ranking_items(300)
+
+    async def _run() -> list[dict]:
+        return await rank_cursor_by_description(
+            AsyncItems(items), "black wool hat", chunk_size=50, early_exit=True
+        )
+
+    assert asyncio.run(_run()) == rank_by_description(items, "black wool hat")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, 1000])
+def test_rank_cursor_by_description_matches_rank_by_description(
+    chunk_size: int,
+) -> None:
+    items = _ranking_items(300)
+
+    async def _run() -> list[dict]:
+        return await rank_cursor_by_description(
+            AsyncItems(items), "black wool hat", chunk_size=chunk_size
+        )
+
+    assert asyncio.run(_run()) == rank_by_description(items, "black wool hat")
+
+
+def test_rank_cursor_by_description_keeps_k_matches() -> None:
+    items = [
+        {"_id": i, "description": "black wool hat", "date": "2024-01-01"}
+        for i in range(100)
+    ]
+
+    async def _run(k: int) -> list[dict]:
+        return await rank_cursor_by_description(AsyncItems(items), "wool hat", k=k)
+
+    assert len(asyncio.run(_run(DESCRIPTION_SEARCH_RESULT_LIMIT))) == 30
+    assert [item["_id"] for item in asyncio.run(_run(75))] == list(range(75))
+
+
+def test_rank_cursor_by_description_blank_query_keeps_cursor_order() -> None:
+    items = _ranking_items(5)
 
-    async def _run() -> None:
-        async_result = await rank_by_description_async(items, "airpods")
-        sync_result = rank_by_description(items, "airpods")
-        assert async_result == sync_result
+    async def _run() -> list[dict]:
+        return await rank_cursor_by_description(AsyncItems(items), "  ")
 
-    asyncio.run(_run())
+    assert asyncio.run(_run()) == items
@@ -0,0 +1,224 @@
+"""Tests for write-time LAF expiry and the queries that read it."""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from bson import ObjectId
+
+from server.database import laf as laf_module
+from server.helpers.expiry import (
+    EXPIRY_CUTOFF_CACHE_SIZE,
+    LAF_EXPIRY_POLICY,
+    expiry_cutoff,
+    expiry_day,
+    expiry_days,
+    expiry_fields,
+)
+from server.helpers.type_registry import LAFTypeRegistry
+from server.routes.laf import get_laf_items_expired
+
+WATER_BOTTLE_OID = ObjectId("674000000000000000000041")
+PHONE_OID = ObjectId("674000000000000000000042")
+ATTIRE_OID = ObjectId("674000000000000000000043")
+UMBRELLA_OID = ObjectId("674000000000000000000044")
+
+
+@pytest.mark.parametrize(
+    ("type_name", "days"),
+    [
+        pytest.param("Water Bottle", 30, id="water_bottle"),
+        pytest.param("attire", 90, id="attire_any_case"),
+        pytest.param("Umbrellas", 90, id="umbrellas"),
+        pytest.param("Electronics", 365, id="default"),
+        pytest.param("", 365, id="deleted_type"),
+    ],
+)
+def test_expiry_days_by_type(type_name: str, days: int) -> None:
+    assert expiry_days(type_name) == days
+    assert expiry_fields("2024-01-10", type_name) == {
+        "expires_at": datetime(2024, 1, 10) + timedelta(days=days),
+        "potentially_expires_at": datetime(2024, 7, 8),
+    }
+
+
+def test_stored_expiry_matches_per_request_cutoffs() -> None:
+    now = datetime(2024, 9, 1, 15, 30)
+    for type_name in ("Water Bottle", "Electronics"):
+        days = expiry_days(type_name)
+        cutoff = expiry_cutoff(now.date(), days)
+        for offset in range(-3, 4):
+            date = (now - timedelta(days=days + offset)).strftime("%Y-%m-%d")
+            expired = expiry_fields(date, type_name)["expires_at"] <= expiry_day(now)
+            assert expired == (date <= cutoff), (type_name, date)
+
+
+class _QueryCollection:
+    def __init__(self) -> None:
+        self.queries: list[dict] = []
+
+    def find(self, query: dict, projection=None) -> "_QueryCollection":
+        self.queries.append(query)
+        return self
+
+    def sort(self, *args) -> "_QueryCollection":
+        return self
+
+    def limit(self, count: int) -> "_QueryCollection":
+        return self
+
+    async def to_list(self, length=None) -> list[dict]:
+        return []
+
+
+def _registry() -> LAFTypeRegistry:
+    registry = LAFTypeRegistry()
+    registry.load(
+        [
+            {"_id": WATER_BOTTLE_OID, "type": "Water Bottle", "letter": "W"},
+            {"_id": PHONE_OID, "type": "Electronics", "letter": "E"},
+            {"_id": ATTIRE_OID, "type": "Attire", "letter": "A"},
+            {"_id": UMBRELLA_OID, "type": "Umbrellas", "letter": "U"},
+        ]
+    )
+    return registry
+
+
+def _expired_queries(type: str, policy=LAF_EXPIRY_POLICY) -> list[dict]:
+    registry = _registry()
+    collection = _QueryCollection()
+    request = MagicMock()
+    request.app.state.mongo_database.get_collection = MagicMock(return_value=collection)
+    with patch.object(laf_module, "laf_type_registry", registry):
+        asyncio.run(laf_module.retrieve_expired_laf(request, *policy, type))
+    return collection.queries
+
+
+def test_default_policy_all_expired_is_one_range() -> None:
+    expired, potential = _expired_queries("All")
+    today = expiry_day(datetime.now())
+
+    stored, unmaterialized = expired["$or"]
+    assert stored == {"archived": False, "expires_at": {"$lte": today}}
+    assert unmaterialized["expires_at"] == {"$exists": False}
+    assert set(potential["date"]) == {"$lte", "$gt"}
+
+
+def test_default_policy_single_type_reads_stored_fields() -> None:
+    [expired] = _expired_queries("Water Bottle")
+    assert expired["$or"][0] == {
+        "archived": False,
+        "expires_at": {"$lte": expiry_day(datetime.now())},
+        "type_id": WATER_BOTTLE_OID,
+    }
+    expired, potential = _expired_queries("Electronics")
+    assert expired["$or"][0]["type_id"] == potential["$or"][0]["type_id"] == PHONE_OID
+    assert set(potential["$or"][0]) == {
+        "archived",
+        "type_id",
+        "potentially_expires_at",
+        "expires_at",
+    }
+
+
+@pytest.mark.parametrize("type_name", ["All", "Water Bottle", "Electronics"])
+def test_unmaterialized_items_match_default_cutoffs(type_name: str) -> None:
+    # Items saved before expiry was stored fall back to the per-request cutoffs
+    request = MagicMock()
+    with patch.object(laf_module, "laf_type_registry", _registry()):
+        cutoffs = asyncio.run(
+            laf_module.cutoff_expiry_queries(
+                request, LAF_EXPIRY_POLICY, type_name, datetime.now().date()
+            )
+        )
+    queries = _expired_queries(type_name)
+
+    assert queries[0]["$or"][1] == {**cutoffs[0], "expires_at": {"$exists": False}}
+    if type_name == "Electronics":
+        assert queries[1]["$or"][1] == {**cutoffs[1], "expires_at": {"$exists": False}}
+
+
+@pytest.mark.parametrize(
+    "policy",
+    [
+        pytest.param(LAF_EXPIRY_POLICY, id="stored_fields"),
+        pytest.param(LAF_EXPIRY_POLICY._replace(water_bottle=7), id="date_cutoffs"),
+    ],
+)
+def test_type_filter_matches_policy_types_normalized(policy) -> None:
+    # Same schedule as expiry_fields gives the stored items, so no potential list
+    assert len(_expired_queries("water bottle", policy)) == 1
+
+
+def test_custom_thresholds_fall_back_to_date_cutoffs() -> None:
+    expired, _potential = _expired_queries(
+        "All", LAF_EXPIRY_POLICY._replace(water_bottle=7)
+    )
+
+    assert "expires_at" not in expired
+    assert len(expired["$or"]) == 4
+
+
+def test_new_laf_document_stores_expiry() -> None:
+    document = laf_module.new_laf_document(
+        {
+            "type": "Water Bottle",
+            "location": "Union",
+            "description": "Blue bottle",
+            "date": "2024-09-01",
+        },
+        5,
+        WATER_BOTTLE_OID,
+        datetime(2024, 9, 2),
+    )
+
+    assert document["expires_at"] == datetime(2024, 10, 1)
+    assert document["potentially_expires_at"] == datetime(2025, 2, 28)
+
+
+class _MinuteClock(datetime):
+    """``datetime`` whose ``now`` moves a minute further on every call."""
+
+    calls = 0
+
+    @classmethod
+    def now(cls, tz=None) -> datetime:
+        cls.calls += 1
+        return datetime(2024, 1, 1) + timedelta(minutes=cls.calls)
+
+
+def test_expired_route_cache_stays_flat_over_100k_calls() -> None:
+    # About 70 days of a minute-by-minute clock, with varying ad hoc thresholds
+    collection = _QueryCollection()
+    collection.find = lambda query, projection=None: collection
+    request = SimpleNamespace(
+        app=SimpleNamespace(
+            state=SimpleNamespace(
+                mongo_database=SimpleNamespace(get_collection=lambda name: collection)
+            )
+        )
+    )
+    sizes = {}
+
+    async def _run() -> None:
+        for call in range(1, 100_001):
+            water_bottle = LAF_EXPIRY_POLICY.water_bottle + call % 50
+            await get_laf_items_expired(
+                request, water_bottle, 90, 90, 180, 365, "All", {}
+            )
+            if call in (50_000, 100_000):
+                sizes[call] = expiry_cutoff.cache_info().currsize
+
+    expiry_cutoff.cache_clear()
+    with (
+        patch.object(laf_module, "laf_type_registry", _registry()),
+        patch.object(laf_module, "datetime", _MinuteClock),
+    ):
+        asyncio.run(_run())
+
+    assert sizes[50_000] == sizes[100_000] == EXPIRY_CUTOFF_CACHE_SIZE
+    # Keyed by day, so a day's repeated calls hit instead of adding entries
+    info = expiry_cutoff.cache_info()
+    assert info.hits > 50 * info.misses
@@ -0,0 +1,191 @@
+"""Unit tests for server.helpers.export and the LAF export streams."""
+
+import asyncio
+import csv
+import json
+import tracemalloc
+from collections.abc import AsyncIterator
+from datetime import datetime
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+import httpx
+from bson import ObjectId
+from fastapi import FastAPI, HTTPException
+
+from server.database import laf as laf_module
+from server.helpers.auth import required_auth
+from server.helpers.export import EXPORT_BATCH_SIZE, csv_chunks, ndjson_chunks
+from server.routes.laf import router as laf_router
+
+
+async def _rows(count: int) -> AsyncIterator[dict]:
+    for index in range(count):
+        yield {
+            "id": index,
+            "location": ["Union", "DCC"],
+            "description": f"item {index}",
+        }
+
+
+async def _collect(chunks: AsyncIterator[bytes]) -> list[bytes]:
+    return [chunk async for chunk in chunks]
+
+
+def test_ndjson_chunks_one_object_per_line() -> None:
+    chunks = asyncio.run(_collect(ndjson_chunks(_rows(450), chunk_rows=200)))
+
+    assert len(chunks) == 3
+    lines = b"".join(chunks).decode().splitlines()
+    assert len(lines) == 450
+    assert json.loads(lines[-1]) == {
+        "id": 449,
+        "location": ["Union", "DCC"],
+        "description": "item 449",
+    }
+
+
+def test_csv_chunks_flattens_lists_and_defuses_formulas() -> None:
+    async def _tricky_rows() -> AsyncIterator[dict]:
+        yield {"id": 1, "location": ["Union", "DCC"], "description": "=HYPERLINK()"}
+        yield {"id": 2, "location": [], "description": "-", "extra": "dropped"}
+
+    body = b"".join(
+        asyncio.run(
+            _collect(csv_chunks(_tricky_rows(), ["id", "location", "description"]))
+        )
+    )
+    rows = list(csv.DictReader(StringIO(body.decode())))
+
+    assert rows == [
+        {"id": "1", "location": "Union, DCC", "description": "'=HYPERLINK()"},
+        {"id": "2", "location": "", "description": "'-"},
+    ]
+
+
+def test_csv_chunks_empty_export_is_header_only() -> None:
+    chunks = asyncio.run(_collect(csv_chunks(_rows(0), ["id", "description"])))
+    assert chunks == [b"id,description\r\n"]
+
+
+def test_export_memory_does_not_grow_with_row_count() -> None:
+    async def _peak(count: int) -> int:
+        tracemalloc.start()
+        try:
+            async for _chunk in ndjson_chunks(_rows(count)):
+                pass
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    small = asyncio.run(_peak(1_000))
+    large = asyncio.run(_peak(50_000))
+    # Holding the large export would take megabytes; a chunk is a few kilobytes
+    assert large < small + 64 * 1024
+
+
+class _ExportCursor:
+    def __init__(self, docs: list[dict]) -> None:
+        self._docs = iter(docs)
+        self.sort_args: tuple = ()
+        self.batch: int | None = None
+
+    def sort(self, *args) -> "_ExportCursor":
+        self.sort_args = args
+        return self
+
+    def batch_size(self, size: int) -> "_ExportCursor":
+        self.batch = size
+        return self
+
+    def __aiter__(self) -> "_ExportCursor":
+        return self
+
+    async def __anext__(self) -> dict:
+        try:
+            return next(self._docs)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+def test_export_laf_items_streams_archived_rows_in_batches() -> None:
+    known_type, deleted_type = ObjectId(), ObjectId()
+    docs = [
+        {
+            "_id": item_id,
+            "type_id": type_id,
+            "location": "Union",
+            "date": "2024-05-01",
+            "description": "Black umbrella",
+            "found": found,
+            "archived": True,
+            "name": "Alfred Glump" if found else None,
+            "email": "glump@rpi.edu" if found else None,
+            "returned": datetime(2024, 5, 3) if found else None,
+        }
+        for item_id, type_id, found in [
+            (2, known_type, True),
+            (1, deleted_type, False),
+        ]
+    ]
+    cursor = _ExportCursor(docs)
+    collection = MagicMock()
+    collection.find = MagicMock(return_value=cursor)
+    request = MagicMock()
+    request.app.state.mongo_database.get_collection = MagicMock(return_value=collection)
+
+    async def _type_from_id(_request, type_id: ObjectId) -> dict:
+        if type_id != known_type:
+            raise HTTPException(status_code=400, detail="LAF Type not found")
+        return {"type": "Umbrellas", "letter": "U"}
+
+    async def _run() -> list[dict]:
+        with patch.object(laf_module, "get_type_from_id", new=_type_from_id):
+            return [row async for row in laf_module.export_laf_items(request)]
+
+    rows = asyncio.run(_run())
+
+    assert collection.find.call_args.args[0] == {"archived": True}
+    assert (
+        collection.find.call_args.kwargs["projection"]
+        == laf_module.ARCHIVED_LAF_ITEM_PROJECTION
+    )
+    assert cursor.batch == EXPORT_BATCH_SIZE
+    assert [row["display_id"] for row in rows] == ["U2", "1"]
+    assert rows[0]["returned"] == "05/03/2024"
+    assert rows[1]["type"] == "" and rows[1]["returned"] is None
+
+
+def test_export_route_streams_csv_attachment() -> None:
+    app = FastAPI()
+    app.include_router(laf_router, prefix="/laf")
+    app.dependency_overrides[required_auth] = lambda: {"sub": "staff"}
+
+    async def _export(_request, archived: bool) -> AsyncIterator[dict]:
+        yield {
+            "id": "abc",
+            "name": "Alfred Glump",
+            "location": ["Union"],
+            "archived": archived,
+        }
+
+    async def _get() -> httpx.Response:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            return await client.get("/laf/reports/export/", params={"format": "csv"})
+
+    with patch("server.routes.laf.export_lost_reports", new=_export):
+        response = asyncio.run(_get())
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert (
+        response.headers["content-disposition"]
+        == 'attachment; filename="archived_lost_reports.csv"'
+    )
+    rows = list(csv.DictReader(StringIO(response.text)))
+    assert rows[0]["id"] == "abc"
+    assert rows[0]["location"] == "Union"
+    assert rows[0]["archived"] == "True"
+    assert rows[0]["description"] == ""
@@ -0,0 +1,106 @@
+"""Unit tests for server.helpers.http_cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from server.helpers.http_cache import (
+    CATALOG_CACHE_CONTROL,
+    PayloadVersions,
+    content_etag,
+    etag_matches,
+    payload_versions,
+)
+from server.models.common import StringListResponse
+from server.routes.backtest import router as backtest_router
+
+
+def _build(data: list[str]) -> StringListResponse:
+    return StringListResponse(data=data, message="ok")
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        pytest.param(None, False, id="missing"),
+        pytest.param('"abc"', True, id="exact"),
+        pytest.param('W/"abc"', True, id="weak"),
+        pytest.param('"xyz", "abc"', True, id="list"),
+        pytest.param("*", True, id="wildcard"),
+        pytest.param('"abcd"', False, id="different"),
+    ],
+)
+def test_etag_matches(header: str | None, expected: bool) -> None:
+    assert etag_matches(header, '"abc"') is expected
+
+
+def test_payload_versions_build_once_per_cached_value() -> None:
+    versions = PayloadVersions()
+    built: list[list[str]] = []
+
+    def _counting_build(data: list[str]) -> StringListResponse:
+        built.append(data)
+        return _build(data)
+
+    cached = ["Attire", "Keys"]
+    first = versions.get("laf_types", cached, _counting_build)
+    again = versions.get("laf_types", cached, _counting_build)
+    refreshed = versions.get("laf_types", ["Attire", "Keys"], _counting_build)
+    changed = versions.get("laf_types", ["Attire"], _counting_build)
+
+    assert again is first
+    assert len(built) == 3
+    assert refreshed.etag == first.etag
+    assert changed.etag != first.etag
+    assert first.body == _build(cached).model_dump_json().encode()
+    assert first.etag == content_etag(first.body)
+
+
+def test_payload_versions_evicts_oldest() -> None:
+    versions = PayloadVersions(max_entries=1)
+    first_source = ["a"]
+    versions.get("x", first_source, _build)
+    versions.get("y", ["b"], _build)
+    assert len(versions._entries) == 1
+    assert ("x", id(first_source)) not in versions._entries
+
+
+def test_catalog_route_answers_304_for_current_etag() -> None:
+    payload_versions.clear()
+    app = FastAPI()
+    app.include_router(backtest_router)
+    course_codes = ["CSCI", "MATH"]
+
+    async def _run() -> tuple[httpx.Response, ...]:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            full = await client.get("/coursecodes/")
+            etag = full.headers["etag"]
+            not_modified = await client.get(
+                "/coursecodes/", headers={"If-None-Match": etag}
+            )
+            stale = await client.get("/coursecodes/", headers={"If-None-Match": '"x"'})
+        return full, not_modified, stale
+
+    with patch(
+        "server.routes.backtest.retrieve_coursecodes",
+        new=AsyncMock(return_value=course_codes),
+    ):
+        full, not_modified, stale = asyncio.run(_run())
+    etag = full.headers["etag"]
+
+    assert full.status_code == 200
+    assert full.json() == {
+        "data": course_codes,
+        "message": "Course Codes data retrieved successfully",
+    }
+    assert full.headers["content-type"] == "application/json"
+    assert full.headers["cache-control"] == CATALOG_CACHE_CONTROL
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    assert stale.status_code == 200
@@ -0,0 +1,142 @@
+"""Unit tests for server.helpers.invalidation."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from server.helpers.invalidation import INVALIDATION_CHANNEL, InvalidationBus
+
+
+def _bus_with_recorder() -> tuple[InvalidationBus, list[str]]:
+    bus = InvalidationBus()
+    applied: list[str] = []
+
+    @bus.on("laf_types")
+    async def _types(app) -> None:
+        applied.append("laf_types")
+
+    @bus.on("laf_locations")
+    async def _locations(app) -> None:
+        applied.append("laf_locations")
+
+    return bus, applied
+
+
+class _Subscriber:
+    """Stand-in for a subscribed GlideClient: yields queued messages, then waits."""
+
+    def __init__(self, messages: list[bytes]) -> None:
+        self._messages = list(messages)
+        self.closed = False
+
+    async def get_pubsub_message(self) -> SimpleNamespace:
+        if not self._messages:
+            await asyncio.Event().wait()
+        return SimpleNamespace(message=self._messages.pop(0))
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def test_publish_applies_locally_without_subscriber() -> None:
+    bus, applied = _bus_with_recorder()
+    request = MagicMock()
+    request.app.state.valkey_client.publish = AsyncMock()
+
+    asyncio.run(bus.publish(request, "laf_types"))
+
+    assert applied == ["laf_types"]
+    request.app.state.valkey_client.publish.assert_not_awaited()
+
+
+def test_messages_from_other_workers_are_applied_own_are_skipped() -> None:
+    bus, applied = _bus_with_recorder()
+
+    async def _run() -> None:
+        await bus.handle_message(MagicMock(), f"{bus.worker_id}:laf_types".encode())
+        await bus.handle_message(MagicMock(), b"otherworker:laf_locations")
+        await bus.handle_message(MagicMock(), b"otherworker:unknown")
+        await bus.handle_message(MagicMock(), b"garbage")
+
+    asyncio.run(_run())
+    assert applied == ["laf_locations"]
+
+
+def test_failing_handler_does_not_block_the_rest() -> None:
+    bus, applied = _bus_with_recorder()
+
+    @bus.on("laf_types")
+    async def _broken(app) -> None:
+        raise RuntimeError("boom")
+
+    @bus.on("laf_types")
+    async def _after(app) -> None:
+        applied.append("after")
+
+    asyncio.run(bus.apply(MagicMock(), "laf_types"))
+    assert applied == ["laf_types", "after"]
+
+
+def test_started_bus_publishes_and_listens_until_stopped() -> None:
+    bus, applied = _bus_with_recorder()
+    subscriber = _Subscriber([b"otherworker:laf_types", b"otherworker:laf_locations"])
+    request = MagicMock()
+    request.app.state.valkey_client.publish = AsyncMock(return_value=1)
+
+    async def _run() -> None:
+        bus.start(MagicMock(), subscriber)
+        await asyncio.sleep(0.01)
+        await bus.publish(request, "laf_locations")
+        await bus.stop()
+
+    asyncio.run(_run())
+    assert applied == ["laf_types", "laf_locations", "laf_locations"]
+    request.app.state.valkey_client.publish.assert_awaited_once_with(
+        f"{bus.worker_id}:laf_locations", INVALIDATION_CHANNEL
+    )
+    assert subscriber.closed
+
+
+def test_keyed_messages_reach_remote_handlers_from_other_workers_only() -> None:
+    bus, applied = _bus_with_recorder()
+    received: list[tuple[str, ...]] = []
+
+    @bus.on_remote("laf_types")
+    async def _remote(app, keys) -> None:
+        received.append(keys)
+
+    async def _run() -> None:
+        await bus.handle_message(MagicMock(), f"{bus.worker_id}:laf_types:1".encode())
+        await bus.handle_message(MagicMock(), b"otherworker:laf_types:4,5")
+        await bus.handle_message(MagicMock(), b"otherworker:laf_types")
+
+    asyncio.run(_run())
+    assert applied == ["laf_types", "laf_types"]
+    assert received == [("4", "5"), ()]
+
+
+def test_remote_handlers_sync_before_local_invalidation() -> None:
+    bus, applied = _bus_with_recorder()
+
+    @bus.on_remote("laf_types")
+    async def _remote(app, keys) -> None:
+        applied.append("remote")
+
+    asyncio.run(bus.handle_message(MagicMock(), b"otherworker:laf_types:4"))
+    assert applied == ["remote", "laf_types"]
+
+
+def test_publish_sends_keys_with_the_namespace() -> None:
+    bus, _applied = _bus_with_recorder()
+    request = MagicMock()
+    request.app.state.valkey_client.publish = AsyncMock(return_value=1)
+
+    async def _run() -> None:
+        bus.start(MagicMock(), _Subscriber([]))
+        await bus.publish(request, "laf_types", [4, 5])
+        await bus.stop()
+
+    asyncio.run(_run())
+    request.app.state.valkey_client.publish.assert_awaited_once_with(
+        f"{bus.worker_id}:laf_types:4,5", INVALIDATION_CHANNEL
+    )
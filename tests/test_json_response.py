@@ -0,0 +1,85 @@
+"""Unit tests for server.helpers.json_response."""
+
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from server.database.laf import format_laf_item, format_lost_report
+from server.helpers.json_response import trusted_response
+from server.models.laf import (
+    ExpireLAFItemsReponse,
+    LAFItemsResponse,
+    LostReportItemsResponse,
+)
+
+LAF_TYPE = {"_id": ObjectId(), "type": "Attire & Bags", "letter": "A"}
+
+
+def _laf_items() -> list[dict]:
+    descriptions = ["Red sweater", 'Blue "North Face" jacket', "Café mug ☕", ""]
+    return [
+        format_laf_item(
+            {
+                "_id": item_id,
+                "location": "Union",
+                "date": "2024-09-01",
+                "description": description,
+                "type_id": LAF_TYPE["_id"],
+            },
+            LAF_TYPE,
+        )
+        for item_id, description in enumerate(descriptions, 1)
+    ]
+
+
+def _lost_reports() -> list[dict]:
+    return [
+        format_lost_report(
+            {
+                "_id": ObjectId(),
+                "name": "Alfred Glump",
+                "email": "glump@rpi.edu",
+                "location": ["Union ", " DCC"],
+                "date": "2024-09-01",
+                "description": "Lost <b>keys</b> near the Ünion",
+                "found": False,
+                "archived": bool(index % 2),
+                "created": datetime(2024, 9, 1),
+                "type_id": LAF_TYPE["_id"],
+            },
+            LAF_TYPE,
+        )
+        for index in range(3)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("model", "data", "fields"),
+    [
+        pytest.param(
+            LAFItemsResponse, _laf_items(), {"next_cursor": "abc"}, id="laf_items"
+        ),
+        pytest.param(
+            LostReportItemsResponse,
+            _lost_reports(),
+            {"next_cursor": None},
+            id="lost_reports",
+        ),
+        pytest.param(
+            ExpireLAFItemsReponse,
+            {"expired": _laf_items(), "potential": _laf_items()[:1]},
+            {},
+            id="expired",
+        ),
+        pytest.param(LAFItemsResponse, [], {"next_cursor": None}, id="empty"),
+    ],
+)
+def test_trusted_response_matches_validated_response(model, data, fields) -> None:
+    validated = JSONResponse(jsonable_encoder(model(data=data, message="ok", **fields)))
+    trusted = trusted_response(data, "ok", **fields)
+
+    assert trusted.body == validated.body
+    assert trusted.media_type == "application/json"
@@ -6,13 +6,22 @@ real database. For full stack tests, use a test Mongo instance and the HTTP API.
 """
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from bson import ObjectId
+from fastapi import HTTPException
 
 from server.database import laf as laf_module
+from server.helpers.description_index import DescriptionIndex
+from server.helpers.pagination import (
+    PAGE_SORT,
+    after_cursor,
+    decode_cursor,
+    encode_cursor,
+)
+from server.helpers.type_registry import LAFTypeRegistry
 
 
 class _FakeCursor:
@@ -21,8 +30,10 @@ class _FakeCursor:
     def __init__(self, docs: list[dict]) -> None:
         self._docs = docs
         self._limit: int | None = None
+        self.sort_args: tuple = ()
 
-    def sort(self, *_args, **_kwargs) -> "_FakeCursor":
+    def sort(self, *args, **_kwargs) -> "_FakeCursor":
+        self.sort_args = args
         return self
 
     def limit(self, n: int) -> "_FakeCursor":
@@ -80,6 +91,19 @@ def _request_with_mongo_collection(collection: MagicMock) -> MagicMock:
     return request
 
 
+def _patch_laf_types(type_doc: dict):
+    """Resolve every ``type_id`` in a bulk type lookup to ``type_doc``."""
+    return patch.object(
+        laf_module,
+        "get_types_by_ids",
+        new=AsyncMock(
+            side_effect=lambda _request, type_ids: {
+                type_id: type_doc for type_id in type_ids
+            }
+        ),
+    )
+
+
 async def _retrieve_ranking_with_find_capture(
     docs: list[dict],
     type_doc: dict,
@@ -90,15 +114,18 @@ async def _retrieve_ranking_with_find_capture(
     collection.find = MagicMock(return_value=_FakeCursor(docs))
     request = _request_with_mongo_collection(collection)
 
-    with patch.object(
-        laf_module,
-        "get_type_from_id",
-        new_callable=AsyncMock,
-        return_value=type_doc,
-    ):
-        results = await retrieve(request, query, False)
+    with _patch_laf_types(type_doc):
+        page = await retrieve(request, query, False)
         find_query = collection.find.call_args.args[0]
-    return results, find_query
+    return page.items, find_query
+
+
+@pytest.fixture(autouse=True)
+def empty_query_cache() -> Iterator[None]:
+    """Each test queries its own mocked collection, so never reuse cached results."""
+    laf_module.laf_query_cache.clear()
+    yield
+    laf_module.laf_query_cache.clear()
 
 
 @pytest.fixture
@@ -200,8 +227,7 @@ def test_retrieve_ranks_by_description(
         assert "airpods" in results[0]["description"].lower()
 
     assert find_query["archived"] is False
-    assert find_query["description"]["$options"] == "i"
-    assert "airpods" in find_query["description"]["$regex"]
+    assert "airpods" in find_query["description_tokens"]["$in"]
 
 
 def test_retrieve_laf_items_by_id_skips_description_ranking(
@@ -217,19 +243,324 @@ def test_retrieve_laf_items_by_id_skips_description_ranking(
 
         type_doc = {"type": "Other", "letter": "O"}
 
-        with patch.object(
-            laf_module,
-            "get_type_from_id",
-            new_callable=AsyncMock,
-            return_value=type_doc,
-        ):
-            return await laf_module.retrieve_laf_items(
+        with _patch_laf_types(type_doc):
+            page = await laf_module.retrieve_laf_items(
                 request,
                 _make_laf_query(id=1, description="airpods"),
                 archived=False,
             )
+        return page.items
 
     results = asyncio.run(_run())
     assert len(results) == 1
     assert results[0]["id"] == 1
     assert "textbook" in results[0]["description"].lower()
+
+
+def test_retrieve_laf_items_uses_loaded_description_index(
+    sample_type_oid: ObjectId, laf_docs: list[dict]
+) -> None:
+    """A loaded index turns the description prefilter into an ``_id`` lookup."""
+    index = DescriptionIndex()
+    index.load(laf_docs)
+
+    async def _run() -> tuple[list, dict]:
+        with patch.object(laf_module, "laf_items_description_index", index):
+            return await _retrieve_ranking_with_find_capture(
+                laf_docs,
+                {"type": "Other", "letter": "O"},
+                _make_laf_query(description="airpods"),
+                laf_module.retrieve_laf_items,
+            )
+
+    results, find_query = asyncio.run(_run())
+    assert results[0]["id"] == 2
+    assert find_query["_id"] == {"$in": [2]}
+    assert "description_tokens" not in find_query
+
+
+def test_remote_invalidation_refetches_written_descriptions(
+    laf_docs: list[dict],
+) -> None:
+    """Another worker's keyed write is refetched into this worker's index."""
+    index = DescriptionIndex()
+    index.load(laf_docs)
+    collection = MagicMock()
+    collection.find.return_value.to_list = AsyncMock(
+        return_value=[{"_id": 2, "description": "Red wool hat", "archived": False}]
+    )
+    app = MagicMock()
+    app.state.mongo_database.get_collection = MagicMock(return_value=collection)
+
+    with patch.object(laf_module, "laf_items_description_index", index):
+        asyncio.run(
+            laf_module.invalidation_bus.handle_message(
+                app, b"otherworker:laf_items:2,3"
+            )
+        )
+
+    assert collection.find.call_args.args[0] == {"_id": {"$in": [2, 3]}}
+
+    def _candidates(query: str, archived: bool) -> set:
+        return index.candidates(index.matching_tokens(query), archived)
+
+    assert _candidates("airpods", False) == set()
+    assert _candidates("wool", False) == {2}
+    assert 3 not in _candidates("umbrella", False) | _candidates("umbrella", True)
+
+
+def test_writes_update_the_index_before_publishing(laf_docs: list[dict]) -> None:
+    """Caches invalidated by the publish are refilled from the written index."""
+    index = DescriptionIndex()
+    index.load(laf_docs)
+    collection = MagicMock()
+    collection.update_many = AsyncMock()
+    request = _request_with_mongo_collection(collection)
+    published: list[set | None] = []
+
+    async def _publish(*_args, **_kwargs) -> None:
+        published.append(index.candidates(index.matching_tokens("airpods"), True))
+
+    with (
+        patch.object(laf_module, "laf_items_description_index", index),
+        patch.object(laf_module.invalidation_bus, "publish", new=_publish),
+    ):
+        asyncio.run(laf_module.archive_laf_items(request, [2]))
+
+    assert published == [{2}]
+
+
+def test_sync_description_indexes_reconciles_and_reloads(
+    laf_docs: list[dict],
+) -> None:
+    """Periodic syncs pick up missed writes, and past max age reload everything."""
+    laf_index = DescriptionIndex()
+    laf_index.load(laf_docs)
+    laf_items = MagicMock()
+    laf_items.find.return_value.to_list = AsyncMock(
+        return_value=[{"_id": 2, "description": "Red wool hat", "archived": False}]
+    )
+    lost_reports = MagicMock()
+    lost_reports.find.return_value.to_list = AsyncMock(return_value=[])
+    collections = {"laf_items": laf_items, "lost_reports": lost_reports}
+    app = MagicMock()
+    app.state.mongo_database.get_collection = MagicMock(
+        side_effect=collections.__getitem__
+    )
+
+    async def _run(max_age: float) -> None:
+        task = asyncio.create_task(
+            laf_module.sync_description_indexes(app, interval=0, max_age=max_age)
+        )
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+    with (
+        patch.object(laf_module, "laf_items_description_index", laf_index),
+        patch.object(laf_module, "lost_reports_description_index", DescriptionIndex()),
+    ):
+        asyncio.run(_run(max_age=3600))
+        assert laf_items.find.call_args.args[0].keys() == {"updated"}
+        assert laf_index.candidates(laf_index.matching_tokens("wool"), False) == {2}
+        assert len(laf_index) == len(laf_docs)
+
+        asyncio.run(_run(max_age=0))
+        assert laf_items.find.call_args.args[0] == {}
+        assert len(laf_index) == 1
+
+
+def test_retrieve_laf_items_caches_until_write(laf_docs: list[dict]) -> None:
+    """Repeat searches are served from cache until a write bumps the generation."""
+    collection = MagicMock()
+    collection.find = MagicMock(
+        side_effect=lambda *_args, **_kwargs: _FakeCursor(laf_docs)
+    )
+    collection.update_many = AsyncMock()
+    request = _request_with_mongo_collection(collection)
+
+    async def _run() -> tuple[list, list, list]:
+        with _patch_laf_types({"type": "Other", "letter": "O"}):
+            first = await laf_module.retrieve_laf_items(
+                request, _make_laf_query(description="AirPods!"), False
+            )
+            second = await laf_module.retrieve_laf_items(
+                request, _make_laf_query(description="airpods"), False
+            )
+            await laf_module.archive_laf_items(request, [2])
+            third = await laf_module.retrieve_laf_items(
+                request, _make_laf_query(description="airpods"), False
+            )
+        return first, second, third
+
+    first, second, third = asyncio.run(_run())
+    assert second is first
+    assert third == first and third is not first
+    assert collection.find.call_count == 2
+
+
+def test_retrieve_laf_items_pages_by_keyset(laf_docs: list[dict]) -> None:
+    newest_first = sorted(laf_docs, key=lambda d: d["date"], reverse=True)
+    cursors = [_FakeCursor(newest_first), _FakeCursor(newest_first[2:])]
+    collection = MagicMock()
+    collection.find = MagicMock(side_effect=cursors)
+    request = _request_with_mongo_collection(collection)
+
+    async def _run() -> tuple:
+        with _patch_laf_types({"type": "Other", "letter": "O"}):
+            first = await laf_module.retrieve_laf_items(
+                request, _make_laf_query(), False, limit=2
+            )
+            second = await laf_module.retrieve_laf_items(
+                request, _make_laf_query(), False, limit=2, cursor=first.next_cursor
+            )
+        return first, second
+
+    first, second = asyncio.run(_run())
+    assert [item["id"] for item in first.items] == [2, 3]
+    assert decode_cursor(first.next_cursor) == ("2024-05-01", 3)
+    assert [item["id"] for item in second.items] == [1]
+    assert second.next_cursor is None
+
+    first_query, second_query = (c.args[0] for c in collection.find.call_args_list)
+    assert first_query == {"archived": False}
+    assert second_query == {
+        "$and": [{"archived": False}, after_cursor(first.next_cursor)]
+    }
+    assert all(cursor.sort_args == (PAGE_SORT,) for cursor in cursors)
+    # One row past the page is fetched to detect the next one
+    assert cursors[0]._limit == 3
+
+
+def test_description_search_rejects_page_cursor(laf_docs: list[dict]) -> None:
+    collection = MagicMock()
+    collection.find = MagicMock(return_value=_FakeCursor(laf_docs))
+    request = _request_with_mongo_collection(collection)
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(
+            laf_module.retrieve_laf_items(
+                request,
+                _make_laf_query(description="airpods"),
+                cursor=encode_cursor(laf_docs[0]),
+            )
+        )
+    assert exc_info.value.status_code == 400
+
+
+def test_query_filter_key_ignores_order_and_blank_description() -> None:
+    assert laf_module.query_filter_key(
+        _make_laf_query(location=["Union", "DCC"], description="  ")
+    ) == laf_module.query_filter_key(_make_laf_query(location=["DCC", "Union"]))
+    assert laf_module.query_filter_key(
+        _make_laf_query(description="Black Hat")
+    ) != laf_module.query_filter_key(_make_laf_query(description="black cap"))
+
+
+@pytest.mark.parametrize(
+    ("description", "archived", "expected"),
+    [
+        pytest.param(None, False, laf_module.LAF_ITEM_PROJECTION, id="active"),
+        pytest.param(
+            None, True, laf_module.ARCHIVED_LAF_ITEM_PROJECTION, id="archived"
+        ),
+        pytest.param(
+            "airpods",
+            False,
+            {
+                **laf_module.LAF_ITEM_PROJECTION,
+                **laf_module.DESCRIPTION_SEARCH_PROJECTION,
+            },
+            id="description_search",
+        ),
+    ],
+)
+def test_retrieve_laf_items_projects_helper_fields(
+    description: str | None, archived: bool, expected: dict
+) -> None:
+    collection = MagicMock()
+    collection.find = MagicMock(return_value=_FakeCursor([]))
+    request = _request_with_mongo_collection(collection)
+
+    asyncio.run(
+        laf_module.retrieve_laf_items(
+            request, _make_laf_query(description=description), archived
+        )
+    )
+    assert collection.find.call_args.kwargs["projection"] == expected
+
+
+def _types_request(type_docs: list[dict]) -> tuple[MagicMock, MagicMock]:
+    collection = MagicMock()
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(side_effect=lambda **_: [dict(d) for d in type_docs])
+    collection.find = MagicMock(return_value=cursor)
+    return _request_with_mongo_collection(collection), collection
+
+
+def test_laf_items_helper_resolves_types_in_one_query() -> None:
+    hat_oid = ObjectId("674000000000000000000002")
+    phone_oid = ObjectId("674000000000000000000003")
+    request, collection = _types_request(
+        [
+            {"_id": hat_oid, "type": "Hats &amp; Caps", "letter": "H"},
+            {"_id": phone_oid, "type": "Electronics", "letter": "E"},
+        ]
+    )
+    docs = [
+        {
+            "_id": i,
+            "type_id": oid,
+            "location": "Union",
+            "date": f"2024-03-0{i}",
+            "description": f"item {i}",
+        }
+        for i, oid in enumerate([hat_oid, phone_oid, hat_oid], start=1)
+    ]
+
+    with patch.object(laf_module, "laf_type_registry", LAFTypeRegistry()):
+        results = asyncio.run(laf_module.laf_items_helper(request, docs))
+        again = asyncio.run(laf_module.laf_items_helper(request, docs))
+
+    # One registry load on the first miss; afterwards every lookup is in memory
+    assert collection.find.call_count == 1
+    assert again == results
+    assert [r["display_id"] for r in results] == ["H1", "E2", "H3"]
+    assert results[0]["type"] == "Hats & Caps"
+    assert results[1]["date"] == "03/02/2024"
+
+
+def test_unknown_type_is_bad_request_and_negative_cached() -> None:
+    request, collection = _types_request([])
+    unknown = ObjectId("674000000000000000000009")
+
+    with patch.object(laf_module, "laf_type_registry", LAFTypeRegistry()):
+        for _ in range(3):
+            with pytest.raises(HTTPException) as exc_info:
+                asyncio.run(laf_module.get_types_by_ids(request, (unknown,)))
+            assert exc_info.value.status_code == 400
+            with pytest.raises(HTTPException):
+                asyncio.run(laf_module.get_type_id(request, "Spaceships"))
+
+    assert collection.find.call_count == 2
+
+
+def test_concurrent_unknown_type_misses_share_one_reload() -> None:
+    request, collection = _types_request([])
+
+    async def _slow_to_list(**_kwargs) -> list:
+        await asyncio.sleep(0.01)
+        return []
+
+    collection.find.return_value.to_list = AsyncMock(side_effect=_slow_to_list)
+
+    async def _lookup() -> None:
+        with pytest.raises(HTTPException):
+            await laf_module.get_type_id(request, "Spaceships")
+
+    async def _run() -> None:
+        await asyncio.gather(*(_lookup() for _ in range(20)))
+
+    with patch.object(laf_module, "laf_type_registry", LAFTypeRegistry()):
+        asyncio.run(_run())
+
+    assert collection.find.call_count == 1
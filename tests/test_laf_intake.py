@@ -0,0 +1,162 @@
+"""Tests for bulk LAF item intake: one sequence reservation, one insert."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from bson import ObjectId
+from fastapi import FastAPI, HTTPException
+from pymongo.errors import BulkWriteError
+
+from server.database import laf as laf_module
+from server.helpers.auth import required_auth
+from server.helpers.type_registry import LAFTypeRegistry
+from server.models.laf import LAF_BULK_MAX_ITEMS
+from server.routes.laf import router as laf_router
+
+UMBRELLA_OID = ObjectId("674000000000000000000021")
+PHONE_OID = ObjectId("674000000000000000000022")
+
+
+def _registry() -> LAFTypeRegistry:
+    registry = LAFTypeRegistry()
+    registry.load(
+        [
+            {"_id": UMBRELLA_OID, "type": "Umbrellas", "letter": "U", "view": True},
+            {"_id": PHONE_OID, "type": "Electronics", "letter": "E", "view": True},
+        ]
+    )
+    return registry
+
+
+def _item(type_name: str, description: str) -> dict:
+    return {
+        "type": type_name,
+        "location": "Union",
+        "description": f" {description} ",
+        "date": "2024-09-01",
+    }
+
+
+def _intake_request(
+    laf_items_collection: MagicMock,
+) -> tuple[MagicMock, MagicMock]:
+    sequence_collection = MagicMock()
+    sequence_collection.find_one_and_update = AsyncMock(return_value={"seq": 42})
+    laf_items_collection.find_one = AsyncMock(return_value=None)
+    collections = {
+        "sequence_id": sequence_collection,
+        "laf_items": laf_items_collection,
+    }
+    request = MagicMock()
+    request.app.state.mongo_database.get_collection = MagicMock(
+        side_effect=collections.__getitem__
+    )
+    return request, sequence_collection
+
+
+def test_add_laf_items_reserves_one_block_and_inserts_once() -> None:
+    laf_items_collection = MagicMock()
+    laf_items_collection.insert_many = AsyncMock()
+    request, sequence_collection = _intake_request(laf_items_collection)
+    items = [
+        _item("Umbrellas", "Black umbrella"),
+        _item("Electronics", "iPhone 13"),
+        _item("Umbrellas", "Red umbrella"),
+    ]
+
+    with (
+        patch.object(laf_module, "laf_type_registry", _registry()),
+        patch.object(
+            laf_module.invalidation_bus, "publish", new=AsyncMock()
+        ) as publish,
+        patch.object(laf_module, "laf_items_description_index") as index,
+    ):
+        results = asyncio.run(laf_module.add_laf_items(request, items))
+
+    sequence_collection.find_one_and_update.assert_awaited_once_with(
+        {"_id": "laf_id"}, {"$inc": {"seq": 3}}, return_document=True
+    )
+    laf_items_collection.insert_many.assert_awaited_once()
+    docs = laf_items_collection.insert_many.await_args.args[0]
+    assert [doc["_id"] for doc in docs] == [40, 41, 42]
+    assert [doc["type_id"] for doc in docs] == [UMBRELLA_OID, PHONE_OID, UMBRELLA_OID]
+    assert all("type" not in doc and doc["archived"] is False for doc in docs)
+    assert len({doc["created"] for doc in docs}) == 1
+    # Only the block range check reads laf_items; nothing is read back
+    laf_items_collection.find_one.assert_awaited_once()
+    publish.assert_awaited_once_with(request, "laf_items", [40, 41, 42])
+    assert index.add.call_count == 3
+
+    assert [row["display_id"] for row in results] == ["U40", "E41", "U42"]
+    assert results[1] == {
+        "id": 41,
+        "type": "Electronics",
+        "display_id": "E41",
+        "location": "Union",
+        "date": "09/01/2024",
+        "description": "iPhone 13",
+    }
+    assert items[0]["type"] == "Umbrellas"
+
+
+def test_partial_bulk_insert_publishes_and_reports_saved_items() -> None:
+    laf_items_collection = MagicMock()
+    laf_items_collection.insert_many = AsyncMock(
+        side_effect=BulkWriteError({"nInserted": 2, "writeErrors": [{"index": 2}]})
+    )
+    request, _sequence_collection = _intake_request(laf_items_collection)
+    items = [_item("Umbrellas", f"Umbrella {i}") for i in range(3)]
+
+    with (
+        patch.object(laf_module, "laf_type_registry", _registry()),
+        patch.object(
+            laf_module.invalidation_bus, "publish", new=AsyncMock()
+        ) as publish,
+        patch.object(laf_module, "laf_items_description_index") as index,
+        pytest.raises(HTTPException) as raised,
+    ):
+        asyncio.run(laf_module.add_laf_items(request, items))
+
+    publish.assert_awaited_once_with(request, "laf_items", [40, 41])
+    assert [call.args[0] for call in index.add.call_args_list] == [40, 41]
+    assert raised.value.status_code == 500
+    assert [row["id"] for row in raised.value.detail["data"]] == [40, 41]
+
+
+def _post_items(app: FastAPI, body: list[dict]) -> httpx.Response:
+    async def _post() -> httpx.Response:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            return await client.post("/laf/items/", json=body)
+
+    return asyncio.run(_post())
+
+
+def test_bulk_intake_route_validates_batch_size() -> None:
+    app = FastAPI()
+    app.include_router(laf_router, prefix="/laf")
+    app.dependency_overrides[required_auth] = lambda: {"sub": "staff"}
+    item = {
+        "type": "Umbrellas",
+        "location": "Union",
+        "description": "Black umbrella",
+        "date": "09/01/2024",
+    }
+    added = [{"id": 7, "display_id": "U7"}]
+
+    with patch(
+        "server.routes.laf.add_laf_items", new=AsyncMock(return_value=added)
+    ) as add:
+        created = _post_items(app, [item])
+        empty = _post_items(app, [])
+        too_many = _post_items(app, [item] * (LAF_BULK_MAX_ITEMS + 1))
+
+    assert created.status_code == 200
+    assert created.json()["data"] == added
+    assert add.await_args.args[1] == [{**item, "date": "2024-09-01"}]
+    assert empty.status_code == 422
+    assert too_many.status_code == 422
+    add.assert_awaited_once()
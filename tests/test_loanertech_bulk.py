@@ -0,0 +1,104 @@
+"""Tests for all-or-none loaner tech checkout and checkin."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+from fastapi import FastAPI
+
+from server.database.loanertech import update_loanertechs
+from server.helpers.auth import required_auth
+from server.routes.loanertech import router as loanertech_router
+
+
+def _request(existing_ids: list[int]) -> tuple[MagicMock, MagicMock]:
+    collection = MagicMock()
+    collection.distinct = AsyncMock(return_value=existing_ids)
+    collection.update_many = AsyncMock()
+    request = MagicMock()
+    request.app.state.mongo_database.get_collection = MagicMock(return_value=collection)
+    return request, collection
+
+
+def test_update_loanertechs_checks_and_writes_once() -> None:
+    request, collection = _request([1, 4, 9])
+
+    outcomes = asyncio.run(
+        update_loanertechs(request, [4, 1, 9, 4], {"in_office": True})
+    )
+
+    assert outcomes == {4: "updated", 1: "updated", 9: "updated"}
+    collection.distinct.assert_awaited_once_with("_id", {"_id": {"$in": [4, 1, 9]}})
+    collection.update_many.assert_awaited_once_with(
+        {"_id": {"$in": [4, 1, 9]}}, {"$set": {"in_office": True}}
+    )
+
+
+def test_update_loanertechs_writes_nothing_when_an_id_is_unknown() -> None:
+    request, collection = _request([1])
+
+    outcomes = asyncio.run(update_loanertechs(request, [1, 2], {"in_office": True}))
+
+    assert outcomes == {1: "skipped", 2: "not_found"}
+    collection.update_many.assert_not_awaited()
+
+
+def test_update_loanertechs_without_ids_skips_the_database() -> None:
+    request, collection = _request([])
+
+    assert asyncio.run(update_loanertechs(request, [], {"in_office": True})) == {}
+    collection.distinct.assert_not_awaited()
+
+
+def _put(path: str, body: dict, outcomes: dict) -> httpx.Response:
+    app = FastAPI()
+    app.include_router(loanertech_router, prefix="/loanertech")
+    app.dependency_overrides[required_auth] = lambda: {"sub": "staff"}
+
+    async def _send() -> httpx.Response:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            return await client.put(path, json=body)
+
+    with patch(
+        "server.routes.loanertech.update_loanertechs",
+        new=AsyncMock(return_value=outcomes),
+    ) as update:
+        response = asyncio.run(_send())
+    update.assert_awaited_once()
+    return response
+
+
+def test_checkout_route_reports_every_id() -> None:
+    response = _put(
+        "/loanertech/checkout",
+        {
+            "ids": [1, 4],
+            "phone_number": "518-276-6516",
+            "email": "glump@rpi.edu",
+            "name": "Alfred Glump",
+        },
+        {1: "updated", 4: "updated"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "data": True,
+        "message": "LoanerTech checked out successfully",
+        "results": [{"id": 1, "status": "updated"}, {"id": 4, "status": "updated"}],
+    }
+
+
+def test_checkin_route_with_unknown_id_is_not_found() -> None:
+    response = _put(
+        "/loanertech/checkin", {"ids": [1, 2]}, {1: "skipped", 2: "not_found"}
+    )
+
+    assert response.status_code == 404
+    body = response.json()
+    assert body["data"] is False
+    assert body["results"] == [
+        {"id": 1, "status": "skipped"},
+        {"id": 2, "status": "not_found"},
+    ]
@@ -0,0 +1,182 @@
+"""Tests for the process-local loaner tech inventory snapshot."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from server.database import loanertech as loanertech_module
+from server.database.loanertech import LoanerTechInventory
+from server.helpers.auth import simple_auth_check
+from server.routes.loanertech import router as loanertech_router
+
+LOANERTECHS = [
+    {
+        "_id": 1,
+        "in_office": True,
+        "description": "Dell charger",
+        "phone": "",
+        "email": "",
+        "name": "",
+    },
+    {
+        "_id": 2,
+        "in_office": False,
+        "description": "Apple 96 watt USB C charger",
+        "phone": "518-276-6516",
+        "email": None,
+        "name": "Alfred Glump",
+    },
+]
+
+
+class _InventoryCollection:
+    def __init__(self, docs: list[dict]) -> None:
+        self.docs = docs
+        self.finds = 0
+        self.on_find = None
+
+    def find(self) -> "_InventoryCollection":
+        self.finds += 1
+        return self
+
+    def sort(self, key: str) -> "_InventoryCollection":
+        return self
+
+    async def to_list(self, length=None) -> list[dict]:
+        await asyncio.sleep(0)
+        if self.on_find is not None:
+            self.on_find()
+        return [dict(doc) for doc in self.docs]
+
+
+def test_snapshot_is_reused_until_invalidated() -> None:
+    inventory = LoanerTechInventory()
+    collection = _InventoryCollection(LOANERTECHS)
+
+    async def _run() -> None:
+        first = await inventory.snapshot(collection)
+        assert await inventory.snapshot(collection) is first
+        assert [item["id"] for item in first.public_items] == [1, 2]
+        assert "name" not in first.public_items[1]
+        assert first.items[1]["name"] == "Alfred Glump"
+
+        collection.docs = LOANERTECHS[:1]
+        inventory.invalidate()
+        second = await inventory.snapshot(collection)
+        assert second is not first and len(second.items) == 1
+
+    asyncio.run(_run())
+    assert collection.finds == 2
+
+
+def test_snapshot_is_rebuilt_after_max_age(monkeypatch) -> None:
+    clock = [10.0]
+    monkeypatch.setattr(loanertech_module, "monotonic", lambda: clock[0])
+    inventory = LoanerTechInventory(max_age=300)
+    collection = _InventoryCollection(LOANERTECHS)
+
+    async def _run() -> None:
+        first = await inventory.snapshot(collection)
+        clock[0] = 310.0
+        assert await inventory.snapshot(collection) is first
+        clock[0] = 311.0
+        assert await inventory.snapshot(collection) is not first
+
+    asyncio.run(_run())
+    assert collection.finds == 2
+
+
+def test_concurrent_misses_share_one_rebuild() -> None:
+    inventory = LoanerTechInventory()
+    collection = _InventoryCollection(LOANERTECHS)
+
+    async def _run() -> list:
+        return await asyncio.gather(
+            *(inventory.snapshot(collection) for _ in range(20))
+        )
+
+    snapshots = asyncio.run(_run())
+    assert collection.finds == 1
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+
+
+def test_write_during_rebuild_leaves_snapshot_stale() -> None:
+    inventory = LoanerTechInventory()
+    collection = _InventoryCollection(LOANERTECHS)
+    collection.on_find = inventory.invalidate
+
+    async def _run() -> None:
+        await inventory.snapshot(collection)
+        collection.on_find = None
+        await inventory.snapshot(collection)
+
+    asyncio.run(_run())
+    assert collection.finds == 2
+
+
+def test_writes_publish_loanertech_invalidation() -> None:
+    collection = MagicMock()
+    collection.find_one_and_update = AsyncMock(return_value={"_id": 1})
+    collection.find_one_and_delete = AsyncMock(return_value=None)
+    request = MagicMock()
+    request.app.state.mongo_database.get_collection = MagicMock(return_value=collection)
+
+    async def _run() -> tuple[bool, bool]:
+        return (
+            await loanertech_module.update_loanertech(request, 1, {"in_office": True}),
+            await loanertech_module.delete_loanertech(request, 9),
+        )
+
+    with patch.object(
+        loanertech_module.invalidation_bus, "publish", new=AsyncMock()
+    ) as publish:
+        assert asyncio.run(_run()) == (True, False)
+    # The delete matched nothing, so only the update invalidates
+    publish.assert_awaited_once_with(request, "loanertech")
+
+
+def _get(authenticated: bool, headers: dict | None = None) -> httpx.Response:
+    app = FastAPI()
+    app.include_router(loanertech_router, prefix="/loanertech")
+    app.dependency_overrides[simple_auth_check] = lambda: (authenticated, "", None)
+    app.state.mongo_database = MagicMock()
+    app.state.mongo_database.get_collection = MagicMock(
+        return_value=_InventoryCollection(LOANERTECHS)
+    )
+
+    async def _send() -> httpx.Response:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            return await client.get("/loanertech/", headers=headers)
+
+    with patch.object(loanertech_module, "loanertech_inventory", LoanerTechInventory()):
+        return asyncio.run(_send())
+
+
+def test_inventory_route_bodies_match_previous_encoding() -> None:
+    for authenticated, helper in (
+        (False, loanertech_module.loanertech_helper_unprotected),
+        (True, loanertech_module.loanertech_helper),
+    ):
+        response = _get(authenticated)
+        expected = JSONResponse(
+            {
+                "data": [helper(doc) for doc in LOANERTECHS],
+                "message": "LoanerTech data retrieved successfully",
+            }
+        )
+        assert response.status_code == 200
+        assert response.content == expected.body
+
+
+def test_inventory_route_revalidates_public_view_only() -> None:
+    public = _get(False)
+    assert _get(False, {"If-None-Match": public.headers["etag"]}).status_code == 304
+
+    private = _get(True)
+    assert "etag" not in private.headers
+    assert private.headers["cache-control"] == "private, no-store"
@@ -0,0 +1,66 @@
+"""Unit tests for server.helpers.pagination."""
+
+from base64 import urlsafe_b64encode
+
+import pytest
+from bson import ObjectId
+
+from server.helpers.pagination import (
+    after_cursor,
+    decode_cursor,
+    encode_cursor,
+    split_page,
+)
+
+
+@pytest.mark.parametrize(
+    "_id",
+    [
+        pytest.param(42, id="laf_item_id"),
+        pytest.param(ObjectId("674000000000000000000010"), id="lost_report_id"),
+    ],
+)
+def test_cursor_round_trips_sort_key(_id: int | ObjectId) -> None:
+    cursor = encode_cursor({"_id": _id, "date": "2024-05-01", "description": "x"})
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == ("2024-05-01", _id)
+    assert after_cursor(cursor) == {
+        "$or": [
+            {"date": {"$lt": "2024-05-01"}},
+            {"date": "2024-05-01", "_id": {"$lt": _id}},
+        ]
+    }
+
+
+def _raw_cursor(text: str) -> str:
+    return urlsafe_b64encode(text.encode()).decode()
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        pytest.param("", id="empty"),
+        pytest.param("not base64!", id="not_base64"),
+        pytest.param(_raw_cursor("{not json"), id="not_json"),
+        pytest.param(_raw_cursor('{"date": "2024-05-01"}'), id="not_a_pair"),
+        pytest.param(_raw_cursor('["2024-05-01", 1, 2]'), id="too_long"),
+        pytest.param(_raw_cursor("[20240501, 1]"), id="date_not_string"),
+        pytest.param(_raw_cursor('["2024-05-01", true]'), id="bool_id"),
+        pytest.param(_raw_cursor('["2024-05-01", {"$ne": null}]'), id="operator_id"),
+    ],
+)
+def test_decode_cursor_rejects_foreign_input(cursor: str) -> None:
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_split_page_cursor_points_at_last_row_kept() -> None:
+    docs = [{"_id": i, "date": f"2024-05-0{9 - i}"} for i in range(4)]
+
+    page, next_cursor = split_page(docs, 3)
+    assert page == docs[:3]
+    assert decode_cursor(next_cursor) == ("2024-05-07", 2)
+
+    assert split_page(docs, 4) == (docs, None)
+    assert split_page([], 30) == ([], None)
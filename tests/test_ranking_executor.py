@@ -0,0 +1,86 @@
+"""Unit tests for server.helpers.ranking_executor."""
+
+import asyncio
+
+import pytest
+
+from server.helpers.description_search import (
+    compact_candidates,
+    normalize_search_text,
+    rank_by_description,
+    rank_cursor_by_description,
+    search_fields,
+    top_candidates,
+)
+from server.helpers.ranking_executor import RankingExecutor
+from tests.helpers import AsyncItems
+
+WORDS = ["black", "wool", "hat", "airpods", "case", "water", "bottle", "blue"]
+
+
+def _items(count: int) -> list[dict]:
+    return [
+        {
+            "_id": i,
+            "description": " ".join(
+                WORDS[(i * 3 + j) % len(WORDS)] for j in range(i % 4 + 1)
+            ),
+            "date": f"2024-0{i % 3 + 1}-01",
+            "location": "Union",
+        }
+        for i in range(count)
+    ]
+
+
+def test_unknown_backend_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown ranking backend"):
+        RankingExecutor("gpu")
+
+
+def test_compact_candidates_prefers_stored_normalized_text() -> None:
+    items = [
+        {"_id": 1, "date": "2024-01-01", "description": "Black Hat!"},
+        {"_id": 2, "date": "2024-01-02", **search_fields("Blue Case")},
+        {"_id": 3},
+    ]
+    assert compact_candidates(items) == [
+        (1, "2024-01-01", "Black Hat!"),
+        (2, "2024-01-02", "blue case"),
+        (3, "", ""),
+    ]
+
+
+def test_top_candidates_returns_ids_in_candidate_order() -> None:
+    items = _items(60)
+    ranked = top_candidates(
+        compact_candidates(items), normalize_search_text("black wool hat"), k=5
+    )
+    assert len(ranked) == 5
+    assert [doc_id for doc_id, _ in ranked] == sorted(doc_id for doc_id, _ in ranked)
+    expected = rank_by_description(items, "black wool hat")[:5]
+    assert {doc_id for doc_id, _ in ranked} == {item["_id"] for item in expected}
+
+
+@pytest.mark.parametrize("backend", ["inline", "thread", "process"])
+def test_backends_match_rank_by_description(backend: str) -> None:
+    items = _items(250)
+    executor = RankingExecutor(backend, max_workers=1)
+
+    async def _run() -> tuple[list[dict], list[dict]]:
+        ranked = await executor.rank(items, "black wool hat")
+        streamed = await rank_cursor_by_description(
+            AsyncItems(items), "airpods case", chunk_size=40, executor=executor
+        )
+        return ranked, streamed
+
+    try:
+        ranked, streamed = asyncio.run(_run())
+    finally:
+        executor.shutdown()
+    assert ranked == rank_by_description(items, "black wool hat")
+    assert streamed == rank_by_description(items, "airpods case")
+
+
+def test_blank_query_returns_input() -> None:
+    items = _items(3)
+    assert asyncio.run(RankingExecutor("inline").rank(items, " ")) == items
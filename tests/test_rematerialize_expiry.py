@@ -0,0 +1,50 @@
+"""Unit tests for server.scripts.rematerialize_expiry."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from bson import ObjectId
+
+from server.helpers.expiry import expiry_fields
+from server.scripts import rematerialize_expiry as rematerialize_module
+from tests.helpers import AsyncItems
+
+WATER_BOTTLE_OID = ObjectId("674000000000000000000051")
+
+
+def test_rematerialize_query_targets_missing_fields_unless_recomputing_all() -> None:
+    assert rematerialize_module.rematerialize_query(recompute_all=True) == {}
+    missing = rematerialize_module.rematerialize_query(recompute_all=False)
+    assert {"expires_at": {"$exists": False}} in missing["$or"]
+
+
+def test_rematerialize_update_uses_type_schedule() -> None:
+    type_names = {WATER_BOTTLE_OID: "Water Bottle"}
+
+    bottle = rematerialize_module.rematerialize_update(
+        {"_id": 1, "date": "2024-09-01", "type_id": WATER_BOTTLE_OID}, type_names
+    )
+    orphan = rematerialize_module.rematerialize_update(
+        {"_id": 2, "date": "2024-09-01", "type_id": ObjectId()}, type_names
+    )
+
+    assert bottle._doc == {"$set": expiry_fields("2024-09-01", "Water Bottle")}
+    assert orphan._doc == {"$set": expiry_fields("2024-09-01", "")}
+
+
+def test_rematerialize_collection_writes_in_batches(monkeypatch) -> None:
+    monkeypatch.setattr(rematerialize_module, "REMATERIALIZE_BATCH_SIZE", 2)
+    docs = [{"_id": i, "date": "2024-09-01", "type_id": None} for i in range(5)]
+    collection = MagicMock()
+    collection.find = MagicMock(return_value=AsyncItems(docs))
+    collection.bulk_write = AsyncMock(
+        side_effect=lambda ops, ordered: MagicMock(modified_count=len(ops))
+    )
+
+    updated = asyncio.run(
+        rematerialize_module.rematerialize_collection(collection, {}, True)
+    )
+
+    assert updated == 5
+    assert [len(c.args[0]) for c in collection.bulk_write.call_args_list] == [2, 2, 1]
+    assert collection.find.call_args.args[0] == {}
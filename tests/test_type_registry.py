@@ -0,0 +1,88 @@
+"""Unit tests for server.helpers.type_registry."""
+
+import pytest
+from bson import ObjectId
+
+from server.helpers import type_registry as type_registry_module
+from server.helpers.type_registry import LAFTypeRegistry
+
+HAT_ID = ObjectId("674000000000000000000001")
+KEYS_ID = ObjectId("674000000000000000000002")
+HIDDEN_ID = ObjectId("674000000000000000000003")
+
+LAF_TYPES = [
+    {"_id": HAT_ID, "type": "Hats &amp; Caps", "letter": "H", "view": True},
+    {"_id": KEYS_ID, "type": "Keys", "letter": "K", "view": True},
+    {"_id": HIDDEN_ID, "type": "Other", "letter": "O", "view": False},
+]
+
+
+def _loaded_registry() -> LAFTypeRegistry:
+    registry = LAFTypeRegistry()
+    registry.load(LAF_TYPES)
+    return registry
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        pytest.param("Keys", KEYS_ID, id="exact"),
+        pytest.param("Hats &amp; Caps", HAT_ID, id="exact_escaped"),
+        pytest.param("hats & caps", HAT_ID, id="unescaped_casefolded"),
+        pytest.param("KEYS", KEYS_ID, id="casefolded"),
+        pytest.param("Umbrellas", None, id="unknown"),
+    ],
+)
+def test_id_for_resolves_exact_then_normalized(name: str, expected) -> None:
+    assert _loaded_registry().id_for(name) == expected
+
+
+def test_get_returns_unescaped_type_document() -> None:
+    registry = _loaded_registry()
+    assert registry.get(HAT_ID)["type"] == "Hats & Caps"
+    assert registry.get(ObjectId()) is None
+    assert LAF_TYPES[0]["type"] == "Hats &amp; Caps"
+
+
+def test_viewable_lists_visible_types() -> None:
+    assert _loaded_registry().viewable() == ["Hats & Caps", "Keys"]
+
+
+def test_load_replaces_contents_and_keeps_misses() -> None:
+    registry = _loaded_registry()
+    registry.record_miss("Umbrellas")
+    registry.load(LAF_TYPES[1:])
+    assert registry.get(HAT_ID) is None
+    assert registry.recently_missed("umbrellas")
+
+
+def test_misses_expire(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [10.0]
+    monkeypatch.setattr(type_registry_module, "monotonic", lambda: clock[0])
+    registry = LAFTypeRegistry(miss_ttl=5)
+    registry.record_miss("Umbrellas")
+    assert registry.recently_missed("UMBRELLAS")
+    clock[0] = 15.0
+    assert not registry.recently_missed("Umbrellas")
+
+
+def test_snapshot_expires_after_max_age(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [10.0]
+    monkeypatch.setattr(type_registry_module, "monotonic", lambda: clock[0])
+    registry = LAFTypeRegistry(max_age=300)
+    assert not registry.expired()
+    registry.load(LAF_TYPES)
+    clock[0] = 310.0
+    assert not registry.expired()
+    clock[0] = 311.0
+    assert registry.expired()
+    registry.load(LAF_TYPES)
+    assert not registry.expired()
+
+
+def test_misses_are_bounded() -> None:
+    registry = LAFTypeRegistry(max_misses=3)
+    for name in ("a", "b", "c", "d"):
+        registry.record_miss(name)
+    assert len(registry._misses) <= 3
+    assert registry.recently_missed("d")
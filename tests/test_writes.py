@@ -0,0 +1,216 @@
+"""Mutating LAF and loaner tech helpers take exactly one Mongo round trip."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from bson import ObjectId
+
+from server.database import laf as laf_module
+from server.database import loanertech as loanertech_module
+from server.helpers.db import delete_by_id, update_by_id
+from server.helpers.type_registry import LAFTypeRegistry
+
+UMBRELLA_OID = ObjectId("674000000000000000000031")
+REPORT_OID = ObjectId("674000000000000000000032")
+
+
+class _RoundTripCollection:
+    """Records every awaited collection call; each one is a Mongo round trip."""
+
+    def __init__(self, exists: bool = True) -> None:
+        self.exists = exists
+        self.calls: list[tuple[str, tuple, dict]] = []
+
+    def _record(self, name: str, args: tuple, kwargs: dict) -> None:
+        self.calls.append((name, args, kwargs))
+
+    async def insert_one(self, document, *args, **kwargs):
+        self._record("insert_one", (document, *args), kwargs)
+        return MagicMock(inserted_id=document.get("_id", REPORT_OID))
+
+    async def find_one(self, *args, **kwargs):
+        self._record("find_one", args, kwargs)
+        return {"_id": args[0]["_id"]} if self.exists else None
+
+    async def find_one_and_update(self, *args, **kwargs):
+        self._record("find_one_and_update", args, kwargs)
+        return {"_id": args[0]["_id"]} if self.exists else None
+
+    async def find_one_and_delete(self, *args, **kwargs):
+        self._record("find_one_and_delete", args, kwargs)
+        return {"_id": args[0]["_id"]} if self.exists else None
+
+
+def _registry() -> LAFTypeRegistry:
+    registry = LAFTypeRegistry()
+    registry.load([{"_id": UMBRELLA_OID, "type": "Umbrellas", "letter": "U"}])
+    return registry
+
+
+def _request(collection: _RoundTripCollection) -> MagicMock:
+    request = MagicMock()
+    request.app.state.mongo_database.get_collection = MagicMock(return_value=collection)
+    return request
+
+
+def _laf_item() -> dict:
+    return {
+        "type": "Umbrellas",
+        "location": "Union",
+        "description": "Black umbrella",
+        "date": "2024-09-01",
+    }
+
+
+def _lost_report() -> dict:
+    return {
+        **_laf_item(),
+        "name": "Alfred Glump",
+        "email": "glump@rpi.edu",
+        "location": ["Union"],
+    }
+
+
+NOW = datetime(2024, 9, 2)
+WRITES = [
+    pytest.param(
+        lambda request: laf_module.add_laf(request, _laf_item()),
+        "insert_one",
+        id="add_laf",
+    ),
+    pytest.param(
+        lambda request: laf_module.add_lost_report(request, _lost_report(), True),
+        "insert_one",
+        id="add_lost_report",
+    ),
+    pytest.param(
+        lambda request: loanertech_module.add_loanertech(
+            request, {"description": "Dell charger"}
+        ),
+        "insert_one",
+        id="add_loanertech",
+    ),
+    pytest.param(
+        lambda request: laf_module.add_laf_location(request, "Union"),
+        "insert_one",
+        id="add_laf_location",
+    ),
+    pytest.param(
+        lambda request: laf_module.add_laf_type(request, "Keys"),
+        "insert_one",
+        id="add_laf_type",
+    ),
+    pytest.param(
+        lambda request: laf_module.update_laf(
+            request, 7, {"description": "Red umbrella", "type": "Umbrellas"}, NOW
+        ),
+        "find_one_and_update",
+        id="update_laf",
+    ),
+    pytest.param(
+        lambda request: laf_module.update_lost_report(
+            request, str(REPORT_OID), {"description": "Red umbrella"}, NOW
+        ),
+        "find_one_and_update",
+        id="update_lost_report",
+    ),
+    pytest.param(
+        lambda request: loanertech_module.update_loanertech(
+            request, 7, {"in_office": False}
+        ),
+        "find_one_and_update",
+        id="update_loanertech",
+    ),
+    pytest.param(
+        lambda request: loanertech_module.delete_loanertech(request, 7),
+        "find_one_and_delete",
+        id="delete_loanertech",
+    ),
+]
+
+
+def _run_write(write, collection: _RoundTripCollection):
+    allocator = MagicMock()
+    allocator.next = AsyncMock(return_value=7)
+    with (
+        patch.object(laf_module, "laf_type_registry", _registry()),
+        patch.object(laf_module, "sequence_allocator", allocator),
+        patch.object(loanertech_module, "sequence_allocator", allocator),
+        patch.object(laf_module.invalidation_bus, "publish", new=AsyncMock()),
+        patch.object(laf_module, "invalidate_laf_locations", new=AsyncMock()),
+        patch.object(laf_module, "laf_items_description_index"),
+        patch.object(laf_module, "lost_reports_description_index"),
+    ):
+        return asyncio.run(write(_request(collection)))
+
+
+@pytest.mark.parametrize(("write", "operation"), WRITES)
+def test_write_takes_one_round_trip(write, operation: str) -> None:
+    collection = _RoundTripCollection()
+
+    result = _run_write(write, collection)
+
+    assert [name for name, _args, _kwargs in collection.calls] == [operation]
+    assert result
+
+
+@pytest.mark.parametrize(
+    ("write", "operation"),
+    [param for param in WRITES if param.id.startswith(("update_", "delete_"))],
+)
+def test_write_to_missing_document_reports_false(write, operation: str) -> None:
+    collection = _RoundTripCollection(exists=False)
+
+    assert _run_write(write, collection) is False
+    assert len(collection.calls) == 1
+
+
+def test_inserts_format_response_from_written_document() -> None:
+    collection = _RoundTripCollection()
+
+    laf_item = _run_write(
+        lambda request: laf_module.add_laf(request, _laf_item()), collection
+    )
+    lost_report = _run_write(
+        lambda request: laf_module.add_lost_report(request, _lost_report(), False),
+        collection,
+    )
+
+    assert laf_item == {
+        "id": 7,
+        "type": "Umbrellas",
+        "display_id": "U7",
+        "location": "Union",
+        "date": "09/01/2024",
+        "description": "Black umbrella",
+    }
+    assert lost_report["id"] == str(REPORT_OID)
+    assert lost_report["found"] is False and lost_report["type"] == "Umbrellas"
+
+
+def test_add_laf_type_succeeds_when_registry_reload_fails() -> None:
+    collection = _RoundTripCollection()
+    registry = MagicMock()
+    registry.reload = AsyncMock(side_effect=ConnectionError("reload failed"))
+    request = _request(collection)
+
+    with patch.object(laf_module, "laf_type_registry", registry):
+        assert asyncio.run(laf_module.add_laf_type(request, "Keys")) is True
+    registry.reload.assert_awaited_once()
+
+
+def test_update_and_delete_by_id_project_only_the_id() -> None:
+    collection = _RoundTripCollection()
+
+    assert asyncio.run(update_by_id(collection, 3, {"in_office": True}))
+    assert asyncio.run(delete_by_id(collection, 3))
+    assert collection.calls == [
+        (
+            "find_one_and_update",
+            ({"_id": 3}, {"$set": {"in_office": True}}),
+            {"projection": {"_id": 1}},
+        ),
+        ("find_one_and_delete", ({"_id": 3},), {"projection": {"_id": 1}}),
+    ]